@@ -4,14 +4,18 @@ Handles welcome screen, ASCII art, and animations with professional styling
 """
 
 import time
-import sys
-from rich.console import Console
-from rich.text import Text
-from rich.panel import Panel
-from rich.align import Align
-from rich import print as rprint
 
-console = Console()
+# Created on first use so importing the banner doesn't pull in rich
+_console = None
+
+
+def get_console():
+    """Return the shared rich console, creating it on first use"""
+    global _console
+    if _console is None:
+        from rich.console import Console
+        _console = Console()
+    return _console
 
 SHNK_TERMINAL_ASCII = """
 ███████╗██╗  ██╗███╗   ██╗██╗  ██╗
@@ -28,6 +32,11 @@ SECTION_DIVIDER = "═" * 50
 
 def display_banner():
     """Display the main SHNK banner with professional styling"""
+    from rich.align import Align
+    from rich.panel import Panel
+    from rich.text import Text
+
+    console = get_console()
     console.clear()
     
     # Clean, professional ASCII art
@@ -56,6 +65,7 @@ def display_banner():
 
 def animate_welcome():
     """Simple, professional loading sequence"""
+    console = get_console()
     messages = [
         "Initializing SHNK...",
         "Loading development tools...",
@@ -69,24 +79,6 @@ def animate_welcome():
     console.print("\n[bold green]Ready for development[/bold green]")
     time.sleep(0.5)
 
-def display_loading_bar(task_name: str, duration: float = 2.0):
-    """Display a clean progress indicator"""
-    from rich.progress import Progress, BarColumn, TextColumn, TimeRemainingColumn
-    
-    with Progress(
-        TextColumn("[blue]{task.description}"),
-        BarColumn(bar_width=30, style="blue", complete_style="bright_blue"),
-        "[progress.percentage]{task.percentage:>3.0f}%",
-        console=console,
-        transient=True
-    ) as progress:
-        
-        task = progress.add_task(task_name, total=100)
-        
-        while not progress.finished:
-            progress.update(task, advance=2)
-            time.sleep(duration / 50)
-
 def display_section_divider(text: str = ""):
     """Display a clean section divider"""
     if text:
@@ -94,10 +86,13 @@ def display_section_divider(text: str = ""):
     else:
         divider = CLEAN_DIVIDER
     
-    console.print(f"[dim blue]{divider}[/dim blue]")
+    get_console().print(f"[dim blue]{divider}[/dim blue]")
 
 def display_welcome_message():
     """Display a professional welcome message"""
+    from rich.panel import Panel
+
+    console = get_console()
     welcome_panel = Panel(
         "[bold blue]Welcome to SHNK[/bold blue]\n\n"
         "[white]Streamline your development workflow with professional tooling.\n"
@@ -0,0 +1 @@
+"""Micro-benchmarks for SHNK internals (run each module with ``python -m``)"""
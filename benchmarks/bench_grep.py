@@ -0,0 +1,183 @@
+# benchmarks/bench_grep.py
+"""
+Terminal ``grep`` benchmark on a synthetic multi-project workspace.
+
+    python -m benchmarks.bench_grep [--projects N] [--files N] [--lines N] [--jobs N] [--pattern P] [--json]
+
+Generates ``--projects`` projects shaped like the scaffolded ones: ``--files``
+source files of ``--lines`` lines each (about 1% of them TODO/FIXME notes),
+a minified bundle, some binary assets and a node_modules tree that the
+default ignore rules skip. Then searches it for ``--pattern``:
+
+  naive    os.walk into everything, read and decode every file, re per line
+  serial   mmap and one compiled regex per file, in this process
+  pool     the same spread over ``--jobs`` worker processes (default: all CPUs)
+  command  the terminal's grep end to end, printing to a null console
+
+Checks that serial and pool find the same lines in the same order, and that
+on one project they match a line-by-line search for ``--pattern`` and for
+patterns that could run across line ends (``CROSS_LINE_PATTERNS``). The pool
+only pays off with more than one CPU and enough files to keep it busy.
+"""
+
+import argparse
+import json
+import os
+import random
+import re
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from rich.console import Console
+
+from terminal.fs_commands import FileSystemCommands
+from terminal.ignore import IgnoreRules
+from terminal.sandbox import TerminalSandbox
+from terminal.search import compile_search, iter_files, search_files
+from terminal.viewer import SNIFF_BYTES, looks_binary
+
+DEFAULT_PROJECTS = 8
+DEFAULT_FILES = 400
+DEFAULT_LINES = 200
+DEFAULT_PATTERN = r"TODO|FIXME"
+# Each can match a newline when run over a whole file at once
+CROSS_LINE_PATTERNS = [r"\s+", r"[^x]*", r"\n", r"\}\s*export", r";\s+const", r"\)\s*$"]
+
+CODE_LINES = [
+    "import React, { useState, useEffect } from 'react';",
+    "export default function Component({ items, onSelect }) {",
+    "  const [value, setValue] = useState(null);",
+    "  useEffect(() => { setValue(items[0]); }, [items]);",
+    "  return <div className=\"flex items-center gap-2\">{value}</div>;",
+    "}",
+    "",
+]
+
+
+def build_workspace(root: Path, projects: int, files: int, lines: int) -> None:
+    rng = random.Random(42)
+    for p in range(projects):
+        project = root / f"project-{p}"
+        for i in range(files):
+            directory = project / "src" / f"module-{i % 16}"
+            directory.mkdir(parents=True, exist_ok=True)
+            body = [f"// TODO: handle edge case {i}" if rng.random() < 0.01 else rng.choice(CODE_LINES)
+                    for _ in range(lines)]
+            (directory / f"file-{i}.jsx").write_text("\n".join(body) + "\n")
+        dist = project / "dist"
+        dist.mkdir()
+        (dist / "bundle.min.js").write_text(";".join(CODE_LINES) * 2000 + "/* FIXME */\n")
+        assets = project / "public"
+        assets.mkdir()
+        for i in range(8):
+            (assets / f"image-{i}.png").write_bytes(b"\x89PNG\r\n\x1a\n\0" + rng.randbytes(32 * 1024))
+        modules = project / "node_modules" / "dep" / "lib"
+        modules.mkdir(parents=True)
+        for i in range(files // 4):
+            (modules / f"dep-{i}.js").write_text("// TODO vendored\n" * lines)
+
+
+def naive_search(root: Path, pattern: str) -> int:
+    regex = re.compile(pattern)
+    found = 0
+    for directory, _, names in os.walk(root):
+        for name in names:
+            try:
+                text = (Path(directory) / name).read_text(encoding="utf-8")
+            except (OSError, UnicodeDecodeError):
+                continue
+            found += sum(1 for line in text.splitlines() if regex.search(line))
+    return found
+
+
+def pooled_search(root: Path, pattern: str, jobs: int) -> list:
+    files = iter_files(str(root), IgnoreRules.for_walk(root), lambda path: True)
+    return [(path, [match[0] for match in matches])
+            for _, _, _, found in search_files(files, (pattern, False, False, False), jobs=jobs)
+            for path, matches in found]
+
+
+def line_search(root: Path, pattern: str) -> list:
+    """The reference: every file split into lines, each searched on its own"""
+    regex = compile_search(pattern)
+    results = []
+    for path in iter_files(str(root), IgnoreRules.for_walk(root), lambda path: True):
+        data = Path(path).read_bytes()
+        if not data or looks_binary(data[:SNIFF_BYTES]):
+            continue
+        lines = data.split(b"\n")
+        if data.endswith(b"\n"):
+            lines.pop()
+        numbers = [number for number, line in enumerate(lines, 1) if regex.search(line)]
+        if numbers:
+            results.append((path, numbers))
+    return results
+
+
+def per_line_mismatches(root: Path, patterns: list) -> list:
+    """Patterns whose results differ from the line-by-line reference"""
+    return [pattern for pattern in patterns if pooled_search(root, pattern, 1) != line_search(root, pattern)]
+
+
+def _timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return round(time.perf_counter() - start, 3), result
+
+
+def run(projects: int, files: int, lines: int, jobs: int, pattern: str) -> dict:
+    with tempfile.TemporaryDirectory(prefix="shnk-bench-") as tmp, open(os.devnull, "w") as null:
+        root = Path(tmp).resolve()
+        build_workspace(root, projects, files, lines)
+        fs = FileSystemCommands(TerminalSandbox(root))
+        fs.console = Console(file=null, width=120)
+
+        naive_s, naive_lines = _timed(lambda: naive_search(root, pattern))
+        serial_s, serial = _timed(lambda: pooled_search(root, pattern, 1))
+        pool_s, pooled = _timed(lambda: pooled_search(root, pattern, jobs))
+        command_s, _ = _timed(lambda: fs.search(pattern, jobs=jobs))
+        mismatched = per_line_mismatches(root / "project-0", [pattern] + CROSS_LINE_PATTERNS)
+
+    return {
+        "projects": projects,
+        "files": projects * files,
+        "jobs": jobs,
+        "pattern": pattern,
+        "matching_lines": sum(len(numbers) for _, numbers in serial),
+        "naive_matching_lines": naive_lines,
+        "results": {"naive": naive_s, "serial": serial_s, "pool": pool_s, "command": command_s},
+        "same_results": serial == pooled,
+        "per_line_mismatches": mismatched,
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="bench_grep", description=__doc__.splitlines()[1])
+    parser.add_argument("--projects", type=int, default=DEFAULT_PROJECTS)
+    parser.add_argument("--files", type=int, default=DEFAULT_FILES, help="Source files per project")
+    parser.add_argument("--lines", type=int, default=DEFAULT_LINES, help="Lines per source file")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--pattern", default=DEFAULT_PATTERN)
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args(argv)
+
+    result = run(args.projects, args.files, args.lines, args.jobs, args.pattern)
+    if args.json:
+        print(json.dumps(result, indent=2))
+    else:
+        print(f"{result['projects']} projects, {result['files']:,} source files, --jobs {result['jobs']}, "
+              f"/{result['pattern']}/: {result['matching_lines']:,} lines "
+              f"(naive, node_modules and bundles included: {result['naive_matching_lines']:,})")
+        print(f"{'mode':<10}{'seconds':>10}")
+        for mode, seconds in result["results"].items():
+            print(f"{mode:<10}{seconds:>10.3f}")
+        print(f"serial and pool agree: {'yes' if result['same_results'] else 'NO'}")
+        mismatched = result["per_line_mismatches"]
+        print(f"line-by-line search agrees: {'yes' if not mismatched else 'NO: ' + ', '.join(mismatched)}")
+    return 0 if result["same_results"] and not result["per_line_mismatches"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
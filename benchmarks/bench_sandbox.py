@@ -0,0 +1,118 @@
+# benchmarks/bench_sandbox.py
+"""
+Terminal sandbox path resolution benchmark.
+
+    python -m benchmarks.bench_sandbox [--depth N] [--paths N] [--iterations N] [--json]
+
+Builds a workspace nested ``--depth`` directories deep and resolves a mix of
+typed paths (relative, ``..``-laden, through a symlink) from its deepest
+directory, as the terminal does on every command:
+
+  uncached  Path.resolve() and the containment check on every call
+  cached    the sandbox's LRU of (current directory, typed path), valid
+            while the workspace root's mtime is unchanged (one stat per hit)
+
+Also checks that a sibling such as ``workspace-evil`` is refused.
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from terminal.sandbox import TerminalSandbox
+
+DEFAULT_DEPTH = 24
+DEFAULT_PATHS = 64
+DEFAULT_ITERATIONS = 200
+
+
+def build_workspace(root: Path, depth: int) -> Path:
+    """A workspace with one ``depth``-deep chain of directories; returns the deepest"""
+    workspace = root / "workspace"
+    deepest = workspace.joinpath(*(f"d{level}" for level in range(depth)))
+    deepest.mkdir(parents=True)
+    (deepest / "file.txt").write_text("x")
+    (workspace / "shortcut").symlink_to(deepest, target_is_directory=True)
+    (root / "workspace-evil").mkdir()
+    return deepest
+
+
+def typed_paths(depth: int, count: int):
+    """Paths a user would type from the deepest directory"""
+    paths = []
+    for i in range(count):
+        up = i % depth
+        kind = i % 4
+        if kind == 0:
+            paths.append("file.txt")
+        elif kind == 1:
+            paths.append("/".join([".."] * up) or ".")
+        elif kind == 2:
+            paths.append("/".join([".."] * depth + ["shortcut", "file.txt"]))
+        else:
+            paths.append("/".join([".."] * up + [f"new-{i}"]))
+    return paths
+
+
+def _per_call_us(sandbox: TerminalSandbox, paths, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        for path in paths:
+            sandbox.sanitize_path(path)
+    return (time.perf_counter() - start) / (iterations * len(paths)) * 1e6
+
+
+def run(depth: int, count: int, iterations: int) -> dict:
+    with tempfile.TemporaryDirectory(prefix="shnk-bench-") as tmp:
+        root = Path(tmp).resolve()
+        deepest = build_workspace(root, depth)
+        paths = typed_paths(depth, count)
+
+        results = {}
+        for label, cache_size in (("uncached", 0), ("cached", count * 2)):
+            sandbox = TerminalSandbox(root / "workspace", cache_size=cache_size)
+            sandbox.set_current_path(deepest)
+            results[label] = _per_call_us(sandbox, paths, iterations)
+
+        sandbox = TerminalSandbox(root / "workspace")
+        try:
+            sandbox.sanitize_path("../workspace-evil")
+            sibling_refused = False
+        except ValueError:
+            sibling_refused = True
+
+    return {
+        "depth": depth,
+        "paths": count,
+        "iterations": iterations,
+        "uncached_us": round(results["uncached"], 3),
+        "cached_us": round(results["cached"], 3),
+        "speedup": round(results["uncached"] / results["cached"], 1) if results["cached"] else None,
+        "sibling_refused": sibling_refused,
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="bench_sandbox", description=__doc__.splitlines()[1])
+    parser.add_argument("--depth", type=int, default=DEFAULT_DEPTH)
+    parser.add_argument("--paths", type=int, default=DEFAULT_PATHS)
+    parser.add_argument("--iterations", type=int, default=DEFAULT_ITERATIONS)
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args(argv)
+
+    result = run(args.depth, args.paths, args.iterations)
+    if args.json:
+        print(json.dumps(result, indent=2))
+    else:
+        print(f"depth {result['depth']}, {result['paths']} paths x {result['iterations']} iterations")
+        print(f"{'uncached':<10}{result['uncached_us']:>10.3f} us/call")
+        print(f"{'cached':<10}{result['cached_us']:>10.3f} us/call  ({result['speedup']}x)")
+        print(f"sibling directory refused: {'yes' if result['sibling_refused'] else 'NO'}")
+    return 0 if result["sibling_refused"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
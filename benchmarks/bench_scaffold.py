@@ -0,0 +1,225 @@
+# benchmarks/bench_scaffold.py
+"""
+End-to-end scaffold benchmark against the stub toolchain.
+
+    python -m benchmarks.bench_scaffold [--iterations N] [--pm npm]
+        [--delays create=0.3,install=1] [--packages 200]
+        [--out results.json] [--compare baseline.json] [--max-regression PCT]
+
+Puts the stub ``npm``/``npx``/``code`` (see fixtures/stub_toolchain.py)
+first on PATH, so it runs fully offline. The stubs sleep for ``--delays``
+and write realistic project and node_modules trees. Then it times
+``create_react_app`` and ``create_nextjs_app``:
+
+  cold    no snapshot: generator + install every run
+  warm    materialized from the snapshot built by a priming run
+
+Every run is traced (utils.tracing), which gives per-step times and
+SHNK's own overhead: the wall time during which no child process was
+running. ``--out`` saves the results as JSON. ``--compare`` diffs them
+against an earlier file and exits 1 if an overhead median regressed by
+more than ``--max-regression`` percent.
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import redirect_stdout
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from fixtures.stub_toolchain import install_stubs
+from utils import tracing
+
+DEFAULT_ITERATIONS = 5
+DEFAULT_DELAYS = "create=0.3,exec=0.3,install=1.0,ci=0.6,code=0.1,optimize=0.4"
+DEFAULT_PACKAGES = 200
+DEFAULT_MAX_REGRESSION = 20.0
+# Overhead differences below this are noise, whatever the percentage
+NOISE_FLOOR_MS = 5.0
+
+
+def _scaffolders():
+    from commands.next_tailwind import create_nextjs_app
+    from commands.react_tailwind import create_react_app
+    return {"react": create_react_app, "next": create_nextjs_app}
+
+
+def _busy_ms(intervals: List[tuple]) -> float:
+    """Total length of the union of (start, end) intervals, in ms"""
+    busy, last_end = 0, None
+    for start, end in sorted(intervals):
+        if last_end is None or start > last_end:
+            busy += end - start
+            last_end = end
+        elif end > last_end:
+            busy += end - last_end
+            last_end = end
+    return busy / 1e6
+
+
+def run_once(scaffold, base_path: Path, pm: str, use_cache: bool) -> Dict:
+    """One traced scaffold; returns total, overhead and per-step times in ms"""
+    tracing.disable()
+    tracer = tracing.enable()
+    try:
+        with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+            project = scaffold("app", base_path=base_path, open_editor=True, start_dev=False,
+                               use_cache=use_cache, package_manager=pm)
+    finally:
+        tracing.disable()
+    if not project:
+        raise RuntimeError(f"scaffold failed in {base_path}")
+
+    root = next(s for s in tracer.spans if s.cat == "scaffold")
+    total = (root.end - root.start) / 1e6
+    waiting = _busy_ms([(s.start, s.end) for s in tracer.spans if s.cat == "command"])
+    return {
+        "total": total,
+        "overhead": total - waiting,
+        "steps": {s.name: (s.end - s.start) / 1e6 for s in tracer.spans if s.cat == "step"},
+    }
+
+
+def _summary(values: List[float]) -> Dict[str, float]:
+    return {"median": round(statistics.median(values), 2), "min": round(min(values), 2),
+            "max": round(max(values), 2)}
+
+
+def bench(framework: str, mode: str, pm: str, iterations: int, workdir: Path) -> Dict:
+    scaffold = _scaffolders()[framework]
+    use_cache = mode == "warm"
+    if use_cache:
+        prime = workdir / f"{framework}-{pm}-prime"
+        prime.mkdir()
+        run_once(scaffold, prime, pm, use_cache=True)
+
+    runs = []
+    for i in range(iterations):
+        base = workdir / f"{framework}-{pm}-{mode}-{i}"
+        base.mkdir()
+        runs.append(run_once(scaffold, base, pm, use_cache))
+
+    steps = sorted({name for run in runs for name in run["steps"]})
+    return {
+        "framework": framework,
+        "mode": mode,
+        "package_manager": pm,
+        "runs": iterations,
+        "total_ms": _summary([run["total"] for run in runs]),
+        "overhead_ms": _summary([run["overhead"] for run in runs]),
+        "steps_ms": {name: round(statistics.median([run["steps"].get(name, 0.0) for run in runs]), 2)
+                     for name in steps},
+    }
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        result = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                                cwd=Path(__file__).resolve().parent.parent, timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return result.stdout.strip() or None
+
+
+def compare(results: List[Dict], baseline: Dict, max_regression: float) -> List[str]:
+    """Print median deltas against ``baseline``; returns the regressed scenarios"""
+    previous = {(r["framework"], r["mode"], r["package_manager"]): r for r in baseline.get("results", [])}
+    regressed = []
+    print(f"\nAgainst {baseline.get('meta', {}).get('commit') or 'baseline'}:")
+    for r in results:
+        key = (r["framework"], r["mode"], r["package_manager"])
+        if key not in previous:
+            continue
+        old, new = previous[key]["overhead_ms"]["median"], r["overhead_ms"]["median"]
+        old_total, new_total = previous[key]["total_ms"]["median"], r["total_ms"]["median"]
+        change = (new - old) / old * 100 if old else 0.0
+        print(f"  {' '.join(key):<18} total {old_total:>9.1f} -> {new_total:>9.1f} ms"
+              f"   overhead {old:>8.1f} -> {new:>8.1f} ms ({change:+.1f}%)")
+        if change > max_regression and new - old > NOISE_FLOOR_MS:
+            regressed.append(" ".join(key))
+    return regressed
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="bench_scaffold", description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=DEFAULT_ITERATIONS)
+    parser.add_argument("--pm", action="append", default=None,
+                        help="Package manager to benchmark (repeatable, default: npm)")
+    parser.add_argument("--framework", action="append", choices=("react", "next"), default=None)
+    parser.add_argument("--delays", default=DEFAULT_DELAYS,
+                        help=f"Stub sleeps per kind of call (default: {DEFAULT_DELAYS})")
+    parser.add_argument("--packages", type=int, default=DEFAULT_PACKAGES,
+                        help="Transitive packages each stub install writes")
+    parser.add_argument("--out", type=Path, default=None, help="Write the results to this JSON file")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    parser.add_argument("--compare", type=Path, default=None, help="Earlier results file to diff against")
+    parser.add_argument("--max-regression", type=float, default=DEFAULT_MAX_REGRESSION,
+                        help="Allowed overhead regression in percent for --compare")
+    args = parser.parse_args(argv)
+
+    saved = dict(os.environ)
+    with tempfile.TemporaryDirectory(prefix="shnk-bench-") as tmp:
+        tmp = Path(tmp)
+        stubs = install_stubs(tmp / "bin")
+        os.environ.update({
+            "PATH": str(stubs) + os.pathsep + os.environ.get("PATH", ""),
+            "SHNK_HOME": str(tmp / "home"),
+            "SHNK_STUB_DELAYS": args.delays,
+            "SHNK_STUB_PACKAGES": str(args.packages),
+        })
+        os.environ.pop("SHNK_STUB_LOG", None)
+        try:
+            results = [bench(framework, mode, pm, args.iterations, tmp)
+                       for pm in args.pm or ["npm"]
+                       for framework in args.framework or ["react", "next"]
+                       for mode in ("cold", "warm")]
+        finally:
+            os.environ.clear()
+            os.environ.update(saved)
+
+    report = {
+        "meta": {
+            "commit": _git_commit(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+        },
+        "config": {"iterations": args.iterations, "delays": args.delays, "packages": args.packages},
+        "results": results,
+    }
+    if args.out:
+        args.out.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print(f"{'scenario':<18}{'total':>10}{'overhead':>10}  steps (median ms)")
+        for r in results:
+            steps = ", ".join(f"{name} {ms:.0f}" for name, ms in r["steps_ms"].items())
+            print(f"{r['framework'] + ' ' + r['mode'] + ' ' + r['package_manager']:<18}"
+                  f"{r['total_ms']['median']:>10.1f}{r['overhead_ms']['median']:>10.1f}  {steps}")
+
+    if args.compare:
+        try:
+            baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            print(f"Error: could not read {args.compare}: {e}", file=sys.stderr)
+            return 2
+        regressed = compare(results, baseline, args.max_regression)
+        if regressed:
+            print(f"Overhead regressed by more than {args.max_regression}%: {', '.join(regressed)}",
+                  file=sys.stderr)
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,94 @@
+# benchmarks/bench_templates.py
+"""
+Template rendering benchmark.
+
+    python -m benchmarks.bench_templates [--iterations N] [--budget-ms MS] [--json]
+
+For every template pack, measures rendering and writing all of its files
+for one project:
+
+  cold    compile from source (empty cache directory)
+  disk    fresh engine, compiled form loaded from the on-disk cache
+  hot     steady state: in-memory compiled templates, mtime checks only
+
+Exits 1 if the median hot render of any pack exceeds the budget.
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from templates import index
+from templates.engine import TemplateEngine
+
+DEFAULT_ITERATIONS = 200
+DEFAULT_BUDGET_MS = 3.0
+
+
+def _timed(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return (time.perf_counter() - start) * 1000
+
+
+def bench_pack(pack, workdir: Path, iterations: int) -> dict:
+    """Time cold, disk-cached and hot renders of every file in ``pack``"""
+    cache_dir = workdir / "cache" / pack.name
+    project = workdir / "projects" / pack.name
+    context = pack.context(project.name)
+
+    cold = _timed(lambda: pack.write(project, context=context, engine=TemplateEngine(cache_dir)))
+    disk = _timed(lambda: pack.write(project, context=context, engine=TemplateEngine(cache_dir)))
+
+    engine = TemplateEngine(cache_dir)
+    pack.write(project, context=context, engine=engine)
+    hot = [_timed(lambda: pack.write(project, context=context, engine=engine))
+           for _ in range(iterations)]
+    render_only = []
+    sources = [source for _, parts in pack.files(context=context) for source in parts
+               if source.name.endswith(".tmpl")]
+    for _ in range(iterations):
+        render_only.append(_timed(lambda: [engine.render(source, context) for source in sources]))
+
+    return {
+        "pack": pack.name,
+        "files": len(pack.files(context=context)),
+        "cold_ms": round(cold, 3),
+        "disk_ms": round(disk, 3),
+        "hot_ms": round(statistics.median(hot), 3),
+        "hot_p95_ms": round(sorted(hot)[int(len(hot) * 0.95) - 1], 3),
+        "render_only_ms": round(statistics.median(render_only), 3),
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="bench_templates", description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=DEFAULT_ITERATIONS)
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS)
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory(prefix="shnk-bench-") as tmp:
+        results = [bench_pack(pack, Path(tmp), args.iterations) for pack in index().values()]
+
+    if args.json:
+        print(json.dumps({"budget_ms": args.budget_ms, "results": results}, indent=2))
+    else:
+        print(f"{'pack':<16}{'files':>6}{'cold':>10}{'disk':>10}{'hot':>10}{'p95':>10}{'render':>10}  (ms)")
+        for r in results:
+            print(f"{r['pack']:<16}{r['files']:>6}{r['cold_ms']:>10.3f}{r['disk_ms']:>10.3f}"
+                  f"{r['hot_ms']:>10.3f}{r['hot_p95_ms']:>10.3f}{r['render_only_ms']:>10.3f}")
+
+    over = [r["pack"] for r in results if r["hot_ms"] > args.budget_ms]
+    if over:
+        print(f"Over the {args.budget_ms}ms budget: {', '.join(over)}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,442 @@
+"""
+SHNK - Headless command line interface
+Non-interactive entry points for scripts and CI (no menu, prompts or animations)
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import List, Optional
+
+PM_CHOICES = ("npm", "pnpm", "yarn", "bun", "auto")
+
+
+@contextmanager
+def _stdout_to_stderr():
+    """Send everything written to stdout (including child processes) to stderr"""
+    sys.stdout.flush()
+    saved_fd = os.dup(1)
+    try:
+        os.dup2(2, 1)
+        yield
+    finally:
+        sys.stdout.flush()
+        os.dup2(saved_fd, 1)
+        os.close(saved_fd)
+
+
+@contextmanager
+def _tracing(path: Optional[Path]):
+    """Record spans while the block runs and save them to ``path`` as a Chrome trace"""
+    if path is None:
+        yield
+        return
+    from utils import tracing
+
+    tracing.enable()
+    try:
+        with tracing.span("shnk " + " ".join(sys.argv[1:]), cat="cli"):
+            yield
+    finally:
+        try:
+            tracing.write(path)
+            print(f"Trace written to {path}", file=sys.stderr)
+        except OSError as e:
+            print(f"Error: could not write trace: {e}", file=sys.stderr)
+        tracing.disable()
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the argv parser for the headless commands"""
+    parser = argparse.ArgumentParser(
+        prog="shnk",
+        description="SHNK developer toolkit. Run without arguments for the interactive menu.",
+    )
+    subparsers = parser.add_subparsers(dest="command", metavar="command")
+    subparsers.required = True
+
+    new = subparsers.add_parser("new", help="Scaffold a new project without prompts")
+    new.add_argument("spec", metavar="template",
+                     help="react, next, a project spec from config/config.json, or a spec .json file")
+    new.add_argument("name", help="Project name (letters, numbers, hyphens, underscores)")
+    new.add_argument("--path", type=Path, default=None,
+                     help="Directory to create the project in (default: current directory)")
+    new.add_argument("--no-dev", action="store_true", help="Don't start the dev server")
+    new.add_argument("--no-editor", action="store_true", help="Don't open VS Code")
+    new.add_argument("--no-cache", action="store_true",
+                     help="Ignore cached snapshots and run the full npm install")
+    new.add_argument("--no-prebundle", action="store_true",
+                     help="Don't pre-bundle Vite's dependencies at scaffold time (react only)")
+    new.add_argument("--pm", choices=PM_CHOICES, default=None,
+                     help="Package manager (default: config/config.json, else npm; auto = fastest installed)")
+    new.add_argument("--resume", action="store_true",
+                     help="Continue an interrupted scaffold, skipping steps that already finished")
+    new.add_argument("--var", action="append", default=[], metavar="NAME=VALUE",
+                     help="Set a template variable, e.g. --var title=Hello --var typescript=true")
+    new.add_argument("--offline", action="store_true",
+                     help="Install from the local package mirror (see 'shnk mirror')")
+    new.add_argument("--json", action="store_true",
+                     help="Print a JSON result on stdout; logs go to stderr")
+    new.add_argument("--trace", type=Path, default=None, metavar="OUT.json",
+                     help="Write a Chrome trace of every step and command (open in ui.perfetto.dev)")
+    new.set_defaults(handler=cmd_new)
+
+    batch = subparsers.add_parser("batch", help="Create many projects concurrently from a manifest")
+    batch.add_argument("manifest", type=Path, help="JSON manifest listing the projects")
+    batch.add_argument("--jobs", type=int, default=None,
+                       help="Max concurrent installs (default: from CPU count and free memory)")
+    batch.add_argument("--no-cache", action="store_true",
+                       help="Ignore cached snapshots and run the full npm install")
+    batch.add_argument("--pm", choices=PM_CHOICES, default=None,
+                       help="Package manager for projects that don't set one in the manifest")
+    batch.add_argument("--offline", action="store_true",
+                       help="Install from the local package mirror (see 'shnk mirror')")
+    batch.add_argument("--trace", type=Path, default=None, metavar="OUT.json",
+                       help="Write a Chrome trace of every job, step and command")
+    batch.set_defaults(handler=cmd_batch)
+
+    cache = subparsers.add_parser("cache", help="Inspect or clear prebuilt scaffold snapshots")
+    cache.add_argument("action", choices=("list", "clear"))
+    cache.set_defaults(handler=cmd_cache)
+
+    templates = subparsers.add_parser("templates", help="Inspect template packs or refresh their lockfiles")
+    templates.add_argument("action", choices=("list", "refresh-locks"))
+    templates.add_argument("--pack", default=None, help="Only this template pack (default: all)")
+    templates.add_argument("--pm", choices=PM_CHOICES, default=None,
+                           help="Package manager whose lockfiles to refresh (default: configured one)")
+    templates.set_defaults(handler=cmd_templates)
+
+    specs = subparsers.add_parser("specs", help="List and validate the project specs in config/config.json")
+    specs.add_argument("files", nargs="*", type=Path, help="Spec files to validate as well")
+    specs.set_defaults(handler=cmd_specs)
+
+    upgrade = subparsers.add_parser("upgrade", help="Bring a project's template files up to date")
+    upgrade.add_argument("path", nargs="?", type=Path, default=Path("."),
+                         help="Project directory (default: current directory)")
+    upgrade.add_argument("--dry-run", action="store_true", help="Only report what would change")
+    upgrade.add_argument("--no-install", action="store_true",
+                         help="Update package.json but don't reinstall when dependencies changed")
+    upgrade.add_argument("--pm", choices=PM_CHOICES, default=None,
+                         help="Package manager for the reinstall (default: the one the project was created with)")
+    upgrade.add_argument("--json", action="store_true",
+                         help="Print a JSON summary on stdout; logs go to stderr")
+    upgrade.set_defaults(handler=cmd_upgrade)
+
+    mirror = subparsers.add_parser("mirror", help="Manage the local package mirror used by --offline")
+    mirror.add_argument("action", choices=("sync", "add", "list", "serve", "clear"))
+    mirror.add_argument("files", nargs="*", type=Path,
+                        help="add: package tarballs (.tgz); sync: package-lock.json files")
+    mirror.add_argument("--pack", default=None, help="sync: only this template pack's locks (default: all)")
+    mirror.add_argument("--port", type=int, default=4873, help="serve: port to listen on (default: 4873)")
+    mirror.set_defaults(handler=cmd_mirror)
+
+    return parser
+
+
+def parse_variables(pairs: List[str]) -> dict:
+    """Turn ``NAME=VALUE`` arguments into a dict; raises ValueError on bad input"""
+    variables = {}
+    for pair in pairs:
+        name, sep, value = pair.partition("=")
+        if not sep or not name.strip():
+            raise ValueError(f"Expected NAME=VALUE, got {pair!r}")
+        variables[name.strip()] = value
+    return variables
+
+
+def cmd_new(args: argparse.Namespace) -> int:
+    """Scaffold a project from a project spec, without prompts"""
+    from commands.common import is_valid_project_name
+    from commands.specs import SpecError, resolve_spec, scaffold
+
+    message = None
+    if not is_valid_project_name(args.name):
+        message = "Invalid project name. Use letters, numbers, hyphens, or underscores only."
+    else:
+        try:
+            variables = parse_variables(args.var)
+            spec = resolve_spec(args.spec)
+        except (SpecError, ValueError) as e:
+            message = str(e)
+    if message:
+        if args.json:
+            print(json.dumps({"status": "error", "error": message}))
+        else:
+            print(f"Error: {message}", file=sys.stderr)
+        return 2
+
+    # Flags override the spec; headless runs never prompt for a location
+    base_path = args.path if args.path is not None else spec.base_path or Path.cwd()
+    start = time.perf_counter()
+
+    def _create():
+        from utils.logger import Logger
+        from utils.mirror import offline_registry, offline_requested
+
+        with offline_registry(offline_requested(args.offline), logger=Logger()):
+            return scaffold(
+                spec,
+                args.name,
+                base_path=base_path,
+                open_editor=False if args.no_editor else None,
+                start_dev=False if args.no_dev else None,
+                prebundle=False if args.no_prebundle else None,
+                package_manager=args.pm,
+                variables=variables,
+                use_cache=not args.no_cache,
+                resume=args.resume,
+            )
+
+    with _tracing(args.trace):
+        if args.json:
+            with _stdout_to_stderr():
+                project_path = _create()
+        else:
+            project_path = _create()
+
+    elapsed = time.perf_counter() - start
+    server = None
+    if project_path and not args.no_dev:
+        from utils.devserver import supervisor
+        server = supervisor().find(project_path)
+    if args.json:
+        print(json.dumps({
+            "status": "created" if project_path else "error",
+            "framework": spec.framework,
+            "spec": spec.name,
+            "name": args.name,
+            "path": str(project_path) if project_path else None,
+            "url": server.url if server else None,
+            "elapsed": round(elapsed, 3),
+        }), flush=True)
+    if server is not None:
+        # Headless runs keep the dev server in the foreground until Ctrl+C
+        from utils.logger import Logger
+        if args.json:
+            with _stdout_to_stderr():
+                supervisor().follow(server, Logger())
+        else:
+            supervisor().follow(server, Logger())
+    return 0 if project_path else 1
+
+
+def cmd_batch(args: argparse.Namespace) -> int:
+    """Scaffold every project in a manifest concurrently"""
+    from commands.batch import load_manifest, print_summary, run_batch
+
+    try:
+        jobs = load_manifest(args.manifest, package_manager=args.pm)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+
+    from utils.logger import Logger
+    from utils.mirror import offline_registry, offline_requested
+
+    with _tracing(args.trace), offline_registry(offline_requested(args.offline), logger=Logger()):
+        results = run_batch(jobs, use_cache=not args.no_cache, jobs_limit=args.jobs)
+    print_summary(results)
+    return 0 if all(result["status"] == "created" for result in results) else 1
+
+
+def cmd_cache(args: argparse.Namespace) -> int:
+    """List or clear the snapshot cache"""
+    from utils.snapshots import clear_snapshots, list_snapshots
+
+    if args.action == "clear":
+        print(f"Removed {clear_snapshots()} snapshot(s)")
+        return 0
+
+    for key, meta in list_snapshots():
+        created = time.strftime("%Y-%m-%d %H:%M", time.localtime(meta.get("created", 0)))
+        versions = ", ".join(f"{name}@{version}" for name, version in meta.get("versions", {}).items())
+        print(f"{key}  {created}  {versions}")
+    return 0
+
+
+def _lock_refreshers():
+    from commands import next_tailwind, react_tailwind
+    return {module.TEMPLATE_PACK: module.refresh_locks for module in (react_tailwind, next_tailwind)}
+
+
+def cmd_templates(args: argparse.Namespace) -> int:
+    """List the template packs, or regenerate their pinned lockfiles"""
+    from templates import index
+    from utils.lockfiles import LOCKS_DIR, LOCK_META
+
+    packs = index()
+    if args.pack and args.pack not in packs:
+        print(f"Error: unknown template pack {args.pack!r} (available: {', '.join(packs)})", file=sys.stderr)
+        return 2
+    selected = [args.pack] if args.pack else list(packs)
+
+    if args.action == "refresh-locks":
+        refreshers = _lock_refreshers()
+        ok = True
+        for name in selected:
+            if name in refreshers:
+                ok = refreshers[name](args.pm) and ok
+        return 0 if ok else 1
+
+    for name in selected:
+        pack = packs[name]
+        print(f"{name}  {pack.description}")
+        for dest, sources in pack.files():
+            print(f"  {dest}  <- {' + '.join(source.name for source in sources)}")
+        if pack.dependencies:
+            print(f"  packages: {' '.join(pack.packages())}")
+        locks = sorted((pack.root / LOCKS_DIR).glob(f"*/{LOCK_META}"))
+        for meta_path in locks:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            print(f"  lock {meta_path.parent.name}: {meta.get('generator')}@{meta.get('version')}"
+                  f" (refreshed {meta.get('refreshed')})")
+        if not locks:
+            print("  locks: none (installs resolve latest; run `shnk templates refresh-locks` to pin)")
+    return 0
+
+
+def cmd_specs(args: argparse.Namespace) -> int:
+    """Print every project spec; exits 2 if one of them doesn't validate"""
+    from commands.specs import SpecError, load_specs, resolve_spec
+
+    try:
+        found = list(load_specs().values()) + [resolve_spec(str(path)) for path in args.files]
+    except SpecError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+    for spec in found:
+        source = spec.source or "built in"
+        print(f"{spec.name}  {spec.title} ({spec.framework}, {source})")
+        details = {
+            "package manager": spec.package_manager,
+            "location": spec.base_path,
+            "packages": " ".join(spec.dependencies),
+            "variables": ", ".join(f"{name}={value}" for name, value in spec.variables.items()),
+            "post steps": " && ".join(spec.post_steps),
+        }
+        for label, value in details.items():
+            if value:
+                print(f"  {label}: {value}")
+    return 0
+
+
+def cmd_upgrade(args: argparse.Namespace) -> int:
+    """Apply template changes to a project, leaving the user's edits alone"""
+    from commands.upgrade import upgrade_project
+
+    try:
+        if args.json:
+            with _stdout_to_stderr():
+                summary = upgrade_project(args.path, package_manager=args.pm, dry_run=args.dry_run,
+                                          install=not args.no_install)
+        else:
+            summary = upgrade_project(args.path, package_manager=args.pm, dry_run=args.dry_run,
+                                      install=not args.no_install)
+    except (OSError, ValueError) as e:
+        if args.json:
+            print(json.dumps({"status": "error", "error": str(e)}))
+        else:
+            print(f"Error: {e}", file=sys.stderr)
+        return 2
+    if args.json:
+        print(json.dumps(summary))
+    # Conflicts need the user's attention, like a failed reinstall
+    return 0 if summary["ok"] and not summary["conflicts"] else 1
+
+
+def cmd_mirror(args: argparse.Namespace) -> int:
+    """Fill, inspect or serve the local package mirror"""
+    from utils.mirror import Mirror, MirrorRegistry
+
+    mirror = Mirror()
+    if args.action == "list":
+        for name, versions in mirror.packages():
+            print(f"{name}  {', '.join(versions)}")
+        return 0
+    if args.action == "clear":
+        mirror.clear()
+        print(f"Removed {mirror.root}")
+        return 0
+
+    if args.action == "serve":
+        try:
+            registry = MirrorRegistry(mirror, port=args.port)
+        except OSError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+        print(f"Serving {len(mirror.packages())} packages at {registry.url} (Ctrl+C to stop)")
+        try:
+            registry.server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            registry.server.server_close()
+        return 0
+
+    if args.action == "add":
+        if not args.files:
+            print("Error: mirror add needs one or more .tgz files", file=sys.stderr)
+            return 2
+        ok = True
+        for path in args.files:
+            try:
+                name, version = mirror.add_file(path)
+                print(f"added {name}@{version}")
+            except (OSError, ValueError, KeyError) as e:
+                print(f"Error: {path}: {e}", file=sys.stderr)
+                ok = False
+        return 0 if ok else 1
+
+    # sync: explicit package-lock.json files, else every npm lock in the template packs
+    from templates import index
+    from utils.lockfiles import find_lock
+    from utils.package_manager import resolve
+
+    packs = index()
+    if args.pack and args.pack not in packs:
+        print(f"Error: unknown template pack {args.pack!r} (available: {', '.join(packs)})", file=sys.stderr)
+        return 2
+
+    def progress(spec):
+        print(f"  + {spec}")
+
+    sources = [(str(path), lambda path=path: mirror.sync_lockfile(path, progress=progress))
+               for path in args.files]
+    if not args.files:
+        npm = resolve("npm")
+        for name in ([args.pack] if args.pack else list(packs)):
+            for typescript in (False, True):
+                lock = find_lock(packs[name], npm, typescript)
+                if lock:
+                    sources.append((f"{name} ({lock.directory.name})",
+                                    lambda lock=lock: mirror.sync_template_lock(lock, progress=progress)))
+    if not sources:
+        print("Error: no npm template locks found; run 'shnk templates refresh-locks --pm npm' first",
+              file=sys.stderr)
+        return 1
+
+    ok = True
+    for label, sync in sources:
+        print(f"Syncing {label}")
+        try:
+            counts = sync()
+            print(f"  {counts['added']} added, {counts['present']} already mirrored")
+        except (OSError, ValueError, KeyError) as e:
+            print(f"Error: {label}: {e}", file=sys.stderr)
+            ok = False
+    return 0 if ok else 1
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Parse argv and run the selected headless command"""
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
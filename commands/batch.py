@@ -0,0 +1,168 @@
+# commands/batch.py
+"""
+Batch scaffolding from a JSON manifest.
+
+    {
+      "base_path": "sandboxes",
+      "framework": "react",
+      "package_manager": "pnpm",
+      "variables": {"accent": "sky-400"},
+      "projects": ["alice", {"name": "spike", "framework": "next",
+                             "variables": {"title": "Spike"}}]
+    }
+
+Projects are created concurrently. Install steps are limited by the shared
+install gate (CPU count and free memory), each project logs through its own
+prefixed stream, and the first project of each framework runs ahead of the
+others (per package manager) so the rest can be materialized from its snapshot.
+"""
+
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from commands.common import is_valid_project_name
+from utils import tracing
+from utils.logger import Logger
+
+FRAMEWORKS = ("react", "next")
+# Threads mostly wait on subprocesses; installs are capped separately
+MAX_BATCH_THREADS = 16
+
+
+def _scaffolder(framework: str):
+    if framework == "react":
+        from commands.react_tailwind import create_react_app
+        return create_react_app
+    from commands.next_tailwind import create_nextjs_app
+    return create_nextjs_app
+
+
+def load_manifest(manifest_path: Path, package_manager: Optional[str] = None) -> List[Dict]:
+    """Parse and validate a batch manifest into a list of project jobs"""
+    manifest_path = Path(manifest_path)
+    data = json.loads(manifest_path.read_text(encoding="utf-8"))
+    if isinstance(data, list):
+        data = {"projects": data}
+
+    root = manifest_path.parent
+    default_base = (root / data.get("base_path", ".")).resolve()
+    default_framework = data.get("framework", "react")
+    default_pm = data.get("package_manager", package_manager)
+    default_variables = data.get("variables", {})
+
+    jobs = []
+    seen = set()
+    for entry in data.get("projects", []):
+        if isinstance(entry, str):
+            entry = {"name": entry}
+        name = entry.get("name", "")
+        framework = entry.get("framework", default_framework)
+        base_path = (root / entry["path"]).resolve() if entry.get("path") else default_base
+
+        if not is_valid_project_name(name):
+            raise ValueError(f"Invalid project name in manifest: {name!r}")
+        if framework not in FRAMEWORKS:
+            raise ValueError(f"Unknown framework for {name}: {framework!r}")
+        target = base_path / name
+        if target in seen:
+            raise ValueError(f"Duplicate project in manifest: {target}")
+        seen.add(target)
+        if not isinstance(entry.get("variables", {}), dict):
+            raise ValueError(f"variables for {name} must be an object")
+        variables = dict(default_variables, **entry.get("variables", {}))
+        jobs.append({"name": name, "framework": framework, "base_path": base_path,
+                     "package_manager": entry.get("package_manager", default_pm),
+                     "variables": variables})
+
+    if not jobs:
+        raise ValueError("Manifest contains no projects")
+    return jobs
+
+
+def _run_job(job: Dict, use_cache: bool, wait_for=None) -> Dict:
+    if wait_for is not None:
+        # Let the framework's first project build the snapshot we reuse
+        with tracing.span("wait-for-seed", cat="wait", project=job["name"]):
+            wait_for.result()
+
+    logger = Logger(prefix=job["name"])
+    create = _scaffolder(job["framework"])
+    start = time.perf_counter()
+    try:
+        with tracing.span(job["name"], cat="job", framework=job["framework"],
+                          package_manager=job["package_manager"] or "default"):
+            project_path = create(
+                job["name"],
+                base_path=job["base_path"],
+                open_editor=False,
+                start_dev=False,
+                use_cache=use_cache,
+                logger=logger,
+                package_manager=job["package_manager"],
+                variables=job["variables"],
+            )
+        status = "created" if project_path else "failed"
+        error = None
+    except Exception as e:
+        project_path, status, error = None, "error", str(e)
+        logger.error(f"❌ {e}")
+
+    return dict(job, status=status, error=error, path=project_path,
+                elapsed=time.perf_counter() - start)
+
+
+def run_batch(jobs: List[Dict], use_cache: bool = True, jobs_limit: Optional[int] = None) -> List[Dict]:
+    """Scaffold every job concurrently and return one result per job, in order"""
+    from utils.progress import set_live_progress
+    from utils.scheduler import configure_install_gate, install_gate
+
+    gate = configure_install_gate(jobs_limit) if jobs_limit else install_gate()
+    Logger().log(f"📦 Creating {len(jobs)} projects ({gate.slots} concurrent installs)")
+
+    set_live_progress(False)
+    try:
+        with ThreadPoolExecutor(max_workers=min(len(jobs), MAX_BATCH_THREADS)) as pool:
+            seeds = {}
+            futures = []
+            for job in jobs:
+                template = (job["framework"], job["package_manager"])
+                seed = seeds.get(template) if use_cache else None
+                future = pool.submit(tracing.propagate(_run_job), job, use_cache, seed)
+                seeds.setdefault(template, future)
+                futures.append(future)
+            try:
+                return [future.result() for future in futures]
+            except KeyboardInterrupt:
+                from utils.runner import default_runner
+                pool.shutdown(wait=False, cancel_futures=True)
+                default_runner().cancel_all()
+                raise
+    finally:
+        set_live_progress(True)
+
+
+def print_summary(results: List[Dict]) -> None:
+    """Render the per-project outcome of a batch run"""
+    from rich.table import Table
+    from utils.logger import get_console
+
+    table = Table(title="Batch Summary", show_header=True, header_style="bold magenta")
+    table.add_column("Project", style="cyan")
+    table.add_column("Framework")
+    table.add_column("Status")
+    table.add_column("Time", justify="right")
+    table.add_column("Location", style="dim")
+
+    for result in results:
+        style = "green" if result["status"] == "created" else "red"
+        table.add_row(
+            result["name"],
+            result["framework"],
+            f"[{style}]{result['status']}[/{style}]",
+            f"{result['elapsed']:.1f}s",
+            str(result["path"] or result["base_path"] / result["name"]),
+        )
+    get_console().print(table)
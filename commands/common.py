@@ -0,0 +1,128 @@
+# commands/common.py
+from pathlib import Path
+from typing import Callable, Iterable, List, Optional
+
+# Where projects land when the user keeps the default location
+DEFAULT_BASE_PATH = Path.home() / "OneDrive" / "Desktop"
+
+
+def choose_base_path(base_path: Optional[Path] = None, ask: Callable[[str], str] = input) -> Path:
+    """Return the directory new projects are created in.
+
+    Headless callers pass ``base_path`` and are never prompted; the
+    interactive flow asks whether to keep the default location through
+    ``ask`` (``input`` unless the caller injects its own).
+    """
+    if base_path is not None:
+        return Path(base_path).expanduser().resolve()
+
+    print(f"\n📂 Default location: {DEFAULT_BASE_PATH}")
+    custom = ask("Want to change location? (y/N): ").strip().lower()
+
+    if custom == "y":
+        custom_path = ask("Enter full directory path: ").strip()
+        return Path(custom_path).expanduser().resolve() if custom_path else DEFAULT_BASE_PATH
+    return DEFAULT_BASE_PATH
+
+
+def safe_mkdir(path: Path) -> None:
+    """Safely create a directory if it doesn't exist"""
+    try:
+        path.mkdir(parents=True, exist_ok=True)
+    except Exception as e:
+        from rich.console import Console
+        Console().print(f"[red]Error creating directory {path}: {str(e)}[/red]")
+
+
+def is_valid_project_name(project_name: str) -> bool:
+    """Project names may only use letters, numbers, hyphens and underscores"""
+    return bool(project_name) and project_name.replace("-", "").replace("_", "").isalnum()
+
+
+def open_project_dir(project_path: Path, resume: bool, logger):
+    """Journal for a new or resumed scaffold, or None if it must not proceed"""
+    from commands.journal import StepJournal
+
+    journal = StepJournal(project_path)
+    if not project_path.exists():
+        if resume:
+            logger.warning(f"⚠️ Nothing to resume at {project_path}; starting a fresh scaffold.")
+        return journal
+
+    if not resume:
+        logger.error(f"❌ Project directory already exists at: {project_path}")
+        logger.error("Aborting to prevent overwriting existing files.")
+        if journal.exists():
+            logger.log("💡 It looks like an interrupted scaffold; re-run with --resume to continue it.")
+        return None
+    if not journal.exists():
+        logger.error(f"❌ {project_path} exists but has no scaffold journal to resume from.")
+        return None
+    done = [name for name in journal.steps if journal.has(name)]
+    logger.log(f"♻️ Resuming scaffold ({', '.join(done) or 'no steps'} already done)")
+    return journal
+
+
+def restore_snapshot(snapshot: Path, project_path: Path, project_name: str, logger) -> bool:
+    """Materialize a cached snapshot as the new project (scaffold step)"""
+    from utils.snapshots import materialize_snapshot
+
+    try:
+        materialize_snapshot(snapshot, project_path, project_name)
+    except OSError as e:
+        logger.error(f"❌ Could not materialize snapshot: {e}")
+        return False
+    logger.success(f"⚡ Created from cached snapshot {snapshot.name} (no install needed).")
+    return True
+
+
+def store_snapshot(key: str, project_path: Path, project_name: str,
+                   packages: Iterable[str], logger) -> bool:
+    """Cache a finished project for future scaffolds; never fails the scaffold"""
+    from utils.snapshots import save_snapshot
+
+    if save_snapshot(key, project_path, project_name, packages=packages):
+        logger.log(f"💾 Saved snapshot {key} for future projects.")
+    else:
+        logger.warning("⚠️ Could not save a snapshot of this project.")
+    return True
+
+
+def write_template_files(pack, group: str, project_path: Path, context, logger) -> bool:
+    """Render one group of a template pack's files into the project (scaffold step)"""
+    from templates.engine import TemplateError
+
+    try:
+        written = pack.write(project_path, group, context)
+    except (OSError, TemplateError) as e:
+        logger.error(f"❌ Could not write {group} from the {pack.name} template: {e}")
+        return False
+    for path in written:
+        logger.success(f"✅ {path.relative_to(project_path).as_posix()} written from the {pack.name} template.")
+    return True
+
+
+def record_template(pack, project_path: Path, context, pm, logger) -> bool:
+    """Save the template manifest 'shnk upgrade' diffs against; never fails the scaffold"""
+    from commands.upgrade import record_manifest
+
+    try:
+        record_manifest(pack, project_path, context, pm)
+    except (OSError, ValueError) as e:
+        logger.warning(f"⚠️ Could not record the template manifest ('shnk upgrade' won't work): {e}")
+    return True
+
+
+def add_post_steps(graph, commands: Iterable[str], project_path: Path, logger) -> List[str]:
+    """Chain a spec's post-step commands after every step already in the graph"""
+    from utils.installer import run_command
+
+    previous = [name for name in graph.steps if name not in ("probe", "editor")]
+    added = []
+    for index, command in enumerate(commands, 1):
+        step = graph.add(f"post-{index}", lambda command=command: run_command(command, cwd=project_path,
+                                                                              logger=logger),
+                         requires=previous, inputs=command)
+        previous = [step]
+        added.append(step)
+    return added
@@ -0,0 +1,103 @@
+# commands/journal.py
+"""
+Per-project step journal for resumable scaffolds.
+
+``<project>/.shnk/journal.json`` records, for every finished step, its
+status, a hash of its inputs and the files it is expected to leave behind:
+
+    {"format": 1,
+     "steps": {"generate": {"status": "ok", "inputs": "3f2a...", "elapsed": 41.2,
+                            "outputs": ["package.json"]}}}
+
+A resumed scaffold skips a step when it completed with the same inputs,
+its outputs still exist and none of its dependencies had to run again.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List
+
+JOURNAL_FORMAT = 1
+JOURNAL_DIR = ".shnk"
+JOURNAL_FILE = "journal.json"
+
+
+def inputs_hash(inputs: Any) -> str:
+    """Stable hash of a step's JSON-able inputs"""
+    return hashlib.sha256(json.dumps(inputs, sort_keys=True, default=str).encode()).hexdigest()[:16]
+
+
+class StepJournal:
+    """Thread-safe record of completed scaffold steps"""
+
+    def __init__(self, project_path: Path):
+        self.project_path = Path(project_path)
+        self.path = self.project_path / JOURNAL_DIR / JOURNAL_FILE
+        self._lock = threading.Lock()
+        self.steps: Dict[str, Dict] = {}
+        self.load()
+
+    def exists(self) -> bool:
+        return self.path.is_file()
+
+    def load(self) -> None:
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if data.get("format") == JOURNAL_FORMAT:
+            self.steps = data.get("steps", {})
+
+    def _save(self) -> None:
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_name(f"{JOURNAL_FILE}.{os.getpid()}.tmp")
+            tmp.write_text(json.dumps({"format": JOURNAL_FORMAT, "steps": self.steps}, indent=2),
+                           encoding="utf-8")
+            os.replace(tmp, self.path)
+        except OSError:
+            # A scaffold never fails because its journal could not be written
+            pass
+
+    def completed(self, name: str, inputs: str) -> bool:
+        """True if ``name`` finished with these inputs and its outputs still exist"""
+        entry = self.steps.get(name)
+        if not entry or entry.get("status") != "ok" or entry.get("inputs") != inputs:
+            return False
+        return all((self.project_path / output).exists() for output in entry.get("outputs", []))
+
+    def has(self, name: str) -> bool:
+        return self.steps.get(name, {}).get("status") == "ok"
+
+    def record(self, name: str, status: str, inputs: str, elapsed: float,
+               outputs: Iterable[str] = ()) -> None:
+        """Persist a finished step. Nothing is written before the first step
+        finishes, so generators still see an empty project directory."""
+        with self._lock:
+            self.steps[name] = {"status": status, "inputs": inputs, "elapsed": round(elapsed, 3),
+                                "finished": time.time(), "outputs": sorted(outputs)}
+            if self.project_path.is_dir():
+                self._save()
+
+    def reset(self) -> None:
+        """Forget every step and empty the project directory (before regenerating it)"""
+        with self._lock:
+            self.steps = {}
+            if self.project_path.is_dir():
+                for entry in self.project_path.iterdir():
+                    if entry.is_dir() and not entry.is_symlink():
+                        shutil.rmtree(entry)
+                    else:
+                        entry.unlink()
+
+
+def output_list(outputs) -> List[str]:
+    """Outputs may be given as a list or as a callable evaluated after the step ran"""
+    if outputs is None:
+        return []
+    return list(outputs() if callable(outputs) else outputs)
@@ -0,0 +1,211 @@
+# commands/specs.py
+"""
+Declarative project specs.
+
+A spec says how to scaffold a kind of project, so neither the menu nor the
+headless CLI has to ask. Specs live under ``"projects"`` in
+config/config.json, or one per JSON file:
+
+    {
+      "projects": {
+        "landing": {
+          "framework": "react",
+          "description": "Marketing page",
+          "package_manager": "pnpm",
+          "base_path": "~/sites",
+          "dependencies": ["clsx", "framer-motion@11"],
+          "variables": {"title": "Launch", "accent": "sky-400"},
+          "editor": false,
+          "dev_server": true,
+          "post_steps": ["git init", "pnpm run build"]
+        }
+      }
+    }
+
+Only ``framework`` is required. ``react`` and ``next`` are built in and may
+be overridden to change the defaults of the menu's two entries. A
+``dev_server`` left out means "ask" in the menu and "start" headless.
+``post_steps`` are shell commands run in the project after it is set up.
+Relative ``base_path``s resolve against the file that defines them.
+
+Files are parsed and validated once and cached until their mtime changes.
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from utils.config import CONFIG_PATH, cached_load
+
+FRAMEWORK_PACKS = {"react": "react-tailwind", "next": "next-tailwind"}
+SPEC_KEYS = {"framework", "description", "package_manager", "base_path", "dependencies", "variables",
+             "editor", "dev_server", "prebundle", "post_steps"}
+
+
+class SpecError(ValueError):
+    """A project spec that doesn't validate"""
+
+
+class ProjectSpec:
+    """A validated project spec"""
+
+    def __init__(self, name: str, framework: str, description: str = "", package_manager: Optional[str] = None,
+                 base_path: Optional[Path] = None, dependencies: Optional[List[str]] = None,
+                 variables: Optional[Dict[str, Any]] = None, editor: bool = True,
+                 dev_server: Optional[bool] = None, prebundle: bool = True,
+                 post_steps: Optional[List[str]] = None, source: Optional[Path] = None):
+        self.name = name
+        self.framework = framework
+        self.description = description
+        self.package_manager = package_manager
+        self.base_path = base_path
+        self.dependencies = dependencies or []
+        self.variables = variables or {}
+        self.editor = editor
+        self.dev_server = dev_server
+        self.prebundle = prebundle
+        self.post_steps = post_steps or []
+        self.source = source
+
+    @property
+    def title(self) -> str:
+        return self.description or ("React" if self.framework == "react" else "Next.js") + " + Tailwind CSS"
+
+    def __repr__(self):
+        return f"<ProjectSpec {self.name} ({self.framework})>"
+
+
+BUILTIN_SPECS = {name: ProjectSpec(name, name) for name in FRAMEWORK_PACKS}
+
+
+def _check(condition: bool, where: str, message: str) -> None:
+    if not condition:
+        raise SpecError(f"{where}: {message}")
+
+
+def _string_list(value: Any) -> bool:
+    return isinstance(value, list) and all(isinstance(item, str) and item.strip() for item in value)
+
+
+def parse_spec(name: str, data: Any, root: Optional[Path] = None, source: Optional[Path] = None) -> ProjectSpec:
+    """Validate one spec object; raises SpecError naming the offending field"""
+    from templates import get_pack
+    from utils.package_manager import CHOICES
+
+    where = f"project spec {name!r}" + (f" in {source}" if source else "")
+    _check(isinstance(data, dict), where, "must be an object")
+    unknown = sorted(set(data) - SPEC_KEYS)
+    _check(not unknown, where, f"unknown field(s) {', '.join(unknown)} (known: {', '.join(sorted(SPEC_KEYS))})")
+    framework = data.get("framework")
+    _check(framework in FRAMEWORK_PACKS, where, f"'framework' must be one of {', '.join(FRAMEWORK_PACKS)}")
+
+    pm = data.get("package_manager")
+    _check(pm is None or pm in CHOICES, where, f"'package_manager' must be one of {', '.join(CHOICES)}")
+    base_path = data.get("base_path")
+    _check(base_path is None or (isinstance(base_path, str) and base_path.strip()), where,
+           "'base_path' must be a directory path")
+    if base_path is not None:
+        base_path = Path(base_path).expanduser()
+        if not base_path.is_absolute():
+            base_path = (root or Path.cwd()) / base_path
+        base_path = base_path.resolve()
+
+    dependencies = data.get("dependencies", [])
+    _check(_string_list(dependencies), where, "'dependencies' must be a list of package names")
+    post_steps = data.get("post_steps", [])
+    _check(_string_list(post_steps), where, "'post_steps' must be a list of shell commands")
+    for flag in ("editor", "prebundle"):
+        _check(isinstance(data.get(flag, True), bool), where, f"'{flag}' must be true or false")
+    dev_server = data.get("dev_server")
+    _check(dev_server is None or isinstance(dev_server, bool), where, "'dev_server' must be true, false or absent")
+    description = data.get("description", "")
+    _check(isinstance(description, str), where, "'description' must be a string")
+
+    variables = data.get("variables", {})
+    _check(isinstance(variables, dict), where, "'variables' must be an object")
+    try:
+        # Typed once here, so scaffolds get ready-to-use values
+        context = get_pack(FRAMEWORK_PACKS[framework]).context(name, variables)
+    except ValueError as e:
+        raise SpecError(f"{where}: {e}") from None
+    variables = {key: context[key] for key in variables}
+
+    return ProjectSpec(name, framework, description, pm, base_path, list(dependencies), variables,
+                       data.get("editor", True), dev_server, data.get("prebundle", True),
+                       list(post_steps), source)
+
+
+def _parse_file(path: Path) -> Dict[str, ProjectSpec]:
+    """Every spec in a config or spec file: ``{"projects": {...}}`` or a single spec object"""
+    try:
+        text = path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return {}
+    except OSError as e:
+        raise SpecError(f"Could not read {path}: {e}") from None
+    if not text.strip():
+        return {}
+    try:
+        data = json.loads(text)
+    except ValueError as e:
+        raise SpecError(f"{path} is not valid JSON: {e}") from None
+    if not isinstance(data, dict):
+        raise SpecError(f"{path} must contain a JSON object")
+
+    root = path.resolve().parent
+    if "framework" in data:
+        return {path.stem: parse_spec(path.stem, data, root, path)}
+    projects = data.get("projects", {})
+    if not isinstance(projects, dict):
+        raise SpecError(f"{path}: 'projects' must map spec names to specs")
+    return {name: parse_spec(name, spec, root, path) for name, spec in projects.items()}
+
+
+def load_specs(path: Path = CONFIG_PATH) -> Dict[str, ProjectSpec]:
+    """Built-in specs overlaid with the ones in config/config.json"""
+    return dict(BUILTIN_SPECS, **cached_load(path, _parse_file))
+
+
+def resolve_spec(ref: str, config_path: Path = CONFIG_PATH) -> ProjectSpec:
+    """A spec by name (built-in or config/config.json) or from a spec file path"""
+    specs = load_specs(config_path)
+    if ref in specs:
+        return specs[ref]
+    path = Path(ref).expanduser()
+    if path.suffix == ".json" or path.is_file():
+        if not path.is_file():
+            raise SpecError(f"Spec file not found: {path}")
+        found = cached_load(path, _parse_file)
+        if len(found) != 1:
+            raise SpecError(f"{path} must define exactly one project spec (found {len(found)})")
+        return next(iter(found.values()))
+    raise SpecError(f"Unknown project spec {ref!r} (available: {', '.join(specs)})")
+
+
+def scaffold(spec: ProjectSpec, project_name: str, base_path: Optional[Path] = None,
+             package_manager: Optional[str] = None, variables: Optional[Dict[str, Any]] = None,
+             open_editor: Optional[bool] = None, start_dev: Optional[bool] = None,
+             prebundle: Optional[bool] = None, ask: Callable[[str], str] = input,
+             **options) -> Optional[Path]:
+    """Run the spec's scaffolder; explicit arguments override the spec's values.
+
+    ``options`` (use_cache, resume, logger, ...) go straight to the scaffolder.
+    """
+    if spec.framework == "react":
+        from commands.react_tailwind import create_react_app as create
+        options["prebundle"] = spec.prebundle if prebundle is None else prebundle
+    else:
+        from commands.next_tailwind import create_nextjs_app as create
+
+    return create(
+        project_name,
+        base_path=base_path if base_path is not None else spec.base_path,
+        open_editor=spec.editor if open_editor is None else open_editor,
+        start_dev=(spec.dev_server is not False) if start_dev is None else start_dev,
+        package_manager=package_manager or spec.package_manager,
+        variables=dict(spec.variables, **(variables or {})),
+        extra_packages=spec.dependencies,
+        post_steps=spec.post_steps,
+        ask=ask,
+        **options,
+    )
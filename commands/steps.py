@@ -0,0 +1,218 @@
+# commands/steps.py
+"""
+Step-graph executor for scaffolds.
+
+A scaffold is declared as named steps with dependencies. Steps whose
+dependencies are met run concurrently on a small thread pool (file writes
+and opening the editor overlap the npm install), installs requested by
+several steps are merged into a single one, and every step is timed.
+
+With a journal attached, finished steps are recorded in the project and a
+resumed run skips the ones whose inputs and outputs are unchanged.
+"""
+
+import shutil
+import subprocess
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from commands.journal import StepJournal, inputs_hash, output_list
+from utils import tracing
+from utils.logger import Logger
+
+OK = "ok"
+FAILED = "failed"
+SKIPPED = "skipped"
+RESUMED = "resumed"
+
+
+class StepResult:
+    def __init__(self, name: str, status: str, elapsed: float = 0.0, error: Optional[str] = None):
+        self.name = name
+        self.status = status
+        self.elapsed = elapsed
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        return self.status in (OK, RESUMED)
+
+    def __repr__(self):
+        return f"StepResult({self.name!r}, {self.status!r}, {self.elapsed:.3f})"
+
+
+class Step:
+    def __init__(self, name: str, action: Callable[[], bool], requires: Iterable[str] = (),
+                 inputs: Any = None, outputs: Any = None, journal: bool = True):
+        self.name = name
+        self.action = action
+        self.requires = list(requires)
+        # JSON-able (or a callable returning it); a change makes a resumed run redo the step
+        self.inputs = inputs
+        # Project-relative paths the step leaves behind (list or callable)
+        self.outputs = outputs
+        self.journal = journal
+
+    def inputs_hash(self) -> str:
+        inputs = self.inputs() if callable(self.inputs) else self.inputs
+        return inputs_hash([self.name, inputs])
+
+
+def _package_name(spec: str) -> str:
+    """``@scope/pkg@^1`` -> ``@scope/pkg``"""
+    at = spec.find("@", 1)
+    return spec[:at] if at > 0 else spec
+
+
+class StepGraph:
+    """Dependency graph of scaffold steps"""
+
+    def __init__(self, logger: Optional[Logger] = None, journal: Optional[StepJournal] = None):
+        self.logger = logger or Logger()
+        self.journal = journal
+        self.steps: Dict[str, Step] = {}
+        self._install_packages: Dict[str, List[str]] = {}
+
+    def add(self, name: str, action: Callable[[], bool], requires: Iterable[str] = (),
+            inputs: Any = None, outputs: Any = None, journal: bool = True) -> str:
+        """Add a step; its action returns True on success (None counts as success).
+
+        ``inputs`` and ``outputs`` feed the journal; ``journal=False`` marks
+        steps that always run (probes, editor, dev server).
+        """
+        if name in self.steps:
+            raise ValueError(f"Duplicate step: {name}")
+        requires = list(requires)
+        for dep in requires:
+            if dep not in self.steps:
+                raise ValueError(f"Step {name!r} requires unknown step {dep!r}")
+        self.steps[name] = Step(name, action, requires, inputs, outputs, journal)
+        return name
+
+    def add_install(self, packages: Iterable[str], runner: Callable[[List[str]], bool],
+                    requires: Iterable[str] = (), name: str = "install", inputs: Any = None) -> str:
+        """Request an install; repeated requests merge into one install step.
+
+        ``runner`` receives the merged package list (possibly empty, meaning
+        a plain install of package.json) when the step runs.
+        """
+        requires = list(requires)
+        if name not in self.steps:
+            merged = self._install_packages[name] = []
+            self.add(name, lambda: runner(list(merged)), requires,
+                     inputs=lambda: [inputs, sorted(merged)],
+                     outputs=lambda: ["node_modules"] + [f"node_modules/{_package_name(p)}/package.json"
+                                                         for p in merged])
+        else:
+            for dep in requires:
+                if dep not in self.steps or self._depends_on(dep, name):
+                    raise ValueError(f"Cannot merge install after dependent step {dep!r}")
+                if dep not in self.steps[name].requires:
+                    self.steps[name].requires.append(dep)
+        merged = self._install_packages[name]
+        merged.extend(p for p in packages if p not in merged)
+        return name
+
+    def _depends_on(self, step: str, target: str) -> bool:
+        stack = [step]
+        while stack:
+            current = stack.pop()
+            if current == target:
+                return True
+            stack.extend(self.steps[current].requires)
+        return False
+
+    def _execute(self, step: Step) -> StepResult:
+        start = time.perf_counter()
+        with tracing.span(step.name, cat="step") as span:
+            try:
+                # Actions return a bool, a CommandResult or None (= success)
+                value = step.action()
+                ok = value is None or bool(value)
+                result = StepResult(step.name, OK if ok else FAILED, time.perf_counter() - start)
+            except Exception as e:
+                self.logger.error(f"❌ Step '{step.name}' failed: {e}")
+                result = StepResult(step.name, FAILED, time.perf_counter() - start, str(e))
+            span.set(status=result.status)
+        if self.journal is not None and step.journal:
+            outputs = output_list(step.outputs) if result.ok else []
+            self.journal.record(step.name, result.status, step.inputs_hash(), result.elapsed, outputs)
+        return result
+
+    def _can_resume(self, step: Step, results: Dict[str, StepResult]) -> bool:
+        """A journaled step is skipped if it finished before and nothing it needs was redone"""
+        if self.journal is None or not step.journal:
+            return False
+        if any(results[dep].status != RESUMED for dep in step.requires if self.steps[dep].journal):
+            return False
+        return self.journal.completed(step.name, step.inputs_hash())
+
+    def run(self, max_workers: int = 4) -> Dict[str, StepResult]:
+        """Run all steps, overlapping independent ones; returns results by name"""
+        pending = dict(self.steps)
+        results: Dict[str, StepResult] = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as pool, tracing.span("steps", cat="graph"):
+            try:
+                self._schedule(pool, pending, results)
+            except KeyboardInterrupt:
+                # Stop the children so the worker threads can return
+                from utils.runner import default_runner
+                default_runner().cancel_all()
+                raise
+        return {name: results[name] for name in self.steps}
+
+    def _schedule(self, pool: ThreadPoolExecutor, pending: Dict[str, Step],
+                  results: Dict[str, StepResult]) -> None:
+        running = {}
+        while pending or running:
+            resolved = False
+            for name, step in list(pending.items()):
+                if any(dep in results and not results[dep].ok for dep in step.requires):
+                    results[name] = StepResult(name, SKIPPED)
+                    del pending[name]
+                    resolved = True
+                elif all(dep in results for dep in step.requires):
+                    if self._can_resume(step, results):
+                        results[name] = StepResult(name, RESUMED)
+                        with tracing.span(name, cat="step", status=RESUMED):
+                            pass
+                        resolved = True
+                    else:
+                        running[pool.submit(tracing.propagate(self._execute), step)] = name
+                    del pending[name]
+            if not running:
+                if resolved:
+                    continue
+                break
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                results[name] = future.result()
+
+    def report(self, results: Dict[str, StepResult]) -> None:
+        """Log per-step timings"""
+        summary = ", ".join(
+            f"{r.name} {r.elapsed:.1f}s" if r.status == OK else f"{r.name} {r.status}"
+            for r in results.values()
+        )
+        self.logger.log(f"⏱  Steps: {summary}")
+
+
+def probe_toolchain(logger: Logger, tools: Iterable[str] = ("node", "npm")) -> bool:
+    """Log the versions of the tools a scaffold relies on; False if one is missing"""
+    ok = True
+    for tool in tools:
+        path = shutil.which(tool)
+        if path is None:
+            logger.warning(f"⚠️ {tool} not found on PATH")
+            ok = False
+            continue
+        try:
+            with tracing.span(f"{tool} --version", cat="command", command=f"{path} --version"):
+                version = subprocess.run([path, "--version"], capture_output=True, text=True,
+                                         timeout=15).stdout.strip()
+        except (OSError, subprocess.SubprocessError):
+            version = "unknown"
+        logger.debug(f"{tool} {version}")
+    return ok
@@ -0,0 +1,256 @@
+# commands/upgrade.py
+"""
+Incremental template upgrades.
+
+Every scaffold records ``<project>/.shnk/template.json``: the template pack,
+its variables, a SHA-256 per file the pack wrote and the dependency specs
+it installed. ``shnk upgrade`` renders the current pack with the same
+variables and compares three hashes per file (recorded, on disk, new):
+
+  unchanged on disk     rewritten with the new template ("updated")
+  edited by the user    left alone, new version saved as ``<file>.shnk-new``
+                        (once: it becomes the baseline for the next upgrade)
+  new in the template   written unless a file of that name already exists
+  dropped by template   deleted if untouched, kept otherwise
+
+Dependencies are reinstalled only when the template's specs changed.
+"""
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from utils.logger import Logger
+
+MANIFEST_PATH = Path(".shnk") / "template.json"
+MANIFEST_FORMAT = 1
+CONFLICT_SUFFIX = ".shnk-new"
+DEP_SECTIONS = ("dependencies", "devDependencies")
+
+
+def _sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _file_sha256(path: Path) -> Optional[str]:
+    try:
+        return _sha256(path.read_bytes())
+    except OSError:
+        return None
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    staging = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    staging.write_bytes(data)
+    os.replace(staging, path)
+
+
+def dependency_spec(pack, pm, typescript: bool) -> Dict[str, Dict[str, str]]:
+    """package.json specs the template installs: its pinned lock's, else the pack's own"""
+    from utils.lockfiles import find_lock
+
+    lock = find_lock(pack, pm, typescript)
+    if lock is not None:
+        data = json.loads(lock.package_json.read_text(encoding="utf-8"))
+        return {section: dict(data[section]) for section in DEP_SECTIONS if data.get(section)}
+    return {"dependencies": dict(pack.dependencies)} if pack.dependencies else {}
+
+
+def load_manifest(project_path: Path) -> Optional[Dict[str, Any]]:
+    try:
+        return json.loads((Path(project_path) / MANIFEST_PATH).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def save_manifest(project_path: Path, manifest: Dict[str, Any]) -> None:
+    data = json.dumps(dict(manifest, format=MANIFEST_FORMAT), indent=2, sort_keys=True) + "\n"
+    _write_atomic(Path(project_path) / MANIFEST_PATH, data.encode("utf-8"))
+
+
+def record_manifest(pack, project_path: Path, context: Dict[str, Any], pm) -> Dict[str, Any]:
+    """Hash the pack's files as written into the project and save the manifest"""
+    project_path = Path(project_path)
+    files = {}
+    for dest, _ in pack.files(None, context):
+        digest = _file_sha256(project_path / dest)
+        if digest is not None:
+            files[dest] = digest
+    manifest = {
+        "pack": pack.name,
+        "digest": pack.digest(),
+        "project_name": context["project_name"],
+        "variables": {name: value for name, value in context.items() if name != "project_name"},
+        "package_manager": pm.name,
+        "files": files,
+        "dependencies": dependency_spec(pack, pm, bool(context.get("typescript"))),
+        "recorded": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+    save_manifest(project_path, manifest)
+    return manifest
+
+
+def plan_files(pack, project_path: Path, context: Dict[str, Any],
+               recorded: Dict[str, str]) -> List[Dict[str, Any]]:
+    """One action per file: current, customized, updated, added, removed, kept or conflict"""
+    project_path = Path(project_path)
+    actions = []
+    for dest, sources in pack.files(None, context):
+        data = pack.render(sources, context)
+        new, old = _sha256(data), recorded.get(dest)
+        disk = _file_sha256(project_path / dest)
+        if disk == new:
+            action, note = "current", None
+        elif old == new:
+            # The template didn't change this file since it was recorded
+            action, note = "customized", "edited locally" if disk else "deleted locally"
+        elif old is None:
+            action, note = ("added", None) if disk is None else ("conflict", "exists but was not written by SHNK")
+        elif disk == old:
+            action, note = "updated", None
+        elif disk is None:
+            action, note = "kept", "deleted locally"
+        else:
+            action, note = "conflict", "edited locally"
+        actions.append({"path": dest, "action": action, "note": note, "hash": new, "data": data})
+
+    planned = {entry["path"] for entry in actions}
+    for dest, old in recorded.items():
+        if dest in planned:
+            continue
+        disk = _file_sha256(project_path / dest)
+        if disk is None or disk == old:
+            actions.append({"path": dest, "action": "removed", "note": None, "hash": None, "data": None})
+        else:
+            actions.append({"path": dest, "action": "kept", "note": "no longer in the template, edited locally",
+                            "hash": None, "data": None})
+    return actions
+
+
+def apply_dependencies(project_path: Path, old: Dict[str, Dict[str, str]],
+                       new: Dict[str, Dict[str, str]]) -> Optional[List[str]]:
+    """Bring package.json in line with the new specs.
+
+    Returns None when nothing changed, else the packages to install by name
+    (``latest`` specs; empty when a plain install is enough).
+    """
+    path = Path(project_path) / "package.json"
+    package = json.loads(path.read_text(encoding="utf-8"))
+    by_name = {name: section for section in DEP_SECTIONS for name in package.get(section, {})}
+    changed, install = False, []
+
+    for section, specs in new.items():
+        for name, spec in specs.items():
+            if old.get(section, {}).get(name) == spec:
+                continue
+            if spec == "latest":
+                # The package manager picks and pins the version
+                if name not in by_name:
+                    install.append(name)
+                continue
+            package.setdefault(by_name.get(name, section), {})[name] = spec
+            changed = True
+    for section, specs in old.items():
+        for name, spec in specs.items():
+            if name in new.get(section, {}):
+                continue
+            # Only drop what the template added and the user left alone
+            if package.get(section, {}).get(name) == spec:
+                del package[section][name]
+                changed = True
+
+    if not changed and not install:
+        return None
+    if changed:
+        _write_atomic(path, (json.dumps(package, indent=2) + "\n").encode("utf-8"))
+    return install
+
+
+def upgrade_project(project_path: Path, package_manager=None, dry_run: bool = False,
+                    install: bool = True, logger: Optional[Logger] = None) -> Dict[str, Any]:
+    """Upgrade a project's template files in place; returns a summary"""
+    from templates import get_pack
+    from utils.installer import install_packages
+    from utils.package_manager import resolve
+
+    logger = logger or Logger()
+    project_path = Path(project_path).resolve()
+    manifest = load_manifest(project_path)
+    if manifest is None:
+        raise ValueError(f"{project_path} has no {MANIFEST_PATH.as_posix()}; "
+                         "only projects scaffolded by SHNK can be upgraded")
+
+    pack = get_pack(manifest["pack"])
+    # Variables the pack no longer declares are dropped, new ones take their defaults
+    variables = {name: value for name, value in manifest.get("variables", {}).items()
+                 if name in pack.variables}
+    context = pack.context(manifest.get("project_name", project_path.name), variables)
+    pm = resolve(package_manager or manifest.get("package_manager"))
+    recorded = manifest.get("files", {})
+    actions = plan_files(pack, project_path, context, recorded)
+
+    new_specs = dependency_spec(pack, pm, bool(context.get("typescript")))
+    old_specs = manifest.get("dependencies", {})
+    summary = {"path": str(project_path), "pack": pack.name, "dry_run": dry_run,
+               "files": [{key: entry[key] for key in ("path", "action", "note")} for entry in actions],
+               "dependencies_changed": new_specs != old_specs, "installed": None}
+
+    logger.log(f"🔄 Upgrading {project_path.name} to the current {pack.name} template"
+               f"{' (dry run)' if dry_run else ''}")
+    files = dict(recorded)
+    for entry in actions:
+        target = project_path / entry["path"]
+        action = entry["action"]
+        if action in ("current", "customized"):
+            continue
+        if action in ("updated", "added"):
+            logger.success(f"✅ {entry['path']} {action}")
+            if not dry_run:
+                _write_atomic(target, entry["data"])
+            files[entry["path"]] = entry["hash"]
+        elif action == "removed":
+            logger.log(f"🗑️ {entry['path']} removed (no longer in the template)")
+            if not dry_run:
+                target.unlink(missing_ok=True)
+            files.pop(entry["path"], None)
+        elif action == "kept":
+            logger.warning(f"⚠️ {entry['path']} kept ({entry['note']})")
+            if entry["hash"] is None:
+                files.pop(entry["path"], None)
+            else:
+                files[entry["path"]] = entry["hash"]
+        else:
+            logger.warning(f"⚠️ Conflict: {entry['path']} {entry['note']}; new version "
+                           f"{'would be ' if dry_run else ''}saved as {entry['path']}{CONFLICT_SUFFIX}")
+            if not dry_run:
+                _write_atomic(target.with_name(target.name + CONFLICT_SUFFIX), entry["data"])
+            files[entry["path"]] = entry["hash"]
+
+    ok = True
+    if summary["dependencies_changed"]:
+        logger.log("📦 Template dependencies changed.")
+        if not dry_run:
+            packages = apply_dependencies(project_path, old_specs, new_specs)
+            if packages is not None and install:
+                ok = bool(install_packages(packages, project_path, step="Installing dependencies",
+                                           step_key=f"upgrade:install:{pm.name}", logger=logger,
+                                           package_manager=pm))
+                summary["installed"] = ok
+            elif packages is not None:
+                logger.log(f"💡 Run '{pm.install()}' to install the updated dependencies.")
+    elif all(entry["action"] in ("current", "customized") for entry in actions):
+        logger.success("✅ Already up to date.")
+
+    if not dry_run:
+        save_manifest(project_path, dict(
+            manifest, digest=pack.digest(), variables={k: v for k, v in context.items() if k != "project_name"},
+            package_manager=pm.name, files=files,
+            dependencies=new_specs if ok else old_specs, upgraded=time.strftime("%Y-%m-%dT%H:%M:%S"),
+        ))
+    summary["conflicts"] = sum(entry["action"] == "conflict" for entry in actions)
+    summary["ok"] = ok
+    return summary
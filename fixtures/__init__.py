@@ -0,0 +1 @@
+"""Offline fixtures (stub node toolchain) for exercising SHNK without a network"""
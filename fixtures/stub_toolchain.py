@@ -0,0 +1,468 @@
+# fixtures/stub_toolchain.py
+"""
+Stub node toolchain for exercising SHNK offline.
+
+``install_stubs(dir)`` writes fake ``node``, ``npm``, ``npx``, ``pnpm``,
+``yarn``, ``bun``, ``bunx`` and ``code`` executables. Each one records its
+argv (and the registry it was pointed at) as a JSON line in
+``$SHNK_STUB_LOG`` and produces the files a real
+generator would (a Vite or Next.js app) and a node_modules tree for the
+scaffolders to carry on. ``$SHNK_STUB_FAIL`` (e.g. ``install,add``) makes
+installs fail.
+
+For benchmarks, ``$SHNK_STUB_DELAYS`` (e.g. ``create=1.5,install=4,code=0.2``)
+makes each kind of call sleep like the real tool (kinds: create, install,
+ci, exec, view, code, version, dev, optimize), and ``$SHNK_STUB_PACKAGES`` adds that
+many transitive packages to every install. ``run dev`` serves the project
+directory over HTTP on ``--port`` (or ``$PORT``) until it is killed, and
+``node node_modules/vite/bin/vite.js optimize`` fills ``node_modules/.vite``.
+
+    python -m fixtures.stub_toolchain check
+
+runs both scaffolders once per package manager against the stubs and
+verifies the exact command lines SHNK emits. It then refreshes pinned locks
+into a copy of the template packs and checks that scaffolds install them
+with the frozen command (npm ci; yarn --frozen-lockfile, or --immutable for
+a lock recording ``packageManager: yarn@4``). Last, it serves a packed
+tarball from the built-in offline registry, checks that paths outside the
+mirror are refused, and scaffolds in offline mode.
+"""
+
+import json
+import os
+import stat
+import sys
+import tempfile
+from pathlib import Path
+from typing import Dict, List
+
+TOOLS = ("node", "npm", "npx", "pnpm", "yarn", "bun", "bunx", "code")
+
+STUB_SOURCE = r'''
+import json, os, sys
+from pathlib import Path
+
+tool = os.environ.pop("SHNK_STUB_TOOL", None) or Path(sys.argv[0]).name.split(".")[0]
+args = sys.argv[1:]
+log = os.environ.get("SHNK_STUB_LOG")
+if log:
+    with open(log, "a") as f:
+        f.write(json.dumps({"tool": tool, "argv": [tool] + args, "cwd": os.getcwd(),
+                            "registry": os.environ.get("npm_config_registry")}) + "\n")
+
+import time
+
+delays = {}
+for item in os.environ.get("SHNK_STUB_DELAYS", "").split(","):
+    kind, _, seconds = item.partition("=")
+    if seconds:
+        delays[kind.strip()] = float(seconds)
+
+def pause(kind):
+    if delays.get(kind):
+        time.sleep(delays[kind])
+
+VITE_FILES = {
+    "index.html": '<!doctype html>\n<html lang="en">\n  <body>\n    <div id="root"></div>\n'
+                  '    <script type="module" src="/src/main.jsx"></script>\n  </body>\n</html>\n',
+    "vite.config.js": "import { defineConfig } from 'vite'\nimport react from '@vitejs/plugin-react'\n\n"
+                      "export default defineConfig({\n  plugins: [react()],\n})\n",
+    "eslint.config.js": "export default []\n",
+    ".gitignore": "node_modules\ndist\n",
+    "README.md": "# React + Vite\n",
+    "public/vite.svg": "<svg xmlns='http://www.w3.org/2000/svg'/>\n",
+    "src/main.jsx": "import { createRoot } from 'react-dom/client'\nimport './index.css'\n"
+                    "import App from './App.jsx'\n\ncreateRoot(document.getElementById('root')).render(<App />)\n",
+    "src/App.jsx": "export default function App() {\n  return <h1>Vite + React</h1>\n}\n",
+    "src/App.css": "#root { margin: 0 auto; }\n",
+    "src/index.css": ":root { font-family: system-ui; }\n",
+    "src/assets/react.svg": "<svg xmlns='http://www.w3.org/2000/svg'/>\n",
+}
+
+NEXT_FILES = {
+    "next.config.ts": "import type { NextConfig } from 'next'\n\nconst nextConfig: NextConfig = {}\n\n"
+                      "export default nextConfig\n",
+    "tsconfig.json": json.dumps({"compilerOptions": {"strict": True, "paths": {"@/*": ["./src/*"]}}}, indent=2),
+    "next-env.d.ts": "/// <reference types=\"next\" />\n",
+    "postcss.config.mjs": "export default { plugins: ['@tailwindcss/postcss'] }\n",
+    "eslint.config.mjs": "export default []\n",
+    ".gitignore": "node_modules\n.next\n",
+    "README.md": "# Next.js app\n",
+    "public/next.svg": "<svg xmlns='http://www.w3.org/2000/svg'/>\n",
+    "public/vercel.svg": "<svg xmlns='http://www.w3.org/2000/svg'/>\n",
+    "src/app/layout.tsx": "import './globals.css'\n\nexport default function RootLayout({ children }) {\n"
+                          "  return <html lang=\"en\"><body>{children}</body></html>\n}\n",
+    "src/app/page.tsx": "export default function Home() {\n  return <main>Next.js</main>\n}\n",
+    "src/app/globals.css": "@import \"tailwindcss\";\n",
+}
+
+def make_project(name, next_app=False):
+    root = Path(name)
+    root.mkdir(parents=True, exist_ok=True)
+    for rel, text in (NEXT_FILES if next_app else VITE_FILES).items():
+        (root / rel).parent.mkdir(parents=True, exist_ok=True)
+        (root / rel).write_text(text)
+    if next_app:
+        manifest = {"name": root.name, "private": True,
+                    "scripts": {"dev": "next dev --turbopack", "build": "next build"},
+                    "dependencies": {"next": "15.0.0", "react": "^19.0.0", "react-dom": "^19.0.0"},
+                    "devDependencies": {"typescript": "^5", "tailwindcss": "^4", "@tailwindcss/postcss": "^4"}}
+    else:
+        manifest = {"name": root.name, "private": True, "type": "module",
+                    "scripts": {"dev": "vite", "build": "vite build"},
+                    "dependencies": {"react": "^19.0.0", "react-dom": "^19.0.0"},
+                    "devDependencies": {"vite": "^6.0.0", "@vitejs/plugin-react": "^4.3.0"}}
+    (root / "package.json").write_text(json.dumps(manifest, indent=2))
+
+def write_package(name, version):
+    target = Path("node_modules") / name
+    (target / "lib").mkdir(parents=True, exist_ok=True)
+    (target / "package.json").write_text(json.dumps({"name": name, "version": version, "main": "index.js"}))
+    (target / "index.js").write_text("module.exports = require('./lib/main.js')\n")
+    (target / "lib" / "main.js").write_text("module.exports = function () { return %r }\n" % name)
+    (target / "README.md").write_text(f"# {name}\n")
+    if name == "vite":
+        (target / "bin").mkdir(exist_ok=True)
+        (target / "bin" / "vite.js").write_text("#!/usr/bin/env node\n")
+
+def optimize():
+    # Like Vite: the cache is keyed on the project root and the lockfile
+    import hashlib
+    lockfiles = [Path(f) for f in LOCKFILES.values() if Path(f).is_file()]
+    digest = hashlib.sha256(os.getcwd().encode())
+    for lockfile in lockfiles:
+        digest.update(lockfile.read_bytes())
+    deps = Path("node_modules") / ".vite" / "deps"
+    metadata = deps / "_metadata.json"
+    try:
+        if json.loads(metadata.read_text())["hash"] == digest.hexdigest()[:8]:
+            print("Hash is consistent. Skipping. Use --force to override.")
+            return
+    except (OSError, ValueError, KeyError):
+        pass
+    pause("optimize")
+    deps.mkdir(parents=True, exist_ok=True)
+    for dep in ("react", "react-dom", "react-dom_client", "react_jsx-dev-runtime"):
+        (deps / f"{dep}.js").write_text(f"// pre-bundled {dep}\n" * 64)
+    metadata.write_text(json.dumps({"hash": digest.hexdigest()[:8], "optimized": ["react", "react-dom"]}))
+    print("Optimized dependencies: react, react-dom")
+
+LOCKFILES = {"npm": "package-lock.json", "pnpm": "pnpm-lock.yaml", "yarn": "yarn.lock", "bun": "bun.lock"}
+
+def install(packages, frozen=False):
+    manifest = json.loads(Path("package.json").read_text()) if Path("package.json").is_file() else {}
+    lockfile = Path(LOCKFILES.get(tool, "package-lock.json"))
+    if frozen and not lockfile.is_file():
+        print(f"{tool} error: frozen install needs {lockfile}", file=sys.stderr)
+        sys.exit(1)
+    deps = manifest.setdefault("dependencies", {})
+    for package in packages:
+        deps.setdefault(package, "^0.0.0-stub")
+    installed = list(deps) + list(manifest.get("devDependencies", {}))
+    installed += [f"stub-transitive-{i}" for i in range(int(os.environ.get("SHNK_STUB_PACKAGES", "0")))]
+    for package in installed:
+        write_package(package, "0.0.0-stub")
+    if manifest:
+        Path("package.json").write_text(json.dumps(manifest, indent=2))
+    if not frozen:
+        lockfile.write_text(json.dumps({"name": manifest.get("name"), "lockfileVersion": 3,
+                                        "packages": {"": {"name": manifest.get("name")}}}))
+    print(f"added {len(installed)} packages in 0s")
+
+# SHNK_STUB_FAIL=install,add makes those subcommands fail (after doing half the work)
+failing = [f for f in os.environ.get("SHNK_STUB_FAIL", "").split(",") if f]
+
+if "--version" in args:
+    pause("version")
+    print("0.0.0-stub")
+elif tool == "node" and args[1:2] == ["optimize"]:
+    optimize()
+elif tool == "code":
+    pause("code")
+elif tool in ("npm", "pnpm", "yarn", "bun") and args[:1] == ["create"]:
+    pause("create")
+    next_app = args[1].startswith("next-app")
+    make_project(args[2], next_app)
+    if next_app and "--skip-install" not in args:
+        os.chdir(args[2])
+        pause("install")
+        install([])
+elif tool in ("npm", "pnpm", "yarn", "bun") and args[:2] == ["run", "dev"]:
+    import http.server
+    port = int(args[args.index("--port") + 1]) if "--port" in args else int(os.environ.get("PORT", 5173))
+    pause("dev")
+    try:
+        server = http.server.ThreadingHTTPServer(("127.0.0.1", port), http.server.SimpleHTTPRequestHandler)
+    except OSError:
+        print(f"Error: Port {port} is already in use", flush=True)
+        sys.exit(1)
+    server.RequestHandlerClass.log_message = lambda self, *a: print("GET", self.path, flush=True)
+    print(f"  Local:   http://localhost:{port}/", flush=True)
+    server.serve_forever()
+elif tool == "npm" and args[:1] == ["view"]:
+    pause("view")
+    print("1.2.3")
+elif tool in ("npx", "bunx") or args[:1] == ["dlx"]:
+    pause("exec")
+    rest = args[1:] if args[:1] == ["dlx"] else args
+    if rest and rest[0].startswith("create-"):
+        make_project(rest[1], rest[0].startswith("create-next-app"))
+elif args[:1] in (["install"], ["add"], ["i"], ["ci"]):
+    frozen = args[0] == "ci" or "--frozen-lockfile" in args or "--immutable" in args
+    pause("ci" if frozen else "install")
+    if args[0] in failing:
+        Path("node_modules").mkdir(exist_ok=True)
+        print("npm error network request failed", file=sys.stderr)
+        sys.exit(1)
+    install([a for a in args[1:] if not a.startswith("-")], frozen)
+'''
+
+
+def install_stubs(directory: Path) -> Path:
+    """Write the stub executables into ``directory`` and return it"""
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    source = directory / "_stub.py"
+    source.write_text(STUB_SOURCE)
+    for tool in TOOLS:
+        if os.name == "nt":
+            (directory / f"{tool}.cmd").write_text(
+                f'@set "SHNK_STUB_TOOL={tool}" & "{sys.executable}" "{source}" %*\n')
+            continue
+        path = directory / tool
+        path.write_text(f"#!{sys.executable}\n" + STUB_SOURCE)
+        path.chmod(path.stat().st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+    return directory
+
+
+def stub_env(directory: Path, log_path: Path) -> Dict[str, str]:
+    """Environment with the stubs first on PATH and argv logging enabled"""
+    return {
+        "PATH": str(directory) + os.pathsep + os.environ.get("PATH", ""),
+        "SHNK_STUB_LOG": str(log_path),
+    }
+
+
+def read_log(log_path: Path) -> List[List[str]]:
+    """Recorded command lines, minus version probes"""
+    try:
+        lines = Path(log_path).read_text().splitlines()
+    except OSError:
+        return []
+    calls = [json.loads(line)["argv"] for line in lines if line.strip()]
+    return [argv for argv in calls if "--version" not in argv]
+
+
+NEXT_FLAGS = ["--typescript", "--tailwind", "--eslint", "--app", "--src-dir", "--turbo",
+              "--import-alias", "@/*"]
+
+VITE_OPTIMIZE = ["node", "node_modules/vite/bin/vite.js", "optimize"]
+
+EXPECTED = {
+    "npm": {
+        "react": [["npm", "create", "vite@latest", "app", "--", "--template", "react"],
+                  ["code", "."],
+                  ["npm", "install", "tailwindcss", "@tailwindcss/vite"],
+                  VITE_OPTIMIZE],
+        "next": [["npm", "create", "next-app@latest", "app", "--", *NEXT_FLAGS, "--use-npm"],
+                 ["code", "."]],
+    },
+    "pnpm": {
+        "react": [["pnpm", "create", "vite", "app", "--template", "react"],
+                  ["code", "."],
+                  ["pnpm", "add", "tailwindcss", "@tailwindcss/vite"],
+                  VITE_OPTIMIZE],
+        "next": [["pnpm", "create", "next-app", "app", *NEXT_FLAGS, "--use-pnpm"],
+                 ["code", "."]],
+    },
+    "yarn": {
+        "react": [["yarn", "create", "vite", "app", "--template", "react"],
+                  ["code", "."],
+                  ["yarn", "add", "tailwindcss", "@tailwindcss/vite"],
+                  VITE_OPTIMIZE],
+        "next": [["yarn", "create", "next-app", "app", *NEXT_FLAGS, "--use-yarn"],
+                 ["code", "."]],
+    },
+    "bun": {
+        "react": [["bun", "create", "vite", "app", "--template", "react"],
+                  ["code", "."],
+                  ["bun", "add", "tailwindcss", "@tailwindcss/vite"],
+                  VITE_OPTIMIZE],
+        "next": [["bun", "create", "next-app", "app", *NEXT_FLAGS, "--use-bun"],
+                 ["code", "."]],
+    },
+}
+
+
+# (package manager, framework, packageManager written into the lock, frozen install)
+LOCKED = [
+    ("npm", "react", None, ["npm", "ci"]),
+    ("npm", "next", None, ["npm", "ci"]),
+    ("yarn", "react", None, ["yarn", "install", "--frozen-lockfile"]),
+    ("yarn", "react", "yarn@4.5.0", ["yarn", "install", "--immutable"]),
+]
+
+
+def check_locked(tmp: Path, stubs: Path) -> int:
+    """Scaffold from refreshed template locks and check the frozen installs; returns failures"""
+    import shutil
+
+    from commands import next_tailwind, react_tailwind
+    from templates import get_pack
+    from utils.lockfiles import find_lock
+    from utils.package_manager import resolve
+
+    modules = {"react": react_tailwind, "next": next_tailwind}
+    scaffolders = {"react": react_tailwind.create_react_app, "next": next_tailwind.create_nextjs_app}
+    failures = 0
+    for pm, framework, package_manager, frozen in LOCKED:
+        module = modules[framework]
+        pack = get_pack(module.TEMPLATE_PACK)
+        original = pack.root
+        # Locks are written into the pack, so work on a copy of the templates
+        # (with _shared, where packs get their common fragments)
+        copy = tmp / "packs" / f"{pm}-{framework}-{package_manager or 'default'}"
+        shutil.copytree(original.parent, copy, ignore=shutil.ignore_patterns("locks", "__pycache__"))
+        pack.root = copy / original.name
+        try:
+            os.environ.update(stub_env(stubs, tmp / "refresh.log"))
+            ok = module.refresh_locks(pm)
+            lock = find_lock(pack, resolve(pm), framework == "next")
+            ok = ok and lock is not None
+            if ok and package_manager:
+                manifest = json.loads(lock.package_json.read_text())
+                manifest["packageManager"] = package_manager
+                lock.package_json.write_text(json.dumps(manifest, indent=2))
+
+            log = tmp / f"locked-{pm}-{framework}-{package_manager or 'default'}.log"
+            os.environ.update(stub_env(stubs, log))
+            base = log.with_suffix("")
+            base.mkdir()
+            ok = ok and scaffolders[framework]("app", base_path=base, start_dev=False,
+                                               use_cache=False, package_manager=pm)
+            calls = read_log(log)
+            pinned = any(f"@{lock.version}" in " ".join(argv) for argv in calls) if lock else False
+            ok = bool(ok) and pinned and frozen in calls and (base / "app" / resolve(pm).lockfile).is_file()
+        finally:
+            pack.root = original
+        failures += not ok
+        label = f"{framework} locked" + (f" ({package_manager})" if package_manager else "")
+        print(f"{'OK  ' if ok else 'FAIL'} {pm:<5} {label}")
+        if not ok:
+            print(f"     expected {frozen} in: {calls}")
+    return failures
+
+
+def _pack(name: str, version: str) -> bytes:
+    """A minimal ``npm pack`` tarball"""
+    import io
+    import tarfile
+
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w:gz") as tar:
+        data = json.dumps({"name": name, "version": version}).encode()
+        info = tarfile.TarInfo("package/package.json")
+        info.size = len(data)
+        tar.addfile(info, io.BytesIO(data))
+    return buffer.getvalue()
+
+
+def _get(url: str):
+    """(status, body) of a GET, HTTP errors included"""
+    import urllib.error
+    import urllib.request
+
+    try:
+        with urllib.request.urlopen(url, timeout=10) as response:
+            return response.status, response.read()
+    except urllib.error.HTTPError as e:
+        return e.code, b""
+
+
+def check_offline(tmp: Path, stubs: Path) -> int:
+    """Serve a packed tarball from the built-in registry and scaffold offline; returns failures"""
+    from commands.react_tailwind import create_react_app
+    from utils.mirror import Mirror, MirrorRegistry, offline_registry
+
+    failures = 0
+    tarball = tmp / "stub-pkg-1.0.0.tgz"
+    tarball.write_bytes(_pack("stub-pkg", "1.0.0"))
+    secret = tmp / "secret.tgz"
+    secret.write_bytes(b"outside the mirror")
+    mirror = Mirror()
+    mirror.add_file(tarball)
+
+    with MirrorRegistry(mirror) as url:
+        status, body = _get(url + "stub-pkg")
+        doc = json.loads(body) if status == 200 else {}
+        dist = doc.get("versions", {}).get("1.0.0", {}).get("dist", {})
+        served = _get(dist["tarball"]) if dist.get("tarball") else (None, b"")
+        refused = [path for path in ("stub-pkg/-/../../../secret.tgz", f"stub-pkg/-/{secret}",
+                                     f"x/-/{secret}", "/-/stub-pkg-1.0.0.tgz", "stub-pkg/-/")
+                   if _get(url + path.lstrip("/"))[0] != 404]
+    ok = served == (200, tarball.read_bytes()) and not refused
+    failures += not ok
+    print(f"{'OK  ' if ok else 'FAIL'} {'npm':<5} offline registry")
+    if not ok:
+        print(f"     packument {status}, tarball {served[0]}, not refused: {refused}")
+
+    log = tmp / "offline.log"
+    os.environ.update(stub_env(stubs, log))
+    base = tmp / "offline"
+    base.mkdir()
+    with offline_registry(True) as registry:
+        ok = create_react_app("app", base_path=base, start_dev=False, use_cache=False, package_manager="npm")
+    calls = [json.loads(line) for line in log.read_text().splitlines() if line.strip()]
+    installs = [call for call in calls if call["tool"] == "npm" and "--version" not in call["argv"]]
+    ok = bool(ok) and bool(installs) and all(call["registry"] == registry for call in installs)
+    failures += not ok
+    print(f"{'OK  ' if ok else 'FAIL'} {'npm':<5} react offline")
+    if not ok:
+        print(f"     expected every npm call on {registry}: {[(c['argv'], c['registry']) for c in installs]}")
+    return failures
+
+
+def check() -> int:
+    """Scaffold with every package manager against the stubs and diff command lines"""
+    from commands.next_tailwind import create_nextjs_app
+    from commands.react_tailwind import create_react_app
+
+    scaffolders = {"react": create_react_app, "next": create_nextjs_app}
+    failures = 0
+    with tempfile.TemporaryDirectory(prefix="shnk-stubs-") as tmp:
+        tmp = Path(tmp)
+        stubs = install_stubs(tmp / "bin")
+        saved = dict(os.environ)
+        os.environ["SHNK_HOME"] = str(tmp / "home")
+        try:
+            for pm, frameworks in EXPECTED.items():
+                for framework, expected in frameworks.items():
+                    log = tmp / f"{pm}-{framework}.log"
+                    os.environ.update(stub_env(stubs, log))
+                    base = tmp / f"{pm}-{framework}"
+                    base.mkdir()
+                    scaffolders[framework]("app", base_path=base, start_dev=False,
+                                           use_cache=False, package_manager=pm)
+                    # Editor and install overlap, so compare without ordering
+                    calls = read_log(log)
+                    ok = sorted(calls) == sorted(expected)
+                    failures += not ok
+                    print(f"{'OK  ' if ok else 'FAIL'} {pm:<5} {framework}")
+                    if not ok:
+                        print(f"     expected: {expected}\n     got:      {calls}")
+            failures += check_locked(tmp, stubs)
+            failures += check_offline(tmp, stubs)
+        finally:
+            os.environ.clear()
+            os.environ.update(saved)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    if sys.argv[1:] == ["check"]:
+        sys.exit(check())
+    if len(sys.argv) == 3 and sys.argv[1] == "install":
+        print(install_stubs(Path(sys.argv[2])))
+        sys.exit(0)
+    print("usage: python -m fixtures.stub_toolchain check | install DIR")
+    sys.exit(2)
@@ -4,31 +4,27 @@ SHNK Terminal - Professional Developer CLI
 Main entry point for the application
 """
 
-import os
 import sys
-from pathlib import Path
-import json
-from rich.console import Console
-from rich.panel import Panel
-from rich.text import Text
-from rich.prompt import Prompt, Confirm
-from rich.table import Table
-from rich.align import Align
-from rich import print as rprint
-
-# Import our modules
-from banner import (
-    display_banner, animate_welcome, display_loading_bar, display_section_divider,
-    display_welcome_message, display_startup_sequence, get_color_scheme
-)
-from terminal.sandbox import TerminalSandbox
-from commands.react_tailwind import create_react_app
-from commands.next_tailwind import create_nextjs_app
-from utils.logger import Logger
+
+# Only the standard library is imported up front. Rich, the banner and the
+# scaffold commands are imported by the methods that first need them, so
+# the menu (and the headless CLI) never pay for code they don't use.
+
+
+def load_menu_modules():
+    """Import everything the interactive menu needs to reach its first prompt"""
+    import banner  # noqa: F401
+    import rich.prompt  # noqa: F401
+    import rich.table  # noqa: F401
+
 
 class SHNKTerminal:
     def __init__(self):
-        self.console = Console()
+        from banner import get_color_scheme, get_console
+        from terminal.sandbox import TerminalSandbox
+        from utils.logger import Logger
+
+        self.console = get_console()
         self.logger = Logger()
         self.sandbox = TerminalSandbox()
         self.current_path = self.sandbox.get_current_path()
@@ -37,6 +33,9 @@ class SHNKTerminal:
         
     def show_main_menu(self):
         """Display the main developer menu with clean, professional styling"""
+        from rich.table import Table
+        from banner import display_section_divider
+
         display_section_divider("Main Menu")
         
         # Clean, professional table
@@ -54,26 +53,56 @@ class SHNKTerminal:
         table.add_column("Status", style=f"{self.color_scheme['muted']}", width=12)
         
         # Clean menu options
-        table.add_row("1", "Create React + Tailwind Project", "Available")
-        table.add_row("2", "Create Next.js + Tailwind Project", "Available") 
-        table.add_row("3", "Terminal Mode", "Coming Soon")
-        table.add_row("4", "Settings", "Coming Soon")
-        table.add_row("5", "Exit", "")
+        specs = self._specs()
+        table.add_row("1", f"Create {specs['react'].description or 'React + Tailwind'} Project", "Available")
+        table.add_row("2", f"Create {specs['next'].description or 'Next.js + Tailwind'} Project", "Available")
+        table.add_row("3", "Dev Servers", self._dev_server_status())
+        table.add_row("4", "Terminal Mode", "Coming Soon")
+        table.add_row("5", "Settings", "Coming Soon")
+        table.add_row("6", "Exit", "")
         
         self.console.print(table)
         self.console.print()
+        custom = [name for name in specs if name not in ("react", "next")]
+        if custom:
+            self.console.print(f"[{self.color_scheme['muted']}]Project specs: {', '.join(custom)} (type a name to scaffold it)[/{self.color_scheme['muted']}]")
         
         # Simple instruction
         self.console.print(f"[{self.color_scheme['muted']}]Enter option number or type 'exit' to quit[/{self.color_scheme['muted']}]")
         self.console.print()
     
-    def handle_project_creation(self, project_type):
+    def _specs(self):
+        """Project specs from config/config.json (parsed once, until the file changes)"""
+        from commands.specs import BUILTIN_SPECS, SpecError, load_specs
+
+        try:
+            return load_specs()
+        except SpecError as e:
+            self.console.print(f"[red]Error: {e}[/red]")
+            return dict(BUILTIN_SPECS)
+
+    def _dev_server_status(self):
+        # The supervisor is only imported once a server was started
+        if "utils.devserver" not in sys.modules:
+            return ""
+        from utils.devserver import supervisor
+        running = sum(server.running for server in supervisor().list())
+        return f"{running} running" if running else ""
+
+    def handle_project_creation(self, spec_name):
         """Handle project scaffolding with professional UI"""
-        display_section_divider(f"{project_type.title()} Project Setup")
+        from rich.panel import Panel
+        from rich.prompt import Prompt, Confirm
+        from banner import display_section_divider
+        from commands.common import is_valid_project_name
+        from commands.specs import scaffold
+
+        spec = self._specs()[spec_name]
+        display_section_divider(f"{spec.name.title()} Project Setup")
         
         # Clean project info
         project_info = Panel(
-            f"[bold {self.color_scheme['primary']}]{project_type.title()} + Tailwind CSS[/bold {self.color_scheme['primary']}]\n"
+            f"[bold {self.color_scheme['primary']}]{spec.title}[/bold {self.color_scheme['primary']}]\n"
             f"[{self.color_scheme['muted']}]Modern development stack with best practices[/{self.color_scheme['muted']}]",
             border_style=self.color_scheme['primary'],
             padding=(0, 1),
@@ -93,40 +122,44 @@ class SHNKTerminal:
             return
         
         # Validate project name
-        if not project_name.replace("-", "").replace("_", "").isalnum():
+        if not is_valid_project_name(project_name):
             self.console.print("[red]Error: Invalid project name. Use letters, numbers, hyphens, or underscores only.[/red]")
             return
         
-        # Show progress
-        display_loading_bar(f"Creating {project_type} project", 1.5)
-        
         try:
-            if project_type == "react":
-                create_react_app(project_name)
-            elif project_type == "next":
-                create_nextjs_app(project_name)
+            from utils.mirror import offline_registry, offline_requested
+
+            # The spec decides location, editor and packages; only what it leaves open is asked
+            with offline_registry(offline_requested()):
+                project_path = scaffold(spec, project_name, start_dev=False)
+            if not project_path:
+                return
             
             # Success message
             success_panel = Panel(
                 f"[bold {self.color_scheme['success']}]Project '{project_name}' created successfully[/bold {self.color_scheme['success']}]\n"
-                f"[{self.color_scheme['muted']}]Location: ./workspace/{project_name}[/{self.color_scheme['muted']}]",
+                f"[{self.color_scheme['muted']}]Location: {project_path}[/{self.color_scheme['muted']}]",
                 border_style=self.color_scheme['success'],
                 padding=(0, 1)
             )
             self.console.print(success_panel)
             
-            # Ask about dev server
-            self.console.print()
-            start_server = Confirm.ask(
-                f"[{self.color_scheme['accent']}]Start development server?[/{self.color_scheme['accent']}]",
-                default=True
-            )
+            # Ask about dev server unless the spec decides
+            start_server = spec.dev_server
+            if start_server is None:
+                self.console.print()
+                start_server = Confirm.ask(
+                    f"[{self.color_scheme['accent']}]Start development server?[/{self.color_scheme['accent']}]",
+                    default=True
+                )
             
             if start_server:
-                display_loading_bar("Starting development server", 1.0)
-                self.logger.info("Development server starting...")
-                os.chdir(self.sandbox.workspace_path / project_name)
-                os.system("npm run dev")
+                from utils.devserver import supervisor
+
+                # Runs in the background; the menu stays usable
+                framework = "vite" if spec.framework == "react" else "next"
+                if supervisor().start(project_path, framework, spec.package_manager, logger=self.logger):
+                    self.logger.info("Manage it from 'Dev Servers' in the main menu.")
                     
         except Exception as e:
             # Clean error display
@@ -138,12 +171,69 @@ class SHNKTerminal:
             )
             self.console.print(error_panel)
     
+    def handle_dev_servers(self):
+        """List the session's dev servers and stop, restart or tail them"""
+        from rich.markup import escape
+        from rich.prompt import Prompt
+        from rich.table import Table
+        from banner import display_section_divider
+
+        display_section_divider("Dev Servers")
+        if "utils.devserver" not in sys.modules:
+            self.console.print(f"[{self.color_scheme['muted']}]No dev servers started in this session[/{self.color_scheme['muted']}]")
+            return
+        from utils.devserver import supervisor
+
+        while True:
+            servers = supervisor().list()
+            if not servers:
+                self.console.print(f"[{self.color_scheme['muted']}]No dev servers started in this session[/{self.color_scheme['muted']}]")
+                return
+
+            table = Table(header_style=f"bold {self.color_scheme['primary']}", box=None, pad_edge=False)
+            for column in ("ID", "Project", "URL", "Status", "Uptime", "PID"):
+                table.add_column(column)
+            for server in servers:
+                uptime = server.uptime()
+                table.add_row(str(server.id), server.project_path.name, server.url, server.status,
+                              f"{int(uptime // 60)}m {int(uptime % 60)}s" if uptime else "",
+                              str(server.process.pid) if server.running else "")
+            self.console.print(table)
+            self.console.print()
+
+            action = Prompt.ask(
+                f"[{self.color_scheme['primary']}]Action (stop ID, restart ID, logs ID, stop all, back)[/{self.color_scheme['primary']}]",
+                default="back"
+            ).strip().lower().split()
+            if not action or action[0] == "back":
+                return
+            if action == ["stop", "all"]:
+                self.logger.info(f"Stopped {supervisor().stop_all()} dev server(s).")
+                continue
+
+            server = supervisor().get(int(action[1])) if len(action) == 2 and action[1].isdigit() else None
+            if action[0] not in ("stop", "restart", "logs") or server is None:
+                self.console.print("[red]Error: Unknown action or server ID[/red]")
+                continue
+            if action[0] == "stop":
+                server.stop()
+                self.logger.info(f"Stopped dev server {server.id} ({server.project_path.name}).")
+            elif action[0] == "restart":
+                supervisor().restart(server.id, logger=self.logger)
+            else:
+                self.console.print(f"[{self.color_scheme['muted']}]{escape(str(server.log_path))}[/{self.color_scheme['muted']}]")
+                for line in server.tail(40):
+                    self.logger.output(line)
+                self.console.print()
+
     def run(self):
         """Main application loop with professional interface"""
+        from rich.prompt import Prompt
+        from banner import display_section_divider, display_startup_sequence
+
         try:
             # Clean startup
             display_startup_sequence()
-            display_loading_bar("Initializing system", 1.5)
             
             # Status message
             self.console.print(f"[bold {self.color_scheme['success']}]System ready[/bold {self.color_scheme['success']}]")
@@ -152,20 +242,26 @@ class SHNKTerminal:
             while self.running:
                 try:
                     self.show_main_menu()
+                    custom_specs = [name for name in self._specs() if name not in ("react", "next")]
                     choice = Prompt.ask(
                         f"[{self.color_scheme['primary']}]Select option[/{self.color_scheme['primary']}]", 
-                        choices=["1", "2", "3", "4", "5", "react", "next", "terminal", "settings", "exit"]
+                        choices=["1", "2", "3", "4", "5", "6", "react", "next", "servers", "terminal", "settings", "exit"]
+                                + custom_specs
                     )
                     
-                    if choice in ["1", "react"]:
+                    if choice in custom_specs:
+                        self.handle_project_creation(choice)
+                    elif choice in ["1", "react"]:
                         self.handle_project_creation("react")
                     elif choice in ["2", "next"]:
                         self.handle_project_creation("next")
-                    elif choice in ["3", "terminal"]:
+                    elif choice in ["3", "servers"]:
+                        self.handle_dev_servers()
+                    elif choice in ["4", "terminal"]:
                         self.console.print(f"[{self.color_scheme['warning']}]Terminal mode available in next update[/{self.color_scheme['warning']}]")
-                    elif choice in ["4", "settings"]:
+                    elif choice in ["5", "settings"]:
                         self.console.print(f"[{self.color_scheme['warning']}]Settings panel available in next update[/{self.color_scheme['warning']}]")
-                    elif choice in ["5", "exit"]:
+                    elif choice in ["6", "exit"]:
                         self.running = False
                     
                 except KeyboardInterrupt:
@@ -176,10 +272,30 @@ class SHNKTerminal:
         finally:
             # Clean goodbye
             display_section_divider("Shutdown")
+            if "utils.devserver" in sys.modules:
+                from utils.devserver import supervisor
+                stopped = supervisor().stop_all()
+                if stopped:
+                    self.logger.info(f"Stopped {stopped} dev server(s).")
             self.console.print(f"[{self.color_scheme['primary']}]Thank you for using SHNK[/{self.color_scheme['primary']}]")
 
 def main():
     """Entry point"""
+    # The packaged executable re-runs itself to start grep's worker processes
+    if getattr(sys, "frozen", False):
+        import multiprocessing
+        multiprocessing.freeze_support()
+
+    # Import-time breakdown up to the first menu prompt
+    if "--profile-startup" in sys.argv[1:]:
+        from utils.startup_profiler import profile_startup
+        sys.exit(profile_startup(sys.argv[1:]))
+
+    # Any arguments select the headless CLI (e.g. `shnk new react my-app`)
+    if len(sys.argv) > 1:
+        from cli import main as cli_main
+        sys.exit(cli_main(sys.argv[1:]))
+
     terminal = SHNKTerminal()
     terminal.run()
 
@@ -0,0 +1,176 @@
+# templates/__init__.py
+"""
+On-disk template packs.
+
+Each pack is a directory with a ``manifest.json`` listing the files it
+writes into a generated project, grouped by scaffold step:
+
+    {
+      "name": "react-tailwind",
+      "description": "Vite + React with Tailwind CSS",
+      "variables": {"title": "Thank You", "typescript": false},
+      "dependencies": {"tailwindcss": "latest"},
+      "files": {
+        "configs": [{"dest": "src/index.css", "src": "index.css"}],
+        "sources": [{"dest": "src/App.<% if typescript %>tsx<% else %>jsx<% endif %>",
+                     "src": "App.jsx.tmpl"}]
+      }
+    }
+
+A ``src`` list is concatenated in order, and ``@shared/`` parts come from
+the ``_shared`` fragment directory, so packs can reuse the same component.
+Sources ending in ``.tmpl`` are rendered by ``templates.engine`` with the
+pack's ``variables`` (overridable per project, plus ``project_name``);
+destinations may use the same tags. Other files are streamed as-is.
+``dependencies`` are the packages the scaffold installs on top of the
+generator's (name to version spec, ``latest`` for the registry's current).
+Manifests are indexed once per process and file contents are only read
+when a scaffold writes them.
+"""
+
+import hashlib
+import json
+import shutil
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from templates.engine import SHARED_DIR, SHARED_PREFIX, TEMPLATE_SUFFIX, default_engine, render_string
+from utils import tracing
+from utils.paths import resource_root
+
+MANIFEST = "manifest.json"
+COPY_BUFFER = 64 * 1024
+
+
+def templates_root() -> Path:
+    return resource_root() / "templates"
+
+
+class TemplatePack:
+    """A template directory and its parsed manifest"""
+
+    def __init__(self, root: Path, manifest: Dict):
+        self.root = root
+        self.name = manifest.get("name", root.name)
+        self.description = manifest.get("description", "")
+        self.groups: Dict[str, List[Dict]] = manifest.get("files", {})
+        self.variables: Dict[str, Any] = manifest.get("variables", {})
+        self.dependencies: Dict[str, str] = manifest.get("dependencies", {})
+
+    def _source(self, part: str) -> Path:
+        if part.startswith(SHARED_PREFIX):
+            return self.root.parent / SHARED_DIR / part[len(SHARED_PREFIX):]
+        return self.root / part
+
+    def context(self, project_name: str, overrides: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Template variables for one project: pack defaults, then ``overrides``.
+
+        String overrides (e.g. from the command line) are coerced to the type
+        of the default; unknown names raise ValueError.
+        """
+        context = dict(self.variables, project_name=project_name)
+        for name, value in (overrides or {}).items():
+            if name not in context:
+                known = ", ".join(sorted(self.variables)) or "none"
+                raise ValueError(f"Unknown variable for {self.name}: {name} (known: {known})")
+            context[name] = coerce(value, self.variables.get(name))
+        return context
+
+    def files(self, group: Optional[str] = None,
+              context: Optional[Dict[str, Any]] = None) -> List[Tuple[str, List[Path]]]:
+        """(destination, source parts) pairs for one group, or for every group"""
+        context = context if context is not None else self.context("app")
+        groups = [group] if group else list(self.groups)
+        entries = []
+        for name in groups:
+            for entry in self.groups.get(name, []):
+                parts = entry["src"] if isinstance(entry["src"], list) else [entry["src"]]
+                entries.append((render_string(entry["dest"], context),
+                                [self._source(part) for part in parts]))
+        return entries
+
+    def packages(self) -> List[str]:
+        """The pack's dependencies as install arguments (``name`` or ``name@spec``)"""
+        return [name if spec == "latest" else f"{name}@{spec}" for name, spec in self.dependencies.items()]
+
+    @tracing.traced("template-digest", cat="template")
+    def digest(self) -> str:
+        """Hash of the manifest and every file in the pack and the shared fragments"""
+        sha = hashlib.sha256(json.dumps([self.groups, self.variables, self.dependencies],
+                                        sort_keys=True).encode())
+        for directory in (self.root, self.root.parent / SHARED_DIR):
+            for path in sorted(directory.rglob("*")):
+                if path.is_file():
+                    sha.update(path.name.encode())
+                    sha.update(path.read_bytes())
+        return sha.hexdigest()[:16]
+
+    def render(self, sources: List[Path], context: Dict[str, Any], engine=None) -> bytes:
+        """Content of one destination file, built from its source parts"""
+        engine = engine or default_engine()
+        return b"".join(engine.render(source, context).encode("utf-8")
+                        if source.name.endswith(TEMPLATE_SUFFIX) else source.read_bytes()
+                        for source in sources)
+
+    def write(self, project_path: Path, group: Optional[str] = None,
+              context: Optional[Dict[str, Any]] = None, engine=None) -> List[Path]:
+        """Write the pack's files into ``project_path``; returns the paths written.
+
+        ``.tmpl`` parts are rendered from their compiled form, anything
+        else is streamed straight from the pack.
+        """
+        context = context if context is not None else self.context(Path(project_path).name)
+        engine = engine or default_engine()
+        written = []
+        for dest, sources in self.files(group, context):
+            target = Path(project_path) / dest
+            target.parent.mkdir(parents=True, exist_ok=True)
+            with open(target, "wb") as out:
+                for source in sources:
+                    if source.name.endswith(TEMPLATE_SUFFIX):
+                        out.write(engine.render(source, context).encode("utf-8"))
+                        continue
+                    with open(source, "rb") as src:
+                        shutil.copyfileobj(src, out, COPY_BUFFER)
+            written.append(target)
+        return written
+
+    def __repr__(self):
+        return f"<TemplatePack {self.name}>"
+
+
+def coerce(value: Any, default: Any) -> Any:
+    """Convert a string override to the type of the variable's default"""
+    if not isinstance(value, str) or isinstance(default, str) or default is None:
+        return value
+    if isinstance(default, bool):
+        lowered = value.strip().lower()
+        if lowered in ("1", "true", "yes", "on"):
+            return True
+        if lowered in ("0", "false", "no", "off"):
+            return False
+        raise ValueError(f"Expected true/false, got {value!r}")
+    if isinstance(default, int):
+        return int(value)
+    return value
+
+
+@lru_cache(maxsize=None)
+def index(root: Optional[Path] = None) -> Dict[str, TemplatePack]:
+    """Every pack under ``root`` (default: the bundled templates), by name"""
+    root = Path(root) if root else templates_root()
+    packs = {}
+    for manifest_path in sorted(root.glob(f"*/{MANIFEST}")):
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        pack = TemplatePack(manifest_path.parent, manifest)
+        packs[pack.name] = pack
+    return packs
+
+
+def get_pack(name: str) -> TemplatePack:
+    """Look up a pack by name; raises ValueError for unknown packs"""
+    packs = index()
+    if name not in packs:
+        raise ValueError(f"Unknown template pack: {name} (available: {', '.join(packs) or 'none'})")
+    return packs[name]
@@ -0,0 +1,294 @@
+# templates/engine.py
+"""
+Template engine for scaffold files.
+
+Syntax (chosen so it never collides with JSX/TSX braces):
+
+    <%= name %>            variable
+    <%= name|json %>       variable as a JS/JSON literal
+    <% if flag %> ... <% else %> ... <% endif %>     (also ``if not flag``)
+    <% include "@shared/shnk-welcome.jsx" %>         partial
+
+Templates are compiled once into a list of chunks with partials inlined.
+The compiled form is cached in memory and in ``SHNK_HOME/template-cache``
+as JSON, keyed by path and invalidated when the mtime or size of the
+template or any partial changes (and the content hash differs). Rendering
+is a single pass over the chunks.
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+CACHE_FORMAT = 1
+TEMPLATE_SUFFIX = ".tmpl"
+SHARED_PREFIX = "@shared/"
+SHARED_DIR = "_shared"
+
+TAG_RE = re.compile(r"<%(=?)\s*(.*?)\s*%>", re.S)
+INCLUDE_RE = re.compile(r"""include\s+["']([^"']+)["']$""")
+VAR_RE = re.compile(r"([A-Za-z_]\w*)(?:\|(\w+))?$")
+
+FILTERS = {
+    "json": lambda value: json.dumps(value, ensure_ascii=False),
+    "upper": lambda value: str(value).upper(),
+    "lower": lambda value: str(value).lower(),
+}
+
+# Chunk kinds in the compiled form
+TEXT, VAR, IF = "t", "v", "if"
+
+
+class TemplateError(ValueError):
+    """A template that cannot be compiled or rendered"""
+
+
+def _stamp(path: Path) -> List[int]:
+    st = os.stat(path)
+    return [st.st_mtime_ns, st.st_size]
+
+
+def _sha(path: Path) -> str:
+    return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+
+
+def resolve_partial(name: str, base: Path) -> Path:
+    """``@shared/x`` lives in the templates' shared directory; other names are relative"""
+    if name.startswith(SHARED_PREFIX):
+        # Walk up to the templates root that owns the _shared directory
+        for parent in base.parents:
+            if (parent / SHARED_DIR).is_dir():
+                return parent / SHARED_DIR / name[len(SHARED_PREFIX):]
+        raise TemplateError(f"No {SHARED_DIR} directory above {base}")
+    return base.parent / name
+
+
+def _parse(source: str, name: str, include) -> List:
+    """Parse template text into chunks; ``include(partial)`` returns a partial's chunks"""
+    root: List = []
+    # Stack of (chunk list being filled, open if-chunk or None)
+    frames = [(root, None)]
+    pos = 0
+    for match in TAG_RE.finditer(source):
+        if match.start() > pos:
+            frames[-1][0].append([TEXT, source[pos:match.start()]])
+        pos = match.end()
+        is_output, body = match.group(1), match.group(2)
+        where = f"{name}:{source.count(chr(10), 0, match.start()) + 1}"
+
+        if is_output:
+            var = VAR_RE.match(body)
+            if not var or (var.group(2) and var.group(2) not in FILTERS):
+                raise TemplateError(f"{where}: bad expression {body!r}")
+            frames[-1][0].append([VAR, var.group(1), var.group(2)])
+            continue
+
+        words = body.split()
+        if words[:1] == ["if"] and len(words) in (2, 3) and (len(words) == 2 or words[1] == "not"):
+            chunk = [IF, words[-1], len(words) == 3, [], []]
+            frames[-1][0].append(chunk)
+            frames.append((chunk[3], chunk))
+        elif words == ["else"]:
+            chunks, chunk = frames[-1]
+            if chunk is None or chunks is not chunk[3]:
+                raise TemplateError(f"{where}: else without if")
+            frames[-1] = (chunk[4], chunk)
+        elif words == ["endif"]:
+            if frames[-1][1] is None:
+                raise TemplateError(f"{where}: endif without if")
+            frames.pop()
+        elif INCLUDE_RE.match(body):
+            frames[-1][0].extend(include(INCLUDE_RE.match(body).group(1)))
+        else:
+            raise TemplateError(f"{where}: unknown tag {body!r}")
+
+    if len(frames) > 1:
+        raise TemplateError(f"{name}: unclosed if")
+    if pos < len(source):
+        root.append([TEXT, source[pos:]])
+    return _merge_text(root)
+
+
+def _compile(path: Path, deps: Dict[str, None], stack: Tuple[Path, ...] = ()) -> List:
+    """Compile a template file, inlining partials and recording dependencies"""
+    if path in stack:
+        raise TemplateError(f"Recursive include of {path}")
+    try:
+        source = path.read_text(encoding="utf-8")
+    except OSError as e:
+        raise TemplateError(f"Cannot read template {path}: {e}") from e
+    deps[str(path)] = None
+    return _parse(source, path.name,
+                  lambda partial: _compile(resolve_partial(partial, path), deps, stack + (path,)))
+
+
+def _merge_text(chunks: List) -> List:
+    """Join adjacent text chunks (left over from inlined partials)"""
+    merged: List = []
+    for chunk in chunks:
+        if chunk[0] == IF:
+            chunk[3], chunk[4] = _merge_text(chunk[3]), _merge_text(chunk[4])
+        if chunk[0] == TEXT and merged and merged[-1][0] == TEXT:
+            merged[-1] = [TEXT, merged[-1][1] + chunk[1]]
+        else:
+            merged.append(chunk)
+    return merged
+
+
+def _render(chunks: List, context: Dict, out: List[str]) -> None:
+    for chunk in chunks:
+        kind = chunk[0]
+        if kind == TEXT:
+            out.append(chunk[1])
+        elif kind == VAR:
+            try:
+                value = context[chunk[1]]
+            except KeyError:
+                raise TemplateError(f"Undefined template variable: {chunk[1]}") from None
+            out.append(FILTERS[chunk[2]](value) if chunk[2] else str(value))
+        else:
+            truthy = bool(context.get(chunk[1]))
+            _render(chunk[3] if truthy != chunk[2] else chunk[4], context, out)
+
+
+class Template:
+    """A compiled template"""
+
+    def __init__(self, chunks: List, deps: Dict[str, List]):
+        self.chunks = chunks
+        # path -> [mtime_ns, size, sha256]
+        self.deps = deps
+
+    def render(self, context: Dict) -> str:
+        out: List[str] = []
+        _render(self.chunks, context, out)
+        return "".join(out)
+
+    def is_fresh(self) -> bool:
+        """Cheap check: every dependency still has the recorded mtime and size"""
+        try:
+            return all(_stamp(Path(p)) == info[:2] for p, info in self.deps.items())
+        except OSError:
+            return False
+
+    def revalidate(self) -> bool:
+        """Stale stamps but identical content (touch, checkout) keep the template valid"""
+        try:
+            for p, info in self.deps.items():
+                if _stamp(Path(p)) != info[:2]:
+                    if _sha(Path(p)) != info[2]:
+                        return False
+                    info[:2] = _stamp(Path(p))
+        except OSError:
+            return False
+        return True
+
+
+class TemplateEngine:
+    """Compiles templates with a memory and on-disk cache"""
+
+    def __init__(self, cache_dir: Optional[Path] = None):
+        if cache_dir is None:
+            from utils.paths import shnk_home
+            cache_dir = shnk_home() / "template-cache"
+        self.cache_dir = Path(cache_dir)
+        self._memory: Dict[str, Template] = {}
+        self._lock = threading.Lock()
+        self.stats = {"memory": 0, "disk": 0, "compiled": 0}
+
+    def _cache_file(self, path: Path) -> Path:
+        return self.cache_dir / (hashlib.sha1(str(path).encode()).hexdigest() + ".json")
+
+    def _read_cache(self, path: Path) -> Optional[Template]:
+        try:
+            data = json.loads(self._cache_file(path).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if data.get("format") != CACHE_FORMAT or data.get("path") != str(path):
+            return None
+        template = Template(data["chunks"], data["deps"])
+        if template.is_fresh():
+            return template
+        if template.revalidate():
+            self._write_cache(path, template)
+            return template
+        return None
+
+    def _write_cache(self, path: Path, template: Template) -> None:
+        target = self._cache_file(path)
+        try:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            tmp = target.with_name(f"{target.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp.write_text(json.dumps({"format": CACHE_FORMAT, "path": str(path),
+                                       "deps": template.deps, "chunks": template.chunks}),
+                           encoding="utf-8")
+            os.replace(tmp, target)
+        except OSError:
+            # The cache is only an optimization
+            pass
+
+    def compile(self, path: Path) -> Template:
+        """Compile ``path`` without consulting any cache"""
+        deps: Dict[str, None] = {}
+        chunks = _compile(Path(path), deps)
+        stamps = {p: _stamp(Path(p)) + [_sha(Path(p))] for p in deps}
+        return Template(chunks, stamps)
+
+    def load(self, path: Path) -> Template:
+        """The compiled template for ``path``, from the fastest valid cache"""
+        path = Path(path).resolve()
+        key = str(path)
+        with self._lock:
+            template = self._memory.get(key)
+            if template is not None and template.is_fresh():
+                self.stats["memory"] += 1
+                return template
+            template = self._read_cache(path)
+            if template is not None:
+                self.stats["disk"] += 1
+            else:
+                template = self.compile(path)
+                self._write_cache(path, template)
+                self.stats["compiled"] += 1
+            self._memory[key] = template
+            return template
+
+    def render(self, path: Path, context: Dict) -> str:
+        return self.load(path).render(context)
+
+    def clear(self) -> int:
+        """Drop the in-memory and on-disk caches; returns the number of files removed"""
+        self._memory.clear()
+        removed = 0
+        for entry in self.cache_dir.glob("*.json"):
+            try:
+                entry.unlink()
+                removed += 1
+            except OSError:
+                pass
+        return removed
+
+
+def _no_include(partial: str) -> List:
+    raise TemplateError(f"Partials are not allowed in inline templates: {partial}")
+
+
+def render_string(text: str, context: Dict) -> str:
+    """Render a short inline template (e.g. a destination path)"""
+    if "<%" not in text:
+        return text
+    return Template(_parse(text, repr(text), _no_include), {}).render(context)
+
+
+_default_engine: Optional[TemplateEngine] = None
+
+
+def default_engine() -> TemplateEngine:
+    global _default_engine
+    if _default_engine is None:
+        _default_engine = TemplateEngine()
+    return _default_engine
@@ -2,8 +2,21 @@
 FuturTerminal - Terminal Package
 """
 
-from .terminal import FuturTerminalCLI
-from .sandbox import TerminalSandbox
-from .fs_commands import FileSystemCommands
-
 __all__ = ['FuturTerminalCLI', 'TerminalSandbox', 'FileSystemCommands']
+
+# Submodules are imported on first attribute access so that
+# `from terminal.sandbox import ...` doesn't drag in rich and the CLI.
+_LAZY_ATTRS = {
+    'FuturTerminalCLI': '.terminal',
+    'TerminalSandbox': '.sandbox',
+    'FileSystemCommands': '.fs_commands',
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRS:
+        from importlib import import_module
+        value = getattr(import_module(_LAZY_ATTRS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
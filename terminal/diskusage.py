@@ -0,0 +1,196 @@
+"""
+FuturTerminal - Disk Usage
+Parallel directory size scans with a persistent, mtime-keyed cache
+"""
+
+import hashlib
+import json
+import os
+from array import array
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+DU_WORKERS = 8
+CACHE_FORMAT = 1
+
+
+def _disk_bytes(st: os.stat_result) -> int:
+    """Space a file takes on disk (apparent size where blocks aren't reported)"""
+    blocks = getattr(st, "st_blocks", None)
+    return blocks * 512 if blocks is not None else st.st_size
+
+
+def scan_dir(path: str) -> Tuple[int, int, int, List[str]]:
+    """One directory: (mtime_ns, bytes of itself and its files, file count, subdirectory names).
+
+    Symlinks count as themselves and are never followed.
+    """
+    st = os.stat(path)
+    mtime, size, files = st.st_mtime_ns, _disk_bytes(st), 0
+    subdirs = []
+    with os.scandir(path) as it:
+        for entry in it:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.name)
+                    continue
+                size += _disk_bytes(entry.stat(follow_symlinks=False))
+                files += 1
+            except OSError:
+                continue
+    return mtime, size, files, subdirs
+
+
+class SizeTree:
+    """Directories as parallel arrays; a child always has a higher index than its parent"""
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+        self.names: List[str] = [""]
+        self.parent = array("l", [-1])
+        self.mtime = array("q", [0])
+        self.size = array("q", [0])
+        self.files = array("l", [0])
+        self.total = array("q")
+        self.errors = 0
+        self.cached = 0
+
+    def __len__(self):
+        return len(self.names)
+
+    def add(self, name: str, parent: int) -> int:
+        self.names.append(name)
+        self.parent.append(parent)
+        self.mtime.append(0)
+        self.size.append(0)
+        self.files.append(0)
+        return len(self.names) - 1
+
+    def relative(self, index: int) -> str:
+        """"/"-separated path of a directory relative to the scan's root ("" for the root)"""
+        parts = []
+        while index > 0:
+            parts.append(self.names[index])
+            index = self.parent[index]
+        return "/".join(reversed(parts))
+
+    def aggregate(self) -> None:
+        """Roll every directory's size up into its ancestors' totals (one reverse pass)"""
+        self.total = array("q", self.size)
+        totals, parents = self.total, self.parent
+        for index in range(len(self.names) - 1, 0, -1):
+            totals[parents[index]] += totals[index]
+
+    def file_totals(self) -> array:
+        counts = array("l", self.files)
+        for index in range(len(self.names) - 1, 0, -1):
+            counts[self.parent[index]] += counts[index]
+        return counts
+
+    def children(self, index: int) -> List[int]:
+        return [child for child in range(index + 1, len(self.names)) if self.parent[child] == index]
+
+
+class SizeCache:
+    """Per-directory scan results of one workspace, persisted as JSON.
+
+    Entries are keyed by the directory's path relative to the workspace and
+    reused while its mtime is unchanged. A directory's mtime moves when
+    entries are added, removed or renamed in it, not when a file in it is
+    rewritten in place, so such edits show up once something else changes.
+    """
+
+    def __init__(self, workspace: Path, path: Optional[Path] = None):
+        self.workspace = Path(workspace)
+        if path is None:
+            from utils.paths import shnk_home
+
+            key = hashlib.sha256(str(self.workspace).encode("utf-8")).hexdigest()[:16]
+            path = shnk_home() / "du-cache" / f"{key}.json"
+        self.path = path
+        self.entries: Dict[str, list] = {}
+
+    def load(self) -> "SizeCache":
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            if data.get("format") == CACHE_FORMAT and data.get("workspace") == str(self.workspace):
+                self.entries = data["entries"]
+        except (OSError, ValueError, KeyError, AttributeError):
+            self.entries = {}
+        return self
+
+    def update(self, tree: SizeTree, prefix: str) -> None:
+        """Replace everything under ``prefix`` (the scanned root) with the tree's results"""
+        inside = prefix + "/"
+        for key in [key for key in self.entries if key == prefix or not prefix or key.startswith(inside)]:
+            del self.entries[key]
+        children: Dict[int, List[str]] = {}
+        for index in range(1, len(tree)):
+            children.setdefault(tree.parent[index], []).append(tree.names[index])
+        for index in range(len(tree)):
+            if tree.mtime[index] == 0:
+                continue  # unreadable
+            relative = tree.relative(index)
+            key = f"{prefix}/{relative}" if prefix and relative else prefix or relative
+            self.entries[key] = [tree.mtime[index], tree.size[index], tree.files[index], children.get(index, [])]
+
+    def save(self) -> None:
+        data = json.dumps({"format": CACHE_FORMAT, "workspace": str(self.workspace), "entries": self.entries},
+                          separators=(",", ":"))
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+        tmp.write_text(data, encoding="utf-8")
+        os.replace(tmp, self.path)
+
+
+def scan_sizes(root: Path, cache: Optional[SizeCache] = None, prefix: str = "",
+               workers: int = DU_WORKERS) -> SizeTree:
+    """Sizes of every directory under ``root``.
+
+    Directories whose mtime matches ``cache`` (keys start with ``prefix``,
+    the root's path inside the cache's workspace) cost one stat in this
+    thread; the rest are scanned on a pool of ``workers`` threads.
+    """
+    tree = SizeTree(root)
+    entries = cache.entries if cache is not None else {}
+    base = str(root)
+
+    def key(index: int) -> str:
+        relative = tree.relative(index)
+        return f"{prefix}/{relative}" if prefix and relative else prefix or relative
+
+    def fill(index: int, mtime: int, size: int, files: int, subdirs: List[str]) -> None:
+        tree.mtime[index], tree.size[index], tree.files[index] = mtime, size, files
+        stack.extend(tree.add(name, index) for name in subdirs)
+
+    stack = [0]
+    pending = {}
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="du") as executor:
+        while stack or pending:
+            while stack:
+                index = stack.pop()
+                path = os.path.join(base, tree.relative(index)) if index else base
+                cached = entries.get(key(index))
+                if cached is not None:
+                    try:
+                        mtime = os.stat(path).st_mtime_ns
+                    except OSError:
+                        tree.errors += 1
+                        continue
+                    if mtime == cached[0]:
+                        fill(index, *cached)
+                        tree.cached += 1
+                        continue
+                pending[executor.submit(scan_dir, path)] = index
+            if not pending:
+                break
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                index = pending.pop(future)
+                try:
+                    fill(index, *future.result())
+                except OSError:
+                    tree.errors += 1
+    tree.aggregate()
+    return tree
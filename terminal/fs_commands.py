@@ -3,60 +3,354 @@ FuturTerminal - File System Commands
 Implements safe file system operations for the terminal
 """
 
+import heapq
+import itertools
+import json
+import os
+import re
+import time
 from pathlib import Path
-from typing import List, Optional
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 from rich.console import Console
+from rich.cells import cell_len, set_cell_size
+from rich.segment import Segment, Segments
+from rich.style import Style
 from rich.table import Table
-from rich.panel import Panel
+from rich.text import Text
+
+from .diskusage import SizeCache, scan_sizes
+from .ignore import IgnoreRules
+from .search import compile_search, iter_files, search_files
+from .viewer import HEX_WIDTH, LINE_LIMIT, FileView, format_hex_row
+
+SORT_ORDERS = ("name", "size", "mtime", "none")
+# Largest first for size, newest first for mtime (like ls -S / ls -t)
+DESCENDING = {"size", "mtime"}
+PAGE_SIZE = 500
+HEADER_STYLE = Style(bold=True, color="magenta")
+TYPE_STYLE = Style(color="cyan")
+NAME_STYLE = Style(color="white")
+SIZE_STYLE = Style(color="green")
+
+# tree: threads reading directories, how far they may run ahead of the
+# output, and lines per print
+TREE_WORKERS = 8
+TREE_PREFETCH = 64
+TREE_CHUNK = 500
+GUIDE_STYLE = Style(dim=True)
+# tail -f: poll interval and read size
+FOLLOW_INTERVAL = 0.25
+FOLLOW_READ = 64 * 1024
+# Control characters (escape sequences included) are shown as "?"
+_CONTROL_TABLE = dict.fromkeys([*range(32), 127], "?")
+TREE_STYLES = {"dir": Style(bold=True, color="cyan"), "file": Style(color="cyan"), "error": Style(color="red")}
+# grep: file names, line numbers and matches as in grep --color
+MATCH_PATH_STYLE = Style(color="magenta")
+MATCH_LINE_STYLE = Style(color="green")
+MATCH_STYLE = Style(bold=True, color="red")
+
+
+def _printable(name: str) -> str:
+    """A file name with control characters (newlines are legal in names) replaced by ?"""
+    if name.isprintable():
+        return name
+    return "".join(char if char.isprintable() else "?" for char in name)
+
+
+def _line_segments(line: bytes, length: int, number: Optional[int] = None) -> List[Segment]:
+    """One line of a text file, ready to print"""
+    text = line.decode("utf-8", "replace").expandtabs(4).translate(_CONTROL_TABLE)
+    segments = [Segment(f"{number:>6}  ", GUIDE_STYLE)] if number is not None else []
+    segments.append(Segment(text))
+    if length > LINE_LIMIT:
+        segments.append(Segment(f" … (+{length - LINE_LIMIT:,} bytes)", GUIDE_STYLE))
+    return segments
+
+
+def _followed_line(line: bytes) -> List[Segment]:
+    """A line read by ``tail -f``, cut to LINE_LIMIT like the lines of FileView.lines"""
+    shown = line[:LINE_LIMIT]
+    if shown.endswith(b"\r") and len(line) <= LINE_LIMIT:
+        shown = shown[:-1]
+    return _line_segments(shown, len(line))
+
+
+def _hex_segments(offset: int, row: bytes) -> List[Segment]:
+    text = format_hex_row(offset, row)
+    return [Segment(text[:8], TYPE_STYLE), Segment(text[8:])]
+
+
+def _match_segments(shown: bytes, spans: List[Tuple[int, int]], cut_start: bool, cut_end: bool) -> List[Segment]:
+    """A matching line (or the part of it that is shown) with its matches highlighted"""
+    def text(part: bytes) -> str:
+        return part.decode("utf-8", "replace").expandtabs(4).translate(_CONTROL_TABLE)
+
+    segments = [Segment("…", GUIDE_STYLE)] if cut_start else []
+    position = 0
+    for start, end in spans:
+        if start > position:
+            segments.append(Segment(text(shown[position:start])))
+        segments.append(Segment(text(shown[start:end]), MATCH_STYLE))
+        position = end
+    if position < len(shown):
+        segments.append(Segment(text(shown[position:])))
+    if cut_end:
+        segments.append(Segment("…", GUIDE_STYLE))
+    return segments
+
+
+def format_size(size: float) -> str:
+    if size < 1024:
+        return f"{size:,} bytes"
+    for unit in ("KB", "MB", "GB", "TB"):
+        size /= 1024
+        if size < 1024 or unit == "TB":
+            return f"{size:.1f} {unit}"
+
+
+def _stat(entry: os.DirEntry) -> Optional[os.stat_result]:
+    """The entry's own stat, cached by DirEntry.
+
+    Symlinks are not followed (like ``ls -l``): a link's target may be
+    outside the sandbox, and its size and mtime must not show through.
+    """
+    try:
+        return entry.stat(follow_symlinks=False)
+    except OSError:
+        return None
+
+
+def _is_dir(entry: os.DirEntry) -> bool:
+    try:
+        return entry.is_dir()
+    except OSError:
+        return False
+
+
+def _sort_key(sort: str):
+    if sort == "name":
+        return lambda entry: entry.name
+    field = "st_size" if sort == "size" else "st_mtime"
+
+    def key(entry):
+        st = _stat(entry)
+        return (getattr(st, field) if st else 0, entry.name)
+    return key
+
+
+def scan_directory(path: Path, sort: str = "name", reverse: bool = False,
+                   limit: Optional[int] = None) -> Tuple[Iterable[os.DirEntry], Optional[int]]:
+    """Entries of ``path`` in listing order, and how many there are in total.
+
+    One os.scandir pass; types and stats come from the DirEntry caches. With
+    ``limit`` only the top entries are kept (a heap, not a full sort), and
+    ``sort="none"`` streams in directory order without holding the listing
+    (the total is then unknown: None).
+    """
+    if sort not in SORT_ORDERS:
+        raise ValueError(f"Unknown sort order: {sort} (use {', '.join(SORT_ORDERS)})")
+    if limit is not None and limit < 0:
+        raise ValueError("--limit must not be negative")
+
+    if sort == "none":
+        def _stream() -> Iterator[os.DirEntry]:
+            with os.scandir(path) as it:
+                yield from itertools.islice(it, limit)
+        return _stream(), None
+
+    key = _sort_key(sort)
+    descending = (sort in DESCENDING) != reverse
+    with os.scandir(path) as it:
+        if limit is None:
+            entries = sorted(it, key=key, reverse=descending)
+            return entries, len(entries)
+        total = 0
+
+        def _counted():
+            nonlocal total
+            for entry in it:
+                total += 1
+                yield entry
+        pick = heapq.nlargest if descending else heapq.nsmallest
+        entries = pick(limit, _counted(), key=key)
+    return entries, total
+
+
+def entry_record(entry: os.DirEntry) -> dict:
+    """An entry as a JSON-ready dict (the NDJSON output of ``ls --json``)"""
+    st = _stat(entry)
+    is_dir = _is_dir(entry)
+    return {
+        "name": entry.name,
+        "type": "dir" if is_dir else "file",
+        "symlink": entry.is_symlink(),
+        "size": None if is_dir or st is None else st.st_size,
+        "mtime": st.st_mtime if st else None,
+    }
+
+
+def _read_dir(path: str, relative: str, rules: IgnoreRules) -> List[Tuple[str, str, bool, str, bool]]:
+    """Children of one directory for ``tree``, sorted and filtered.
+
+    Each is (name, path, is_dir, relative, descend): symlinked directories
+    are shown but not followed, so cycles can't loop.
+    """
+    children = []
+    with os.scandir(path) as it:
+        for entry in it:
+            relative_child = f"{relative}/{entry.name}" if relative else entry.name
+            is_dir = _is_dir(entry)
+            if rules and rules.ignored(relative_child, is_dir):
+                continue
+            children.append((entry.name, entry.path, is_dir, relative_child, is_dir and not entry.is_symlink()))
+    children.sort()
+    return children
+
+
+def walk_tree(root: Path, max_depth: Optional[int] = None, rules: Optional[IgnoreRules] = None,
+              executor: Optional[Executor] = None) -> Iterator[Optional[Tuple[str, str, str]]]:
+    """The lines of a ``tree`` listing as (guide, name, kind), depth first, without recursion.
+
+    ``kind`` is "dir", "file" or "error". Subdirectories are read on
+    ``executor`` as soon as their parent is listed (at most TREE_PREFETCH
+    ahead), so the walk rarely waits for the disk; when it is about to, it
+    yields None, the caller's cue to flush its output.
+    """
+    rules = rules or IgnoreRules()
+    prefetched: Dict[str, Future] = {}
+
+    def schedule(children, depth):
+        if executor is None or (max_depth is not None and depth >= max_depth):
+            return
+        for _, child, _, relative, descend in children:
+            if descend and len(prefetched) < TREE_PREFETCH:
+                prefetched[child] = executor.submit(_read_dir, child, relative, rules)
+
+    yield "", root.name or str(root), "dir"
+    if max_depth == 0:
+        return
+    stack = []
+    try:
+        try:
+            top = _read_dir(str(root), "", rules)
+        except OSError as e:
+            yield "└── ", f"[error opening dir: {e.strerror or e}]", "error"
+            return
+        schedule(top, 1)
+        stack.append([top, 0, "", 1])
+        while stack:
+            frame = stack[-1]
+            children, index, prefix, depth = frame
+            if index == len(children):
+                stack.pop()
+                continue
+            frame[1] += 1
+            name, child, is_dir, relative, descend = children[index]
+            last = index == len(children) - 1
+            yield prefix + ("└── " if last else "├── "), name, "dir" if is_dir else "file"
+            if not descend or (max_depth is not None and depth >= max_depth):
+                continue
+
+            inner = prefix + ("    " if last else "│   ")
+            future = prefetched.pop(child, None)
+            if future is not None and not future.done():
+                yield None
+            try:
+                grandchildren = future.result() if future is not None else _read_dir(child, relative, rules)
+            except OSError as e:
+                yield inner + "└── ", f"[error opening dir: {e.strerror or e}]", "error"
+                continue
+            schedule(grandchildren, depth + 1)
+            stack.append([grandchildren, 0, inner, depth + 1])
+    finally:
+        for future in prefetched.values():
+            future.cancel()
+
+
+def _pages(items: Iterable, size: int) -> Iterator[list]:
+    items = iter(items)
+    while True:
+        page = list(itertools.islice(items, size))
+        if not page:
+            return
+        yield page
+
 
 class FileSystemCommands:
     def __init__(self, sandbox):
         self.sandbox = sandbox
         self.console = Console()
         
-    def list_directory(self, path: Optional[Path] = None) -> None:
-        """List directory contents"""
+    def _resolve_dir(self, path) -> Path:
+        """A typed path (or the current directory) as a sandboxed directory"""
+        if path is None:
+            path = self.sandbox.get_current_path()
+        elif not isinstance(path, Path):
+            path = self.sandbox.sanitize_path(path)
+        if not path.is_dir():
+            raise ValueError(f"Not a directory: {path.name}")
+        return path
+
+    def list_directory(self, path=None, sort: str = "name", reverse: bool = False,
+                       limit: Optional[int] = None, ndjson: bool = False) -> None:
+        """List directory contents, printed a page at a time"""
         try:
-            path = path or self.sandbox.get_current_path()
-            if not path.is_dir():
-                raise ValueError(f"Not a directory: {path}")
-            
-            # Create table for directory listing
-            table = Table(show_header=True, header_style="bold magenta")
-            table.add_column("Type", style="cyan")
-            table.add_column("Name", style="white")
-            table.add_column("Size", style="green")
-            
-            # Add parent directory
-            if path != self.sandbox.workspace_path:
-                table.add_row("📁", "..", "")
-            
-            # List contents
-            for item in sorted(path.iterdir()):
-                if item.is_dir():
-                    table.add_row("📁", item.name, "")
+            path = self._resolve_dir(path)
+            entries, total = scan_directory(path, sort, reverse, limit)
+            shown = 0
+            for page in _pages(entries, PAGE_SIZE):
+                if ndjson:
+                    # One object per line, straight to the output for scripts
+                    self.console.file.write("".join(json.dumps(entry_record(entry)) + "\n" for entry in page))
+                    self.console.file.flush()
                 else:
-                    size = item.stat().st_size
-                    size_str = f"{size:,} bytes" if size < 1024 else f"{size/1024:.1f} KB"
-                    table.add_row("📄", item.name, size_str)
+                    self._print_page(page, first=shown == 0, parent=shown == 0 and path != self.sandbox.workspace_path)
+                shown += len(page)
             
-            self.console.print(table)
+            if not ndjson and shown == 0:
+                self._print_page([], first=True, parent=path != self.sandbox.workspace_path)
+            if not ndjson and total is not None and total > shown:
+                self.console.print(f"[dim]Showing {shown:,} of {total:,} entries[/dim]")
             
         except Exception as e:
             self.console.print(f"[red]Error: {str(e)}[/red]")
+
+    def _print_page(self, entries: List[os.DirEntry], first: bool, parent: bool) -> None:
+        # Pre-measured segments instead of a Table: nothing to lay out or wrap,
+        # and the fixed widths keep columns aligned from one page to the next
+        name_width = max(12, self.console.width - 20)
+        segments = []
+        if first:
+            segments += [Segment(f"{'Type':<6}{'Name':<{name_width}}{'Size':>14}", HEADER_STYLE), Segment.line()]
+        
+        # Add parent directory
+        rows = [("📁", "..", "")] if parent else []
+        for entry in entries:
+            if _is_dir(entry):
+                rows.append(("📁", entry.name, ""))
+            else:
+                st = _stat(entry)
+                rows.append(("📄", entry.name, format_size(st.st_size) if st else "?"))
+        for icon, name, size in rows:
+            name = _printable(name)
+            if cell_len(name) > name_width - 1:
+                name = set_cell_size(name, name_width - 2) + "…"
+            segments += [Segment(f"{icon}    ", TYPE_STYLE), Segment(set_cell_size(name, name_width), NAME_STYLE),
+                         Segment(f"{size:>14}", SIZE_STYLE), Segment.line()]
+        if segments:
+            self.console.print(Segments(segments), end="")
             
     def change_directory(self, path: str) -> None:
         """Change directory"""
         try:
-            if not path:
-                self.sandbox.set_current_path(self.sandbox.workspace_path)
-                return
-            
-            new_path = self.sandbox.sanitize_path(path)
+            new_path = self.sandbox.sanitize_path(path) if path else self.sandbox.workspace_path
             if not new_path.is_dir():
                 raise ValueError(f"Not a directory: {path}")
             
             self.sandbox.set_current_path(new_path)
+            # Pick up whatever changed the tree outside the terminal (npm, dev servers)
+            self.sandbox.invalidate()
             
         except Exception as e:
             self.console.print(f"[red]Error: {str(e)}[/red]")
@@ -72,6 +366,7 @@ class FileSystemCommands:
                 raise ValueError(f"Path already exists: {path}")
             
             new_path.mkdir(parents=True)
+            self.sandbox.invalidate()
             self.console.print(f"[green]Created directory: {new_path.name}[/green]")
             
         except Exception as e:
@@ -93,52 +388,275 @@ class FileSystemCommands:
         except Exception as e:
             self.console.print(f"[red]Error: {str(e)}[/red]")
             
-    def read_file(self, path: str) -> None:
-        """Display file contents"""
+    def disk_usage(self, path=None, top: Optional[int] = None, use_cache: bool = True) -> None:
+        """Show what takes up space: the directory's children, or its ``top`` largest directories"""
         try:
-            if not path:
-                raise ValueError("File name required")
+            root = self._resolve_dir(path)
+            if top is not None and top < 1:
+                raise ValueError("--top must be at least 1")
+            # Cached per workspace, so scanning a subdirectory reuses a full scan
+            prefix = root.relative_to(self.sandbox.workspace_path).as_posix()
+            prefix = "" if prefix == "." else prefix
+            cache = SizeCache(self.sandbox.workspace_path).load() if use_cache else None
+            
+            start = time.perf_counter()
+            tree = scan_sizes(root, cache, prefix)
+            elapsed = time.perf_counter() - start
+            if cache is not None:
+                cache.update(tree, prefix)
+                cache.save()
             
-            file_path = self.sandbox.sanitize_path(path)
-            if not file_path.is_file():
-                raise ValueError(f"Not a file: {path}")
+            files = tree.file_totals()
+            if top is not None:
+                rows = heapq.nlargest(top, range(1, len(tree)), key=tree.total.__getitem__)
+                label = tree.relative
+            else:
+                rows = sorted(tree.children(0), key=tree.total.__getitem__, reverse=True)
+                label = lambda index: tree.names[index] + "/"
             
-            content = file_path.read_text()
-            self.console.print(Panel(content, title=file_path.name))
+            table = Table(show_header=True, header_style="bold magenta", box=None, pad_edge=False)
+            table.add_column("Size", style="green", justify="right")
+            table.add_column("Files", style="cyan", justify="right")
+            table.add_column("Path", style="white")
+            for index in rows:
+                table.add_row(format_size(tree.total[index]), f"{files[index]:,}", Text(label(index)))
+            if top is None and tree.size[0]:
+                table.add_row(format_size(tree.size[0]), f"{tree.files[0]:,}", "(files)")
+            table.add_row(f"[bold]{format_size(tree.total[0])}[/bold]", f"[bold]{files[0]:,}[/bold]",
+                          Text(f"{root.name or root} (total)", style="bold"))
+            self.console.print(table)
+            
+            fresh = len(tree) - tree.cached
+            self.console.print(f"[dim]{len(tree):,} directories in {elapsed:.2f}s "
+                               f"({fresh:,} scanned, {tree.cached:,} unchanged)[/dim]")
+            if tree.errors:
+                self.console.print(f"[yellow]{tree.errors:,} directories could not be read[/yellow]")
             
         except Exception as e:
             self.console.print(f"[red]Error: {str(e)}[/red]")
+
+    def _view(self, path: str) -> FileView:
+        if not path:
+            raise ValueError("File name required")
+        file_path = self.sandbox.sanitize_path(path)
+        if not file_path.is_file():
+            raise ValueError(f"Not a file: {path}")
+        return FileView(file_path)
+
+    def read_file(self, path: str, number: bool = False, hexdump: Optional[bool] = None,
+                  start_line: int = 1) -> None:
+        """Display file contents from ``start_line`` on, a screen at a time"""
+        try:
+            if start_line < 1:
+                raise ValueError("Line numbers start at 1")
+            with self._view(path) as view:
+                if hexdump is None and view.is_binary():
+                    self.console.print(f"[dim]{view.path.name}: binary file, {view.size:,} bytes[/dim]")
+                    hexdump = True
+                if hexdump:
+                    rows = ((offset, _hex_segments(offset, row)) for offset, row in view.hex_rows())
+                else:
+                    offset = view.line_offset(start_line - 1)
+                    if offset is None and start_line == 1:
+                        offset = 0  # empty file
+                    elif offset is None:
+                        raise ValueError(f"{path} has fewer than {start_line} lines")
+                    rows = ((offset, _line_segments(line, length, index if number else None))
+                            for index, (offset, line, length) in enumerate(view.lines(offset), start_line))
+                self._emit(rows, view.size, page=True)
             
-    def show_tree(self, path: Optional[Path] = None) -> None:
-        """Display directory structure"""
+        except Exception as e:
+            self.console.print(f"[red]Error: {str(e)}[/red]")
+
+    def head_file(self, path: str, count: int = 10) -> None:
+        """Display the first lines of a file (hexdump rows for binaries)"""
         try:
-            path = path or self.sandbox.get_current_path()
-            if not path.is_dir():
-                raise ValueError(f"Not a directory: {path}")
+            with self._view(path) as view:
+                if view.is_binary():
+                    rows = ((offset, _hex_segments(offset, row)) for offset, row in view.hex_rows())
+                else:
+                    rows = ((offset, _line_segments(line, length)) for offset, line, length in view.lines())
+                self._emit(itertools.islice(rows, max(count, 0)), view.size)
             
-            def _tree(p: Path, prefix: str = "", is_last: bool = True):
-                # Skip hidden files and directories
-                if p.name.startswith('.'):
-                    return
-                
-                # Print current item
-                marker = "└── " if is_last else "├── "
-                self.console.print(f"{prefix}{marker}[cyan]{p.name}[/cyan]")
+        except Exception as e:
+            self.console.print(f"[red]Error: {str(e)}[/red]")
+
+    def tail_file(self, path: str, count: int = 10, follow: bool = False) -> None:
+        """Display the last lines of a file, then optionally keep printing what is appended"""
+        try:
+            with self._view(path) as view:
+                binary = view.is_binary()
+                if binary and follow:
+                    raise ValueError(f"{path} is a binary file; tail -f follows text files")
+                if binary:
+                    last_row = (view.size - 1) // HEX_WIDTH
+                    start = max(0, (last_row - max(count, 0) + 1) * HEX_WIDTH)
+                    rows = ((offset, _hex_segments(offset, row)) for offset, row in view.hex_rows(start))
+                else:
+                    rows = ((offset, _line_segments(line, length))
+                            for offset, line, length in view.lines(view.tail_offset(count)))
+                self._emit(rows, view.size)
+                position = view.size
+            if follow:
+                self._follow(view.path, position)
+            
+        except Exception as e:
+            self.console.print(f"[red]Error: {str(e)}[/red]")
+
+    def _follow(self, file_path: Path, position: int) -> None:
+        """Print lines appended to a file until Ctrl+C; copes with truncation and rotation"""
+        self.console.print(f"[dim]Following {file_path.name} (Ctrl+C to stop)[/dim]")
+        handle = open(file_path, "rb")
+        handle.seek(position)
+        partial = b""
+        try:
+            while True:
+                chunk = handle.read(FOLLOW_READ)
+                if chunk:
+                    lines = (partial + chunk).split(b"\n")
+                    partial = lines.pop()
+                    # A line that never ends is printed once it reaches LINE_LIMIT
+                    if len(partial) >= LINE_LIMIT:
+                        lines.append(partial)
+                        partial = b""
+                    self._emit((0, _followed_line(line)) for line in lines)
+                    continue
                 
-                # Print children
-                if p.is_dir():
-                    prefix += "    " if is_last else "│   "
-                    children = sorted(p.iterdir())
-                    for i, child in enumerate(children):
-                        _tree(child, prefix, i == len(children) - 1)
+                time.sleep(FOLLOW_INTERVAL)
+                try:
+                    st = os.stat(file_path)
+                except FileNotFoundError:
+                    # Rotated away; wait for the new file
+                    continue
+                if st.st_ino != os.fstat(handle.fileno()).st_ino or st.st_size < handle.tell():
+                    self.console.print(f"[yellow]{file_path.name} was truncated or replaced; following from the start[/yellow]")
+                    handle.close()
+                    handle = open(file_path, "rb")
+                    partial = b""
+        except KeyboardInterrupt:
+            if partial:
+                self._emit([(0, _followed_line(partial))])
+        finally:
+            handle.close()
+
+    def _emit(self, rows: Iterable[Tuple[int, List[Segment]]], size: int = 0, page: bool = False) -> None:
+        """Print (offset, segments) rows in chunks; with ``page`` on a terminal, a screen at a time"""
+        interactive = page and self.console.is_terminal
+        chunk = max(5, self.console.height - 2) if interactive else TREE_CHUNK
+        segments: List[Segment] = []
+        count = 0
+        for offset, row in rows:
+            segments += row
+            segments.append(Segment.line())
+            count += 1
+            if count == chunk:
+                self._flush(segments)
+                count = 0
+                if interactive:
+                    percent = int(offset * 100 / size) if size else 100
+                    answer = self.console.input(f"[dim]-- more ({percent}%) -- Enter: next page, q: quit[/dim] ")
+                    if answer.strip().lower().startswith("q"):
+                        return
+        self._flush(segments)
             
-            _tree(path)
+    def show_tree(self, path=None, depth: Optional[int] = None, show_all: bool = False,
+                  ignore: Iterable[str] = ()) -> None:
+        """Display directory structure"""
+        try:
+            root = self._resolve_dir(path)
+            if depth is not None and depth < 0:
+                raise ValueError("--depth must not be negative")
+            rules = IgnoreRules.for_walk(root, show_all, ignore)
+            
+            counts = {"dir": 0, "file": 0, "error": 0}
+            segments: List[Segment] = []
+            with ThreadPoolExecutor(max_workers=TREE_WORKERS, thread_name_prefix="tree") as executor:
+                lines = walk_tree(root, depth, rules, executor)
+                try:
+                    for line in lines:
+                        # Print what we have whenever the walk has to wait for the disk
+                        if line is None or len(segments) >= TREE_CHUNK * 3:
+                            self._flush(segments)
+                            if line is None:
+                                continue
+                        guide, name, kind = line
+                        counts[kind] += 1
+                        segments += [Segment(guide, GUIDE_STYLE), Segment(_printable(name), TREE_STYLES[kind]),
+                                     Segment.line()]
+                finally:
+                    lines.close()
+            self._flush(segments)
+            
+            # The root itself isn't counted
+            self.console.print(f"\n[dim]{counts['dir'] - 1} directories, {counts['file']} files[/dim]")
             
         except Exception as e:
             self.console.print(f"[red]Error: {str(e)}[/red]")
-def safe_mkdir(path: Path) -> None:
-    """Safely create a directory if it doesn't exist"""
-    try:
-        path.mkdir(parents=True, exist_ok=True)
-    except Exception as e:
-        Console().print(f"[red]Error creating directory {path}: {str(e)}[/red]")
\ No newline at end of file
+
+    def search(self, pattern: str, path=None, ignore_case: bool = False, fixed: bool = False,
+               word: bool = False, files_only: bool = False, max_count: Optional[int] = None,
+               show_all: bool = False, ignore: Iterable[str] = (), jobs: Optional[int] = None) -> None:
+        """Print the lines matching ``pattern`` in a file or every file under a directory"""
+        try:
+            if not pattern:
+                raise ValueError("Pattern required")
+            if max_count is not None and max_count < 1:
+                raise ValueError("--max-count must be at least 1")
+            if jobs is not None and jobs < 1:
+                raise ValueError("--jobs must be at least 1")
+            try:
+                compile_search(pattern, ignore_case, fixed, word)
+            except re.error as e:
+                raise ValueError(f"Invalid pattern: {e}")
+            
+            root = self.sandbox.sanitize_path(path) if path else self.sandbox.get_current_path()
+            if root.is_dir():
+                files = iter_files(str(root), IgnoreRules.for_walk(root, show_all, ignore), self.sandbox.contains)
+            elif root.is_file():
+                files = [str(root)]
+            else:
+                raise ValueError(f"No such file or directory: {path}")
+            current = str(self.sandbox.get_current_path())
+            
+            start = time.perf_counter()
+            searched = binary = errors = matched = lines = 0
+            # -l only needs to know whether a file matches at all
+            results = search_files(files, (pattern, ignore_case, fixed, word), 1 if files_only else max_count, jobs)
+            try:
+                for batch_searched, batch_binary, batch_errors, found in results:
+                    searched += batch_searched
+                    binary += batch_binary
+                    errors += batch_errors
+                    segments: List[Segment] = []
+                    for file_path, matches in found:
+                        matched += 1
+                        name = Segment(_printable(os.path.relpath(file_path, current)), MATCH_PATH_STYLE)
+                        if files_only:
+                            segments += [name, Segment.line()]
+                            continue
+                        for number, shown, spans, cut_start, cut_end in matches:
+                            lines += 1
+                            segments += [name, Segment(":", GUIDE_STYLE), Segment(str(number), MATCH_LINE_STYLE),
+                                         Segment(":", GUIDE_STYLE),
+                                         *_match_segments(shown, spans, cut_start, cut_end), Segment.line()]
+                    self._flush(segments)
+            except KeyboardInterrupt:
+                self.console.print("[yellow]Search interrupted[/yellow]")
+            finally:
+                results.close()
+            elapsed = time.perf_counter() - start
+            
+            found_text = f"{matched:,} files" if files_only else f"{lines:,} lines in {matched:,} files"
+            self.console.print(f"[dim]{found_text} ({searched:,} searched, {binary:,} binary skipped) "
+                               f"in {elapsed:.2f}s[/dim]")
+            if errors:
+                self.console.print(f"[yellow]{errors:,} files could not be read[/yellow]")
+            
+        except Exception as e:
+            self.console.print(f"[red]Error: {str(e)}[/red]")
+
+    def _flush(self, segments: List[Segment]) -> None:
+        if segments:
+            # Uncropped: long lines wrap in the terminal instead of being cut off
+            self.console.print(Segments(segments), end="", crop=False)
+            segments.clear()
@@ -0,0 +1,111 @@
+"""
+FuturTerminal - Ignore Rules
+.gitignore-style patterns for commands that walk directory trees
+"""
+
+import re
+from pathlib import Path
+from typing import Iterable, List, Optional, Pattern, Tuple
+
+# What tree walks skip unless told to show everything
+DEFAULT_IGNORES = (".*", "node_modules/")
+
+
+def _translate(pattern: str) -> str:
+    """A gitignore glob as a regex over "/"-separated relative paths"""
+    out, i, n = [], 0, len(pattern)
+    while i < n:
+        char = pattern[i]
+        if pattern.startswith("**/", i):
+            out.append("(?:.*/)?")
+            i += 3
+            continue
+        if pattern.startswith("**", i):
+            out.append(".*")
+            i += 2
+            continue
+        if char == "*":
+            out.append("[^/]*")
+        elif char == "?":
+            out.append("[^/]")
+        elif char == "[":
+            end = pattern.find("]", i + 2)
+            if end == -1:
+                out.append(re.escape(char))
+            else:
+                body = pattern[i + 1:end]
+                if body.startswith("!"):
+                    body = "^" + body[1:]
+                out.append("[" + body.replace("\\", "\\\\") + "]")
+                i = end
+        elif char == "\\" and i + 1 < n:
+            i += 1
+            out.append(re.escape(pattern[i]))
+        else:
+            out.append(re.escape(char))
+        i += 1
+    return "".join(out)
+
+
+def compile_pattern(line: str) -> Optional[Tuple[Pattern, bool, bool]]:
+    """(regex, negated, directories only) for one .gitignore line; None for blanks and comments"""
+    line = line.rstrip("\n").rstrip()
+    if not line or line.startswith("#"):
+        return None
+    negate = line.startswith("!")
+    if negate:
+        line = line[1:]
+    dir_only = line.endswith("/")
+    line = line.rstrip("/")
+    if not line:
+        return None
+    # A slash anywhere but the end anchors the pattern to the walk's root
+    anchored = "/" in line
+    regex = _translate(line.lstrip("/"))
+    if not anchored:
+        regex = "(?:.*/)?" + regex
+    return re.compile(regex), negate, dir_only
+
+
+class IgnoreRules:
+    """An ordered list of .gitignore-style patterns; the last one that matches wins"""
+
+    def __init__(self, patterns: Iterable[str] = ()):
+        self.rules: List[Tuple[Pattern, bool, bool]] = []
+        self.extend(patterns)
+
+    def extend(self, patterns: Iterable[str]) -> None:
+        for pattern in patterns:
+            rule = compile_pattern(pattern)
+            if rule is not None:
+                self.rules.append(rule)
+
+    def read(self, path: Path) -> None:
+        """Append the patterns of an ignore file, if it exists"""
+        try:
+            self.extend(Path(path).read_text(encoding="utf-8", errors="replace").splitlines())
+        except OSError:
+            pass
+
+    @classmethod
+    def for_walk(cls, root: Path, show_all: bool = False, extra: Iterable[str] = ()) -> "IgnoreRules":
+        """The defaults and ``root/.gitignore`` (neither with ``show_all``), then ``extra``"""
+        rules = cls()
+        if not show_all:
+            rules.extend(DEFAULT_IGNORES)
+            rules.read(Path(root) / ".gitignore")
+        rules.extend(extra)
+        return rules
+
+    def ignored(self, relative: str, is_dir: bool) -> bool:
+        """Whether a "/"-separated path relative to the walk's root is ignored"""
+        result = False
+        for regex, negate, dir_only in self.rules:
+            if dir_only and not is_dir:
+                continue
+            if regex.fullmatch(relative):
+                result = not negate
+        return result
+
+    def __bool__(self):
+        return bool(self.rules)
@@ -3,15 +3,26 @@ FuturTerminal - Sandbox Environment
 Handles safe file system operations within a sandboxed environment
 """
 
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple, Union
 import shutil
 import os
 
+# Resolved paths remembered per (current directory, typed path)
+RESOLVE_CACHE_SIZE = 1024
+
 class TerminalSandbox:
-    def __init__(self, workspace_path: Optional[Path] = None):
-        self.workspace_path = workspace_path or Path("./workspace").resolve()
+    def __init__(self, workspace_path: Optional[Path] = None, cache_size: int = RESOLVE_CACHE_SIZE):
+        self.workspace_path = Path(workspace_path or "./workspace").resolve()
         self.current_path = self.workspace_path
+        # Compared as strings with a trailing separator, so "workspace-evil"
+        # is not inside "workspace" and no Path objects are built per check
+        self._root = str(self.workspace_path)
+        self._prefix = self._root if self._root.endswith(os.sep) else self._root + os.sep
+        self._cache_size = cache_size
+        self._resolved: "OrderedDict[Tuple[Path, str], Path]" = OrderedDict()
+        self._stamp: Optional[int] = None
         
     def initialize(self) -> None:
         """Initialize the sandbox environment"""
@@ -23,23 +34,57 @@ class TerminalSandbox:
         
     def set_current_path(self, path: Path) -> None:
         """Set the current working directory"""
-        if not str(path).startswith(str(self.workspace_path)):
+        if not self.contains(path):
             raise ValueError("Access denied: Path outside sandbox")
         self.current_path = path
+
+    def contains(self, path: Union[Path, str]) -> bool:
+        """Whether an absolute, resolved path is the workspace or inside it"""
+        text = str(path)
+        return text == self._root or text.startswith(self._prefix)
         
     def sanitize_path(self, path: str) -> Path:
         """Ensure path stays within sandbox"""
+        # Entries only live while the workspace root is unchanged: one stat
+        # instead of a per-component walk
+        stamp = self._root_stamp()
+        if stamp != self._stamp:
+            self._resolved.clear()
+            self._stamp = stamp
+        key = (self.current_path, path)
+        cached = self._resolved.get(key)
+        if cached is not None:
+            self._resolved.move_to_end(key)
+            return cached
+
         try:
-            # Convert to absolute path within sandbox
+            # Convert to absolute path within sandbox (follows symlinks)
             abs_path = (self.current_path / path).resolve()
-            # Check if path is within sandbox
-            if not str(abs_path).startswith(str(self.workspace_path)):
-                raise ValueError("Access denied: Path outside sandbox")
-            return abs_path
-        except Exception as e:
+        except (OSError, RuntimeError, ValueError) as e:
             raise ValueError(f"Invalid path: {str(e)}")
+        if not self.contains(abs_path):
+            raise ValueError("Access denied: Path outside sandbox")
+
+        # Only paths that passed the check are remembered, fully resolved: a
+        # link retargeted later can't redirect a cached path
+        if self._cache_size > 0:
+            self._resolved[key] = abs_path
+            if len(self._resolved) > self._cache_size:
+                self._resolved.popitem(last=False)
+        return abs_path
+
+    def _root_stamp(self) -> Optional[int]:
+        try:
+            return os.stat(self._root).st_mtime_ns
+        except OSError:
+            return None
+
+    def invalidate(self) -> None:
+        """Forget resolved paths; called after the terminal changes the tree"""
+        self._resolved.clear()
             
     def cleanup(self) -> None:
         """Clean up the sandbox environment"""
+        self.invalidate()
         if self.workspace_path.exists():
             shutil.rmtree(self.workspace_path)
@@ -0,0 +1,206 @@
+"""
+FuturTerminal - Content Search
+grep across the workspace: files are memory-mapped and searched in worker processes
+"""
+
+import mmap
+import os
+import re
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import chain, islice
+from typing import Iterable, Iterator, List, Optional, Pattern, Tuple
+
+from .ignore import IgnoreRules
+from .viewer import SNIFF_BYTES, looks_binary
+
+# Files per worker task, and tasks queued per worker ahead of the output
+SEARCH_BATCH = 64
+SEARCH_AHEAD = 4
+# Fewer files than this are searched in-process: a pool costs more to start
+PARALLEL_MIN_FILES = 2 * SEARCH_BATCH
+# Bytes of a matching line that are shown (minified bundles are one line),
+# starting a little before the first match
+LINE_PREVIEW = 256
+PREVIEW_LEAD = 64
+COUNT_CHUNK = 1 << 20
+
+# One matching line: (line number, shown bytes, match spans in them, cut at start, cut at end)
+LineMatch = Tuple[int, bytes, List[Tuple[int, int]], bool, bool]
+# One task's result: (files searched, binaries skipped, unreadable, [(path, matches)])
+BatchResult = Tuple[int, int, int, List[Tuple[str, List[LineMatch]]]]
+
+
+@lru_cache(maxsize=16)
+def compile_search(pattern: str, ignore_case: bool = False, fixed: bool = False,
+                   word: bool = False) -> Pattern[bytes]:
+    """The bytes regex for a grep query (compiled once per process); raises re.error"""
+    source = re.escape(pattern) if fixed else pattern
+    if word:
+        source = rf"\b(?:{source})\b"
+    flags = re.MULTILINE | (re.IGNORECASE if ignore_case else 0)
+    return re.compile(source.encode("utf-8"), flags)
+
+
+def iter_files(root: str, rules: IgnoreRules, contains) -> Iterator[str]:
+    """Files under ``root`` in ``tree`` order, without recursion.
+
+    Ignored entries are pruned like in ``tree``; symlinked directories are
+    never followed and a symlinked file is only searched if ``contains``
+    accepts its target, so the search can't leave the sandbox.
+    """
+    stack = [(root, "")]
+    while stack:
+        path, relative = stack.pop()
+        try:
+            with os.scandir(path) as it:
+                entries = sorted(it, key=lambda entry: entry.name)
+        except OSError:
+            continue
+        subdirs = []
+        for entry in entries:
+            relative_child = f"{relative}/{entry.name}" if relative else entry.name
+            try:
+                is_dir = entry.is_dir()
+                if rules and rules.ignored(relative_child, is_dir):
+                    continue
+                if entry.is_symlink():
+                    if is_dir or not contains(os.path.realpath(entry.path)):
+                        continue
+                elif is_dir:
+                    subdirs.append((entry.path, relative_child))
+                    continue
+                if not entry.is_file():
+                    continue  # sockets, fifos, dangling links
+            except OSError:
+                continue
+            # Directories come after their parent's files, as in grep -r
+            yield entry.path
+        stack.extend(reversed(subdirs))
+
+
+def _count_newlines(data, start: int, end: int) -> int:
+    count = 0
+    while start < end:
+        stop = min(end, start + COUNT_CHUNK)
+        count += data[start:stop].count(b"\n")
+        start = stop
+    return count
+
+
+def search_file(path: str, regex: Pattern[bytes], max_count: Optional[int] = None) -> Optional[List[LineMatch]]:
+    """Matching lines of one file, each at most once; None for binaries. Raises OSError."""
+    with open(path, "rb") as handle:
+        size = os.fstat(handle.fileno()).st_size
+        if not size:
+            return []
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            if looks_binary(data[:SNIFF_BYTES]):
+                return None
+            matches: List[LineMatch] = []
+            line_number, counted, position = 1, 0, 0
+            while position <= size:
+                match = regex.search(data, position)
+                if match is None or (match.start() == size and data[size - 1] == 0x0A):
+                    break  # nothing left, or only the empty "line" after the final newline
+                line_start = data.rfind(b"\n", 0, match.start()) + 1
+                line_end = data.find(b"\n", match.start())
+                if line_end < 0:
+                    line_end = size
+                if match.end() > line_end:
+                    # The match ran into the next line (\s, [^x], \n...): lines are
+                    # searched on their own, so look again within this one
+                    match = regex.search(data, line_start, line_end)
+                    if match is None:
+                        position = line_end + 1
+                        continue
+                line_number += _count_newlines(data, counted, line_start)
+                counted = line_start
+
+                start, end = line_start, line_end
+                if end - start > LINE_PREVIEW:
+                    start = max(line_start, match.start() - PREVIEW_LEAD)
+                    end = min(line_end, start + LINE_PREVIEW)
+                # Every match on the line, for highlighting
+                spans = []
+                while match is not None and match.start() < end:
+                    if match.end() > match.start():
+                        spans.append((match.start() - start, min(match.end(), end) - start))
+                    following = match.end() + (match.end() == match.start())
+                    if following > line_end:
+                        break
+                    match = regex.search(data, following, line_end)
+                shown = data[start:end]
+                if end == line_end and shown.endswith(b"\r"):
+                    shown = shown[:-1]
+                matches.append((line_number, shown, spans, start > line_start, end < line_end))
+                if max_count is not None and len(matches) >= max_count:
+                    break
+                position = line_end + 1
+            return matches
+
+
+def search_batch(paths: List[str], query: Tuple[str, bool, bool, bool],
+                 max_count: Optional[int] = None) -> BatchResult:
+    """Search a list of files for ``query`` (compile_search's arguments); runs in a worker"""
+    regex = compile_search(*query)
+    searched = binary = errors = 0
+    results = []
+    for path in paths:
+        try:
+            matches = search_file(path, regex, max_count)
+        except (OSError, ValueError):
+            errors += 1
+            continue
+        if matches is None:
+            binary += 1
+            continue
+        searched += 1
+        if matches:
+            results.append((path, matches))
+    return searched, binary, errors, results
+
+
+def _batches(files: Iterable[str]) -> Iterator[List[str]]:
+    files = iter(files)
+    while True:
+        batch = list(islice(files, SEARCH_BATCH))
+        if not batch:
+            return
+        yield batch
+
+
+def search_files(files: Iterable[str], query: Tuple[str, bool, bool, bool], max_count: Optional[int] = None,
+                 jobs: Optional[int] = None) -> Iterator[BatchResult]:
+    """Search ``files`` on ``jobs`` processes, yielding each batch's results in the files' order.
+
+    Files are walked lazily while the workers run, with at most SEARCH_AHEAD
+    tasks per worker outstanding; a batch is yielded as soon as it and all
+    before it are done.
+    """
+    jobs = jobs or os.cpu_count() or 1
+    batches = _batches(files)
+    head = list(islice(batches, PARALLEL_MIN_FILES // SEARCH_BATCH))
+    batches = chain(head, batches)
+    executor = None
+    if jobs > 1 and sum(map(len, head)) >= PARALLEL_MIN_FILES:
+        try:
+            executor = ProcessPoolExecutor(max_workers=jobs)
+        except (OSError, NotImplementedError):
+            pass  # no process support here (e.g. no working semaphores)
+    if executor is None:
+        for batch in batches:
+            yield search_batch(batch, query, max_count)
+        return
+
+    pending = deque()
+    try:
+        for batch in batches:
+            pending.append(executor.submit(search_batch, batch, query, max_count))
+            while pending and (len(pending) >= jobs * SEARCH_AHEAD or pending[0].done()):
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
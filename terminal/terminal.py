@@ -6,6 +6,7 @@ Handles command processing, history, and autocompletion
 import os
 import sys
 import shlex
+import argparse
 from pathlib import Path
 from typing import List, Dict, Optional, Callable
 from rich.console import Console
@@ -16,7 +17,17 @@ from rich.text import Text
 from rich import print as rprint
 
 from .sandbox import TerminalSandbox
-from .fs_commands import FileSystemCommands
+from .fs_commands import FileSystemCommands, SORT_ORDERS
+
+
+class CommandArgumentParser(argparse.ArgumentParser):
+    """Option parsing for terminal commands: errors raise ValueError instead of exiting"""
+
+    def __init__(self, prog: str, **kwargs):
+        super().__init__(prog=prog, add_help=False, **kwargs)
+
+    def error(self, message):
+        raise ValueError(f"{self.prog}: {message}")
 
 class FuturTerminalCLI:
     def __init__(self, sandbox_path=None):
@@ -34,10 +45,14 @@ class FuturTerminalCLI:
             'mkdir': self._cmd_mkdir,
             'touch': self._cmd_touch,
             'cat': self._cmd_cat,
+            'head': self._cmd_head,
+            'tail': self._cmd_tail,
             'clear': self._cmd_clear,
             'help': self._cmd_help,
             'history': self._cmd_history,
             'tree': self._cmd_tree,
+            'du': self._cmd_du,
+            'grep': self._cmd_grep,
             'exit': self._cmd_exit
         }
         
@@ -51,16 +66,20 @@ class FuturTerminalCLI:
         
         # Command descriptions for help
         self.command_descriptions = {
-            'ls': 'List directory contents',
+            'ls': 'List directory contents (--sort, --limit, --json)',
             'cd': 'Change directory',
             'pwd': 'Print working directory',
             'mkdir': 'Create a new directory',
             'touch': 'Create an empty file',
-            'cat': 'Display file contents',
+            'cat': 'Display file contents (-n, --from LINE, --hex)',
+            'head': 'Show the first lines of a file (-n N)',
+            'tail': 'Show the last lines of a file (-n N, -f to follow)',
             'clear': 'Clear the terminal screen',
             'help': 'Show this help message',
             'history': 'Show command history',
-            'tree': 'Display directory structure',
+            'tree': 'Display directory structure (--depth, -a, -I pattern)',
+            'du': 'Show disk usage (--top N for the largest directories)',
+            'grep': 'Search file contents (-i, -F, -w, -l, -m N, -a, -I pattern, -j N)',
             'exit': 'Exit the terminal'
         }
 
@@ -75,8 +94,16 @@ class FuturTerminalCLI:
 
     def _cmd_ls(self, args: List[str]) -> None:
         """List directory contents"""
-        path = args[0] if args else None
-        self.fs.list_directory(path)
+        parser = CommandArgumentParser("ls")
+        parser.add_argument("path", nargs="?")
+        parser.add_argument("--sort", choices=SORT_ORDERS, default="name")
+        parser.add_argument("-r", "--reverse", action="store_true")
+        parser.add_argument("-n", "--limit", type=int)
+        parser.add_argument("--json", action="store_true")
+        options = self._parse(parser, args)
+        if options:
+            self.fs.list_directory(options.path, sort=options.sort, reverse=options.reverse,
+                                   limit=options.limit, ndjson=options.json)
 
     def _cmd_cd(self, args: List[str]) -> None:
         """Change directory"""
@@ -105,12 +132,46 @@ class FuturTerminalCLI:
             return
         self.fs.create_file(args[0])
 
+    def _parse(self, parser: argparse.ArgumentParser, args: List[str]) -> Optional[argparse.Namespace]:
+        try:
+            return parser.parse_intermixed_args(args)
+        except ValueError as e:
+            self.console.print(f"[red]Error: {str(e)}[/red]")
+            return None
+
     def _cmd_cat(self, args: List[str]) -> None:
         """Display file contents"""
         if not args:
             self.console.print("[red]Error: File name required[/red]")
             return
-        self.fs.read_file(args[0])
+        parser = CommandArgumentParser("cat")
+        parser.add_argument("path")
+        parser.add_argument("-n", "--number", action="store_true")
+        parser.add_argument("--hex", action="store_true")
+        parser.add_argument("--from", dest="start", type=int, default=1)
+        options = self._parse(parser, args)
+        if options:
+            self.fs.read_file(options.path, number=options.number, hexdump=True if options.hex else None,
+                              start_line=options.start)
+
+    def _cmd_head(self, args: List[str]) -> None:
+        """Show the first lines of a file"""
+        parser = CommandArgumentParser("head")
+        parser.add_argument("path")
+        parser.add_argument("-n", "--lines", type=int, default=10)
+        options = self._parse(parser, args)
+        if options:
+            self.fs.head_file(options.path, options.lines)
+
+    def _cmd_tail(self, args: List[str]) -> None:
+        """Show the last lines of a file"""
+        parser = CommandArgumentParser("tail")
+        parser.add_argument("path")
+        parser.add_argument("-n", "--lines", type=int, default=10)
+        parser.add_argument("-f", "--follow", action="store_true")
+        options = self._parse(parser, args)
+        if options:
+            self.fs.tail_file(options.path, options.lines, follow=options.follow)
 
     def _cmd_clear(self, args: List[str]) -> None:
         """Clear the terminal screen"""
@@ -146,8 +207,44 @@ class FuturTerminalCLI:
 
     def _cmd_tree(self, args: List[str]) -> None:
         """Display directory structure"""
-        path = args[0] if args else None
-        self.fs.show_tree(path)
+        parser = CommandArgumentParser("tree")
+        parser.add_argument("path", nargs="?")
+        parser.add_argument("-L", "--depth", type=int)
+        parser.add_argument("-a", "--all", action="store_true")
+        parser.add_argument("-I", "--ignore", action="append", default=[])
+        options = self._parse(parser, args)
+        if options:
+            self.fs.show_tree(options.path, depth=options.depth, show_all=options.all, ignore=options.ignore)
+
+    def _cmd_du(self, args: List[str]) -> None:
+        """Show disk usage"""
+        parser = CommandArgumentParser("du")
+        parser.add_argument("path", nargs="?")
+        parser.add_argument("-n", "--top", type=int)
+        parser.add_argument("--no-cache", action="store_true")
+        options = self._parse(parser, args)
+        if options:
+            self.fs.disk_usage(options.path, top=options.top, use_cache=not options.no_cache)
+
+    def _cmd_grep(self, args: List[str]) -> None:
+        """Search file contents"""
+        parser = CommandArgumentParser("grep")
+        parser.add_argument("pattern")
+        parser.add_argument("path", nargs="?")
+        parser.add_argument("-i", "--ignore-case", action="store_true")
+        parser.add_argument("-F", "--fixed-strings", action="store_true")
+        parser.add_argument("-w", "--word", action="store_true")
+        parser.add_argument("-l", "--files-with-matches", action="store_true")
+        parser.add_argument("-m", "--max-count", type=int)
+        parser.add_argument("-a", "--all", action="store_true")
+        parser.add_argument("-I", "--ignore", action="append", default=[])
+        parser.add_argument("-j", "--jobs", type=int)
+        options = self._parse(parser, args)
+        if options:
+            self.fs.search(options.pattern, options.path, ignore_case=options.ignore_case,
+                           fixed=options.fixed_strings, word=options.word,
+                           files_only=options.files_with_matches, max_count=options.max_count,
+                           show_all=options.all, ignore=options.ignore, jobs=options.jobs)
 
     def _cmd_exit(self, args: List[str]) -> None:
         """Exit the terminal"""
@@ -0,0 +1,149 @@
+"""
+FuturTerminal - File Viewer
+Memory-mapped, read-only access to files of any size for cat/head/tail
+"""
+
+import mmap
+import os
+from array import array
+from bisect import bisect_right
+from pathlib import Path
+from typing import Iterator, Optional, Tuple
+
+# The line index has one checkpoint per INDEX_CHUNK bytes: a jump to any line
+# scans at most that much, and even a 10 GB file needs only ~160 KB of index
+INDEX_CHUNK = 1 << 20
+# Bytes of a single line that are shown (minified bundles are one line)
+LINE_LIMIT = 16 * 1024
+SNIFF_BYTES = 8192
+HEX_WIDTH = 16
+# Bytes that don't occur in text, apart from \b \t \n \f \r and ESC
+_CONTROL = bytes(set(range(32)) - {8, 9, 10, 12, 13, 27} | {127})
+
+
+def looks_binary(sample: bytes) -> bool:
+    """NUL bytes, or not UTF-8 and full of control bytes; ``sample`` is a file's first SNIFF_BYTES"""
+    if b"\0" in sample:
+        return True
+    try:
+        sample.decode("utf-8")
+        return False
+    except UnicodeDecodeError as e:
+        # A character cut off by the sample's end doesn't count
+        if e.start >= len(sample) - 3 and len(sample) == SNIFF_BYTES:
+            return False
+    # Legacy 8-bit text has high bytes, binaries have control bytes
+    return len(sample.translate(None, _CONTROL)) < len(sample) * 0.9
+
+
+class FileView:
+    """A file mapped into memory with a lazy, sparse line index"""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._file = open(self.path, "rb")
+        try:
+            self.size = os.fstat(self._file.fileno()).st_size
+            # Empty files can't be mapped
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if self.size else None
+        except Exception:
+            self._file.close()
+            raise
+        # (line number, offset) of the first line starting after each chunk
+        self._index_lines = array("Q", [0])
+        self._index_offsets = array("Q", [0])
+        self._indexed = 0
+        self._newlines = 0
+
+    def close(self) -> None:
+        if self._map is not None:
+            self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def is_binary(self) -> bool:
+        """Whether the start of the file looks binary"""
+        return self._map is not None and looks_binary(self._map[:SNIFF_BYTES])
+
+    def _skip_lines(self, offset: int, count: int) -> Optional[int]:
+        """The offset ``count`` lines after ``offset``; None if the file ends first"""
+        find = self._map.find
+        for _ in range(count):
+            newline = find(b"\n", offset)
+            if newline < 0 or newline + 1 >= self.size:
+                return None
+            offset = newline + 1
+        return offset
+
+    def _extend_index(self) -> bool:
+        """Index one more chunk; False once the whole file is indexed"""
+        start = self._indexed
+        if start >= self.size:
+            return False
+        end = min(start + INDEX_CHUNK, self.size)
+        # Counting happens in C; only the chunk's last newline is located
+        newlines = self._map[start:end].count(b"\n")
+        if newlines:
+            self._newlines += newlines
+            last = self._map.rfind(b"\n", start, end)
+            if last + 1 < self.size:
+                self._index_lines.append(self._newlines)
+                self._index_offsets.append(last + 1)
+        self._indexed = end
+        return True
+
+    def line_offset(self, number: int) -> Optional[int]:
+        """Where 0-based line ``number`` starts; None past the last line"""
+        if self._map is None:
+            return None
+        while self._index_lines[-1] < number and self._extend_index():
+            pass
+        checkpoint = bisect_right(self._index_lines, number) - 1
+        return self._skip_lines(self._index_offsets[checkpoint], number - self._index_lines[checkpoint])
+
+    def lines(self, offset: int = 0) -> Iterator[Tuple[int, bytes, int]]:
+        """Lines from ``offset`` on: (offset, at most LINE_LIMIT bytes without the newline, full length)"""
+        if self._map is None:
+            return
+        find, data = self._map.find, self._map
+        while offset < self.size:
+            newline = find(b"\n", offset)
+            end = self.size if newline < 0 else newline
+            length = end - offset
+            line = data[offset:offset + min(length, LINE_LIMIT)]
+            if line.endswith(b"\r") and length <= LINE_LIMIT:
+                line = line[:-1]
+            yield offset, line, length
+            offset = end + 1
+
+    def tail_offset(self, count: int) -> int:
+        """Where the last ``count`` lines start, found by scanning back from the end"""
+        if self._map is None or count <= 0:
+            return self.size
+        end = self.size - 1 if self._map[self.size - 1:self.size] == b"\n" else self.size
+        for _ in range(count):
+            newline = self._map.rfind(b"\n", 0, end)
+            if newline < 0:
+                return 0
+            end = newline
+        return end + 1
+
+    def hex_rows(self, offset: int = 0) -> Iterator[Tuple[int, bytes]]:
+        """HEX_WIDTH-byte rows from ``offset`` on (rounded down to a row)"""
+        if self._map is None:
+            return
+        for start in range(offset - offset % HEX_WIDTH, self.size, HEX_WIDTH):
+            yield start, self._map[start:start + HEX_WIDTH]
+
+
+def format_hex_row(offset: int, row: bytes) -> str:
+    """One ``xxd``-style line: offset, hex bytes in two groups, printable ASCII"""
+    cells = [f"{byte:02x}" for byte in row] + ["  "] * (HEX_WIDTH - len(row))
+    half = HEX_WIDTH // 2
+    text = "".join(chr(byte) if 32 <= byte < 127 else "." for byte in row)
+    return f"{offset:08x}  {' '.join(cells[:half])}  {' '.join(cells[half:])}  |{text}|"
@@ -0,0 +1,52 @@
+import json
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+CONFIG_PATH = Path(__file__).resolve().parent.parent / "config" / "config.json"
+
+# (path, loader) -> ((mtime_ns, size) or None if missing, parsed value)
+_cache: Dict[Tuple[Path, Callable], Tuple[Optional[Tuple[int, int]], Any]] = {}
+_cache_lock = threading.Lock()
+
+
+def cached_load(path: Path, loader: Callable[[Path], Any]) -> Any:
+    """``loader(path)``, re-run only when the file's mtime or size changes.
+
+    The cached value is shared between callers; treat it as read-only.
+    Loaders that raise are not cached.
+    """
+    path = Path(path)
+    try:
+        st = path.stat()
+        stamp = (st.st_mtime_ns, st.st_size)
+    except OSError:
+        stamp = None
+    key = (path, loader)
+    with _cache_lock:
+        hit = _cache.get(key)
+    if hit is not None and hit[0] == stamp:
+        return hit[1]
+    value = loader(path)
+    with _cache_lock:
+        _cache[key] = (stamp, value)
+    return value
+
+
+def _read_config(path: Path) -> dict:
+    try:
+        text = Path(path).read_text(encoding="utf-8")
+    except OSError:
+        return {}
+    if not text.strip():
+        return {}
+    try:
+        data = json.loads(text)
+    except ValueError:
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def load_config(path: Path = CONFIG_PATH) -> dict:
+    """Read config/config.json; a missing, empty or invalid file means defaults"""
+    return cached_load(path, _read_config)
@@ -0,0 +1,304 @@
+# utils/devserver.py
+"""
+Dev-server supervisor.
+
+Dev servers run as background children of the SHNK session, each in its
+own process group, with their output captured in
+``<project>/.shnk/dev-server.log``. A free port is picked up front (5173
+for Vite and 3000 for Next.js when available), and the browser is opened
+only once that port answers HTTP. Running servers can be listed, stopped
+and restarted from the menu; all of them are stopped when SHNK exits.
+"""
+
+import atexit
+import os
+import socket
+import subprocess
+import threading
+import time
+import urllib.error
+import urllib.request
+import webbrowser
+from itertools import count
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from utils.logger import Logger
+from utils.package_manager import resolve
+from utils.runner import process_group_kwargs, stop_process_tree
+
+# Default port and the script arguments that pin the server to a port
+FRAMEWORKS = {
+    "vite": {"port": 5173, "args": ["--port", "{port}", "--strictPort"]},
+    "next": {"port": 3000, "args": ["--port", "{port}"]},
+}
+READY_TIMEOUT = 60.0
+POLL_INTERVAL = 0.25
+PORT_SEARCH = 50
+START_ATTEMPTS = 3
+LOG_DIR = ".shnk"
+LOG_NAME = "dev-server.log"
+
+
+def port_is_free(port: int) -> bool:
+    """True if nothing listens on ``port`` on the IPv4 or IPv6 loopback"""
+    for family, host in ((socket.AF_INET, "127.0.0.1"), (socket.AF_INET6, "::1")):
+        try:
+            sock = socket.socket(family, socket.SOCK_STREAM)
+        except OSError:
+            continue
+        with sock:
+            if os.name != "nt":
+                # Dev servers bind with SO_REUSEADDR too, so TIME_WAIT leftovers are no conflict
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            try:
+                sock.bind((host, port))
+            except OSError as e:
+                # No IPv6 loopback on this machine is not a conflict
+                if family == socket.AF_INET6 and e.errno == getattr(os, "EADDRNOTAVAIL", 99):
+                    continue
+                return False
+    return True
+
+
+def find_free_port(preferred: int, exclude=()) -> int:
+    """``preferred`` or the next free port after it, else any free port"""
+    for port in range(preferred, preferred + PORT_SEARCH):
+        if port not in exclude and port_is_free(port):
+            return port
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def answers_http(url: str, timeout: float = 1.0) -> bool:
+    """True once anything at ``url`` answers HTTP (any status code)"""
+    try:
+        with urllib.request.urlopen(url, timeout=timeout):
+            return True
+    except urllib.error.HTTPError:
+        return True
+    except (OSError, ValueError):
+        return False
+
+
+class DevServer:
+    """One dev server process and its log"""
+
+    def __init__(self, server_id: int, project_path: Path, framework: str, pm, port: int):
+        self.id = server_id
+        self.project_path = Path(project_path)
+        self.framework = framework
+        self.pm = pm
+        self.port = port
+        self.process: Optional[subprocess.Popen] = None
+        self.started: Optional[float] = None
+        self.ready = False
+        self.stopped = False
+
+    @property
+    def url(self) -> str:
+        return f"http://localhost:{self.port}/"
+
+    @property
+    def log_path(self) -> Path:
+        return self.project_path / LOG_DIR / LOG_NAME
+
+    @property
+    def command(self) -> str:
+        args = [arg.format(port=self.port) for arg in FRAMEWORKS[self.framework]["args"]]
+        return self.pm.run("dev", args)
+
+    @property
+    def running(self) -> bool:
+        return self.process is not None and self.process.poll() is None
+
+    @property
+    def status(self) -> str:
+        if self.running:
+            return "ready" if self.ready else "starting"
+        if self.stopped:
+            return "stopped"
+        return f"exited ({self.process.returncode})" if self.process else "not started"
+
+    def uptime(self) -> float:
+        return time.time() - self.started if self.started and self.running else 0.0
+
+    def spawn(self) -> None:
+        """Start the server in the background, appending its output to the log"""
+        self.log_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.log_path, "ab") as log:
+            log.write(f"--- {time.strftime('%Y-%m-%d %H:%M:%S')} $ {self.command}\n".encode())
+            log.flush()
+            # BROWSER=none: the supervisor opens the browser itself, once the port answers
+            env = dict(os.environ, PORT=str(self.port), BROWSER="none")
+            self.process = subprocess.Popen(
+                self.command, shell=True, cwd=self.project_path, env=env,
+                stdin=subprocess.DEVNULL, stdout=log, stderr=subprocess.STDOUT,
+                **process_group_kwargs(),
+            )
+        self.started = time.time()
+        self.ready = self.stopped = False
+
+    def wait_ready(self, timeout: float = READY_TIMEOUT) -> bool:
+        """Poll the port until it answers HTTP, the process exits or ``timeout`` passes"""
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if not self.running:
+                return False
+            if answers_http(self.url):
+                self.ready = True
+                return True
+            time.sleep(POLL_INTERVAL)
+        return False
+
+    def stop(self) -> None:
+        if self.process is not None:
+            stop_process_tree(self.process)
+        self.stopped = True
+        self.ready = False
+
+    def tail(self, lines: int = 20) -> List[str]:
+        """Last lines of the server's log"""
+        try:
+            with open(self.log_path, "rb") as log:
+                log.seek(0, os.SEEK_END)
+                log.seek(max(0, log.tell() - 64 * 1024))
+                return log.read().decode("utf-8", errors="replace").splitlines()[-lines:]
+        except OSError:
+            return []
+
+    def __repr__(self):
+        return f"<DevServer {self.id} {self.project_path.name} :{self.port} {self.status}>"
+
+
+class DevServerSupervisor:
+    """Starts, tracks and stops the dev servers of one SHNK session"""
+
+    def __init__(self):
+        self.servers: Dict[int, DevServer] = {}
+        self._ids = count(1)
+        self._lock = threading.Lock()
+        atexit.register(self.stop_all)
+
+    def find(self, project_path: Path) -> Optional[DevServer]:
+        project_path = Path(project_path).resolve()
+        for server in self.servers.values():
+            if server.project_path.resolve() == project_path and server.running:
+                return server
+        return None
+
+    def list(self) -> List[DevServer]:
+        return list(self.servers.values())
+
+    def get(self, server_id: int) -> Optional[DevServer]:
+        return self.servers.get(server_id)
+
+    def start(self, project_path: Path, framework: str, package_manager=None, open_browser: bool = True,
+              logger: Optional[Logger] = None, ready_timeout: float = READY_TIMEOUT,
+              server_id: Optional[int] = None, port: Optional[int] = None) -> Optional[DevServer]:
+        """Start a project's dev server; returns it once it answers (or keeps starting), else None.
+
+        ``port`` (default: the framework's usual one) is used when free,
+        otherwise the next free port after it.
+        """
+        logger = logger or Logger()
+        existing = self.find(project_path)
+        if existing is not None:
+            logger.log(f"🧪 Dev server for {existing.project_path.name} is already running at {existing.url}")
+            return existing
+
+        pm = resolve(package_manager)
+        preferred = port or FRAMEWORKS[framework]["port"]
+        for attempt in range(1, START_ATTEMPTS + 1):
+            with self._lock:
+                taken = {s.port for s in self.servers.values() if s.running}
+                port = find_free_port(preferred, exclude=taken)
+                server = DevServer(server_id or next(self._ids), project_path, framework, pm, port)
+                server.spawn()
+                self.servers[server.id] = server
+            server_id = server.id
+            logger.log(f"🧪 Starting development server on port {port} (log: {server.log_path})")
+
+            start = time.perf_counter()
+            if server.wait_ready(ready_timeout):
+                logger.success(f"🌐 Dev server ready at {server.url} ({time.perf_counter() - start:.1f}s)")
+                if open_browser:
+                    try:
+                        webbrowser.open(server.url)
+                    except Exception as e:
+                        logger.warning(f"⚠️ Couldn't open browser automatically: {e}")
+                        logger.log(f"Please open this URL manually: {server.url}")
+                return server
+            if server.running:
+                logger.warning(f"⚠️ Dev server didn't answer on {server.url} within {ready_timeout:.0f}s; "
+                               f"it keeps running in the background (log: {server.log_path})")
+                return server
+
+            output = "\n".join(server.tail(10))
+            if "in use" in output or "EADDRINUSE" in output:
+                # Another program grabbed the port between the check and the bind
+                preferred = port + 1
+                continue
+            logger.error(f"❌ Dev server exited with status {server.process.returncode}; "
+                         f"see {server.log_path}")
+            return None
+        logger.error("❌ Could not find a free port for the dev server.")
+        return None
+
+    def stop(self, server_id: int) -> bool:
+        server = self.servers.get(server_id)
+        if server is None:
+            return False
+        server.stop()
+        return True
+
+    def restart(self, server_id: int, logger: Optional[Logger] = None) -> Optional[DevServer]:
+        """Stop a server and start it again, on the same port if it is still free"""
+        server = self.servers.get(server_id)
+        if server is None:
+            return None
+        server.stop()
+        return self.start(server.project_path, server.framework, server.pm, open_browser=False,
+                          logger=logger, server_id=server.id, port=server.port)
+
+    def stop_all(self) -> int:
+        """Stop every running server; returns how many were running"""
+        running = [server for server in self.servers.values() if server.running]
+        for server in running:
+            server.stop()
+        return len(running)
+
+    def follow(self, server: DevServer, logger: Optional[Logger] = None) -> None:
+        """Stream a server's log until it exits or Ctrl+C, then stop it (headless mode)"""
+        logger = logger or Logger()
+        logger.log("Press Ctrl+C to stop the dev server.")
+        try:
+            with open(server.log_path, "r", encoding="utf-8", errors="replace") as log:
+                log.seek(0, os.SEEK_END)
+                while server.running:
+                    line = log.readline()
+                    if line:
+                        logger.output(line.rstrip("\n"))
+                    else:
+                        time.sleep(POLL_INTERVAL)
+                for line in log:
+                    logger.output(line.rstrip("\n"))
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.stop()
+            logger.log("🛑 Dev server stopped.")
+
+
+_supervisor: Optional[DevServerSupervisor] = None
+_supervisor_lock = threading.Lock()
+
+
+def supervisor() -> DevServerSupervisor:
+    """The session-wide dev-server supervisor"""
+    global _supervisor
+    with _supervisor_lock:
+        if _supervisor is None:
+            _supervisor = DevServerSupervisor()
+        return _supervisor
@@ -1,30 +1,105 @@
 # utils/installer.py
 
-import subprocess
+import os
+from pathlib import Path
+from typing import Optional
+from utils import tracing
 from utils.logger import Logger
+from utils.package_manager import resolve
 
-logger = Logger()
+_logger = Logger()
 
 
-def run_command(command, cwd=None):
-    """Run a shell command with optional working directory."""
+# Upper bound for generator and install steps (SHNK_COMMAND_TIMEOUT seconds)
+STEP_TIMEOUT = float(os.environ.get("SHNK_COMMAND_TIMEOUT", 30 * 60))
+# `code .` only hands the folder to the editor and returns
+EDITOR_TIMEOUT = 60
+
+
+def run_command(command, cwd=None, step: Optional[str] = None, step_key: Optional[str] = None,
+                logger: Optional[Logger] = None, env: Optional[dict] = None,
+                timeout: Optional[float] = None):
+    """Run a shell command through the shared async runner and return its CommandResult.
+
+    Output is streamed line by line: to the logger, or, when ``step`` is
+    given, through a live progress line driven by npm's own output with the
+    step's duration reported. Such steps also take a slot from the shared
+    install gate, so parallel scaffolds can't overload the machine, and
+    default to a ``STEP_TIMEOUT`` limit. ``env`` adds environment variables;
+    in offline mode the package manager is pointed at the local mirror.
+    The result is truthy if the command succeeded.
+    """
+    from utils.mirror import registry_env
+
+    logger = logger or _logger
+    env = {**os.environ, **registry_env(), **(env or {})}
+    logger.log(f"$ {command}")
+
+    with tracing.span(command if len(command) <= 60 else command[:57] + "...", cat="command",
+                      command=command, cwd=str(cwd) if cwd else None, step=step) as span:
+        result = _run(command, cwd, step, step_key, logger, env, timeout)
+        span.set(returncode=result.returncode, timed_out=result.timed_out, cancelled=result.cancelled)
+
+    if not result.ok:
+        logger.error(f"✗ Command failed: '{command}' {result.describe()}.")
+        return result
+    logger.success("✓ Done.")
+    return result
+
+
+def _run(command, cwd, step, step_key, logger, env, timeout):
+    from utils.runner import CommandResult, default_runner
+
     try:
-        logger.log(f"$ {command}")
-        subprocess.run(command, shell=True, check=True, cwd=cwd)
-        logger.success("✓ Done.")
-    except subprocess.CalledProcessError as e:
-        logger.error(f"✗ Command failed: {e}")
-
-def npm_init(project_path):
-    run_command("npm init -y", cwd=project_path)
-
-def npm_install(packages, project_path):
-    if isinstance(packages, list):
-        pkg_str = " ".join(packages)
-    else:
-        pkg_str = packages
-    run_command(f"npm install {pkg_str}", cwd=project_path)
-
-def install_tailwind_config(project_path):
+        if step is None:
+            result = default_runner().run(command, cwd=cwd, env=env, timeout=timeout,
+                                          on_line=lambda stream, line: logger.output(line))
+        else:
+            from utils.progress import StepProgress
+            from utils.scheduler import install_gate
+
+            with install_gate().slot(), StepProgress(step, key=step_key, logger=logger) as progress:
+                result = default_runner().run(command, cwd=cwd, env=env,
+                                              timeout=STEP_TIMEOUT if timeout is None else timeout,
+                                              on_line=lambda stream, line: progress.feed(line))
+                progress.failed = not result.ok
+    except OSError as e:
+        return CommandResult(command, None, 0.0, [str(e)])
+    return result
+
+
+def open_in_editor(project_path, logger: Optional[Logger] = None):
+    """Open the project in VS Code"""
+    return run_command("code .", cwd=project_path, logger=logger, timeout=EDITOR_TIMEOUT)
+
+def init_project(project_path, package_manager=None):
+    pm = resolve(package_manager)
+    return run_command(pm.init(), cwd=project_path)
+
+def install_packages(packages, project_path, step: Optional[str] = None, step_key: Optional[str] = None,
+                     logger: Optional[Logger] = None, package_manager=None):
+    """Install ``packages`` (a list or space separated string) plus package.json"""
+    pm = resolve(package_manager)
+    if isinstance(packages, str):
+        packages = packages.split()
+    packages = list(packages or [])
+    return run_command(pm.install(packages), cwd=project_path,
+                       step=step or f"Installing {' '.join(packages) or 'dependencies'}",
+                       step_key=step_key, logger=logger, env=pm.env())
+
+def install_locked(lock, project_path, project_name: str, step: Optional[str] = None,
+                   step_key: Optional[str] = None, logger: Optional[Logger] = None, package_manager=None):
+    """Put a template's pinned package.json and lockfile in place and install them frozen"""
+    pm = resolve(package_manager)
+    try:
+        lock.apply(Path(project_path), project_name)
+    except OSError as e:
+        (logger or _logger).error(f"❌ Could not apply the template lockfile: {e}")
+        return False
+    return run_command(pm.ci(project_path), cwd=project_path, step=step or "Installing locked dependencies",
+                       step_key=step_key, logger=logger, env=pm.env())
+
+def install_tailwind_config(project_path, package_manager=None):
     # Tailwind init command
-    run_command("npx tailwindcss init -p", cwd=project_path)
+    pm = resolve(package_manager)
+    return run_command(pm.exec("tailwindcss", ["init", "-p"]), cwd=project_path)
@@ -0,0 +1,135 @@
+# utils/lockfiles.py
+"""
+Pinned lockfiles shipped with each template pack.
+
+``templates/<pack>/locks/<pm>-<js|ts>/`` holds the project's package.json,
+the package manager's lockfile and ``lock.json``:
+
+    {"generator": "create-vite", "version": "6.5.0", "refreshed": "2026-10-17T09:30:00"}
+
+When a lock exists for the chosen package manager and variant, scaffolds run
+the generator at the pinned version, drop in the locked package.json and
+lockfile and install with ``npm ci`` (or the manager's frozen install), so
+every project gets the same tree without resolving the registry again.
+``shnk templates refresh-locks`` regenerates the locks on purpose.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Optional
+
+from utils.snapshots import patch_project_name
+
+LOCKS_DIR = "locks"
+LOCK_META = "lock.json"
+# Name of the root package inside a stored lock; patched per project
+PLACEHOLDER_NAME = "shnk-template"
+
+
+def lock_flavor(pm, typescript: bool) -> str:
+    return f"{pm.name}-{'ts' if typescript else 'js'}"
+
+
+class TemplateLock:
+    """A pinned package.json + lockfile for one template, manager and variant"""
+
+    def __init__(self, directory: Path, pm, meta: dict):
+        self.directory = directory
+        self.pm = pm
+        self.generator = meta.get("generator")
+        self.version = meta.get("version")
+        self.refreshed = meta.get("refreshed")
+
+    @property
+    def package_json(self) -> Path:
+        return self.directory / "package.json"
+
+    @property
+    def lockfile(self) -> Path:
+        return self.directory / self.pm.lockfile
+
+    def digest(self) -> str:
+        sha = hashlib.sha256(f"{self.generator}@{self.version}".encode())
+        for path in (self.package_json, self.lockfile):
+            sha.update(path.read_bytes())
+        return sha.hexdigest()[:16]
+
+    def apply(self, project_path: Path, project_name: str) -> None:
+        """Copy the pinned package.json and lockfile into the project"""
+        shutil.copyfile(self.package_json, project_path / "package.json")
+        shutil.copyfile(self.lockfile, project_path / self.pm.lockfile)
+        patch_project_name(project_path, PLACEHOLDER_NAME, project_name)
+
+    def __repr__(self):
+        return f"<TemplateLock {self.directory.name} {self.generator}@{self.version}>"
+
+
+def find_lock(pack, pm, typescript: bool) -> Optional[TemplateLock]:
+    """The pack's lock for this package manager and variant, if one was generated"""
+    directory = pack.root / LOCKS_DIR / lock_flavor(pm, typescript)
+    try:
+        meta = json.loads((directory / LOCK_META).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    lock = TemplateLock(directory, pm, meta)
+    if not (lock.package_json.is_file() and lock.lockfile.is_file() and lock.version):
+        return None
+    return lock
+
+
+def resolve_version(package: str) -> Optional[str]:
+    """Current ``latest`` version of ``package`` on the registry"""
+    try:
+        result = subprocess.run(f"npm view {package}@latest version", shell=True,
+                                capture_output=True, text=True, timeout=60)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    version = result.stdout.strip().splitlines()[-1:] if result.returncode == 0 else []
+    return version[0].strip("'\" ") if version else None
+
+
+def save_lock(pack, pm, typescript: bool, project_path: Path, generator: str, version: str) -> TemplateLock:
+    """Store a freshly installed project's package.json and lockfile as the pack's lock"""
+    target = pack.root / LOCKS_DIR / lock_flavor(pm, typescript)
+    staging = target.with_name(f".{target.name}.{os.getpid()}.tmp")
+    shutil.rmtree(staging, ignore_errors=True)
+    staging.mkdir(parents=True)
+
+    shutil.copyfile(project_path / "package.json", staging / "package.json")
+    shutil.copyfile(project_path / pm.lockfile, staging / pm.lockfile)
+    (staging / LOCK_META).write_text(json.dumps({
+        "generator": generator,
+        "version": version,
+        "refreshed": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }, indent=2) + "\n", encoding="utf-8")
+
+    shutil.rmtree(target, ignore_errors=True)
+    os.replace(staging, target)
+    return find_lock(pack, pm, typescript)
+
+
+def refresh_lock(pack, pm, typescript: bool, generator: str,
+                 build: Callable[[Path, str], bool], logger) -> bool:
+    """Regenerate one lock: resolve the generator's latest version, let ``build``
+    create and install ``<tmp>/shnk-template`` with it, then store the result"""
+    version = resolve_version(generator)
+    if not version:
+        logger.error(f"❌ Could not resolve the latest version of {generator} (is the registry reachable?)")
+        return False
+
+    flavor = lock_flavor(pm, typescript)
+    logger.log(f"🔒 Refreshing {pack.name} ({flavor}) with {generator}@{version}")
+    with tempfile.TemporaryDirectory(prefix="shnk-lock-") as tmp:
+        project_path = Path(tmp) / PLACEHOLDER_NAME
+        if not build(Path(tmp), version) or not (project_path / pm.lockfile).is_file():
+            logger.error(f"❌ Could not build {pack.name} ({flavor}); its lock is unchanged.")
+            return False
+        save_lock(pack, pm, typescript, project_path, generator, version)
+    logger.success(f"✅ Saved {pack.name}/{LOCKS_DIR}/{flavor}")
+    return True
@@ -1,30 +1,46 @@
-from rich.console import Console
-from rich.theme import Theme
-
-custom_theme = Theme({
+custom_theme = {
     "info": "cyan",
     "warning": "yellow",
     "error": "bold red",
     "success": "bold green",
     "debug": "dim white"
-})
+}
+
+# The themed console is built on first log call, not at import time
+_console = None
+
+
+def get_console():
+  global _console
+  if _console is None:
+    from rich.console import Console
+    from rich.theme import Theme
+    _console = Console(theme=Theme(custom_theme))
+  return _console
 
-console = Console(theme=custom_theme)
 
 class Logger:
+  def __init__(self, prefix: str = ""):
+    # Batch runs give every project its own prefixed log stream
+    self.prefix = f"[magenta]{prefix}[/magenta] " if prefix else ""
+
   def info(self, msg: str):
-    console.print(f"[info][INFO][/info] {msg}")
+    get_console().print(f"{self.prefix}[info][INFO][/info] {msg}")
 
   def success(self, msg: str):
-      console.print(f"[success][✔ SUCCESS][/success] {msg}")
+      get_console().print(f"{self.prefix}[success][✔ SUCCESS][/success] {msg}")
   
   def warning(self, msg: str):
-      console.print(f"[warning][! WARNING][/warning] {msg}")
+      get_console().print(f"{self.prefix}[warning][! WARNING][/warning] {msg}")
   
   def error(self, msg: str):
-      console.print(f"[error][✘ ERROR][/error] {msg}")
+      get_console().print(f"{self.prefix}[error][✘ ERROR][/error] {msg}")
   
   def debug(self, msg: str):
-      console.print(f"[debug][DEBUG][/debug] {msg}")
+      get_console().print(f"{self.prefix}[debug][DEBUG][/debug] {msg}")
   def log(self, msg: str):
-      console.print(f"[info][INFO][/info] {msg}")
+      get_console().print(f"{self.prefix}[info][INFO][/info] {msg}")
+  def output(self, line: str):
+      # Raw child-process output: printed verbatim, never parsed as markup
+      from rich.markup import escape
+      get_console().print(f"{self.prefix}{escape(line)}", highlight=False)
@@ -0,0 +1,327 @@
+# utils/mirror.py
+"""
+Local package mirror and built-in offline registry.
+
+The mirror lives in ``SHNK_HOME/mirror``:
+
+    tarballs/<name>/<basename>-<version>.tgz
+    packuments/<name>.json      registry metadata for the mirrored versions
+
+``MirrorRegistry`` serves it over HTTP on localhost with the subset of the
+npm registry API that installs need (package documents and tarballs).
+While ``offline_registry()`` is active, every command run through
+``utils.installer`` is pointed at it, so scaffolds work without internet.
+
+``Mirror.sync_lockfile`` fills the mirror from a package-lock.json, and
+``Mirror.add_tarball`` from local ``.tgz`` files (e.g. made by ``npm pack``).
+"""
+
+import base64
+import hashlib
+import io
+import json
+import os
+import re
+import shutil
+import tarfile
+import threading
+import urllib.request
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import quote, unquote
+
+from utils.paths import shnk_home
+
+UPSTREAM_REGISTRY = os.environ.get("SHNK_UPSTREAM_REGISTRY", "https://registry.npmjs.org")
+OFFLINE_ENV_VAR = "SHNK_OFFLINE"
+
+# A package name as it appears in registry URLs (optionally @scope/)
+PACKAGE_NAME = re.compile(r"(@[^/]+/)?[^/@.][^/]*")
+
+# Registry URL of the running offline registry, read by utils.installer
+_active_url: Optional[str] = None
+
+
+def mirror_root() -> Path:
+    return shnk_home() / "mirror"
+
+
+def _version_key(version: str) -> Tuple:
+    """Sort key for semver strings; pre-releases sort before the release"""
+    main, _, pre = version.partition("-")
+    numbers = tuple(int(part) if part.isdigit() else 0 for part in main.split("."))
+    return numbers + ((1,) if not pre else (0, pre))
+
+
+def _integrity(data: bytes) -> str:
+    return "sha512-" + base64.b64encode(hashlib.sha512(data).digest()).decode()
+
+
+def _fetch(url: str) -> bytes:
+    with urllib.request.urlopen(url, timeout=60) as response:
+        return response.read()
+
+
+def _read_manifest(data: bytes) -> Dict:
+    """package.json from a package tarball (the top directory is usually ``package/``)"""
+    with tarfile.open(fileobj=io.BytesIO(data), mode="r:gz") as tar:
+        for member in tar.getmembers():
+            parts = member.name.split("/")
+            if len(parts) == 2 and parts[1] == "package.json" and member.isfile():
+                return json.loads(tar.extractfile(member).read().decode("utf-8"))
+    raise ValueError("tarball has no package.json")
+
+
+class Mirror:
+    """A directory of tarballs plus the registry documents describing them"""
+
+    def __init__(self, root: Optional[Path] = None):
+        self.root = Path(root) if root else mirror_root()
+        self._lock = threading.Lock()
+
+    def tarball_path(self, name: str, version: str) -> Path:
+        return self.root / "tarballs" / name / f"{name.split('/')[-1]}-{version}.tgz"
+
+    def packument_path(self, name: str) -> Path:
+        return self.root / "packuments" / (quote(name, safe="@") + ".json")
+
+    def load_packument(self, name: str) -> Optional[Dict]:
+        try:
+            return json.loads(self.packument_path(name).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+    def find_tarball(self, name: str, filename: str) -> Optional[Path]:
+        """The stored tarball a registry URL (``<name>/-/<filename>``) asks for.
+
+        Only versions listed in the package's document are served, and the
+        path must stay inside the mirror's tarballs directory.
+        """
+        if not PACKAGE_NAME.fullmatch(name) or not filename or "/" in filename or "\\" in filename:
+            return None
+        doc = self.load_packument(name)
+        if doc is None:
+            return None
+        tarballs = (self.root / "tarballs").resolve()
+        for version, manifest in doc.get("versions", {}).items():
+            if manifest.get("dist", {}).get("tarball", "").rsplit("/-/", 1)[-1] != filename:
+                continue
+            path = self.tarball_path(name, version).resolve()
+            if tarballs in path.parents and path.is_file():
+                return path
+        return None
+
+    def has(self, name: str, version: str) -> bool:
+        return self.tarball_path(name, version).is_file()
+
+    def add_tarball(self, data: bytes, integrity: Optional[str] = None) -> Tuple[str, str]:
+        """Store a package tarball and register it; returns (name, version)"""
+        if integrity and integrity.startswith("sha512-") and integrity != _integrity(data):
+            raise ValueError("integrity mismatch")
+        manifest = _read_manifest(data)
+        name, version = manifest["name"], manifest["version"]
+
+        target = self.tarball_path(name, version)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, target)
+
+        # Tarball URLs are relative; the registry makes them absolute when serving
+        manifest["dist"] = {
+            "tarball": f"{name}/-/{target.name}",
+            "integrity": _integrity(data),
+            "shasum": hashlib.sha1(data).hexdigest(),
+        }
+        manifest.pop("readme", None)
+
+        with self._lock:
+            doc = self.load_packument(name) or {"name": name, "versions": {}, "dist-tags": {}}
+            doc["versions"][version] = manifest
+            doc["dist-tags"]["latest"] = max(doc["versions"], key=_version_key)
+            path = self.packument_path(name)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            tmp.write_text(json.dumps(doc), encoding="utf-8")
+            os.replace(tmp, path)
+        return name, version
+
+    def add_file(self, path: Path) -> Tuple[str, str]:
+        return self.add_tarball(Path(path).read_bytes())
+
+    def sync_package(self, name: str, version: str = "latest",
+                     fetch: Callable[[str], bytes] = _fetch) -> Tuple[str, str]:
+        """Mirror one package version from the upstream registry"""
+        doc = json.loads(fetch(f"{UPSTREAM_REGISTRY}/{quote(name, safe='@')}"))
+        version = doc.get("dist-tags", {}).get(version, version)
+        if self.has(name, version):
+            return name, version
+        dist = doc["versions"][version]["dist"]
+        return self.add_tarball(fetch(dist["tarball"]), dist.get("integrity"))
+
+    def sync_lockfile(self, lockfile: Path, fetch: Callable[[str], bytes] = _fetch,
+                      progress: Optional[Callable[[str], None]] = None) -> Dict[str, int]:
+        """Mirror every registry package in a package-lock.json (v2/v3)"""
+        data = json.loads(Path(lockfile).read_text(encoding="utf-8"))
+        counts = {"added": 0, "present": 0, "skipped": 0}
+        for path, entry in data.get("packages", {}).items():
+            resolved = entry.get("resolved", "")
+            if not path or entry.get("link") or not resolved.startswith("http"):
+                counts["skipped"] += bool(path)
+                continue
+            name = entry.get("name") or path.rsplit("node_modules/", 1)[-1]
+            if self.has(name, entry["version"]):
+                counts["present"] += 1
+                continue
+            self.add_tarball(fetch(resolved), entry.get("integrity"))
+            counts["added"] += 1
+            if progress:
+                progress(f"{name}@{entry['version']}")
+        return counts
+
+    def sync_template_lock(self, lock, fetch: Callable[[str], bytes] = _fetch,
+                           progress: Optional[Callable[[str], None]] = None) -> Dict[str, int]:
+        """Mirror a template lock: its generator at the pinned version plus the locked tree"""
+        if lock.pm.lockfile != "package-lock.json":
+            raise ValueError(f"only npm lockfiles can be mirrored (got {lock.pm.lockfile})")
+        present = self.has(lock.generator, lock.version)
+        self.sync_package(lock.generator, lock.version, fetch)
+        if progress and not present:
+            progress(f"{lock.generator}@{lock.version}")
+        counts = self.sync_lockfile(lock.lockfile, fetch, progress)
+        counts["present" if present else "added"] += 1
+        return counts
+
+    def packages(self) -> List[Tuple[str, List[str]]]:
+        """(name, sorted versions) for everything in the mirror"""
+        result = []
+        for path in sorted((self.root / "packuments").glob("*.json")):
+            try:
+                doc = json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                continue
+            result.append((doc["name"], sorted(doc.get("versions", {}), key=_version_key)))
+        return result
+
+    def clear(self) -> None:
+        shutil.rmtree(self.root, ignore_errors=True)
+
+
+def _make_handler(mirror: Mirror):
+    class RegistryHandler(BaseHTTPRequestHandler):
+        """Serves package documents and tarballs from the mirror"""
+
+        def _send(self, status: int, body: bytes, content_type: str = "application/json"):
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            if self.command != "HEAD":
+                self.wfile.write(body)
+
+        def do_GET(self):
+            path = unquote(self.path.split("?", 1)[0]).lstrip("/")
+            if "/-/" in path and path.endswith(".tgz"):
+                tarball = mirror.find_tarball(*path.split("/-/", 1))
+                if tarball is not None:
+                    self._send(200, tarball.read_bytes(), "application/octet-stream")
+                    return
+            elif PACKAGE_NAME.fullmatch(path):
+                doc = mirror.load_packument(path)
+                if doc is not None:
+                    base = f"http://{self.headers.get('Host', '127.0.0.1')}/"
+                    for manifest in doc["versions"].values():
+                        manifest["dist"]["tarball"] = base + manifest["dist"]["tarball"]
+                    self._send(200, json.dumps(doc).encode())
+                    return
+            self._send(404, b'{"error":"not found"}')
+
+        do_HEAD = do_GET
+
+        def do_POST(self):
+            # Audit and other bulk endpoints don't exist offline
+            self._send(404, b'{"error":"not available offline"}')
+
+        def log_message(self, format, *args):
+            pass
+
+    return RegistryHandler
+
+
+class MirrorRegistry:
+    """Localhost npm registry backed by a Mirror, running on a daemon thread"""
+
+    def __init__(self, mirror: Optional[Mirror] = None, host: str = "127.0.0.1", port: int = 0):
+        self.mirror = mirror or Mirror()
+        self.server = ThreadingHTTPServer((host, port), _make_handler(self.mirror))
+        self.server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def start(self) -> str:
+        self._thread = threading.Thread(target=self.server.serve_forever, name="shnk-registry", daemon=True)
+        self._thread.start()
+        return self.url
+
+    def stop(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self) -> str:
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def registry_env(url: Optional[str] = None) -> Dict[str, str]:
+    """Environment pointing npm, pnpm, yarn and bun at ``url`` (default: the active registry)"""
+    url = url or _active_url
+    if not url:
+        return {}
+    return {
+        "npm_config_registry": url,
+        "npm_config_audit": "false",
+        "npm_config_fund": "false",
+        "npm_config_update_notifier": "false",
+        "YARN_NPM_REGISTRY_SERVER": url,
+        "BUN_CONFIG_REGISTRY": url,
+    }
+
+
+def offline_requested(flag: bool = False) -> bool:
+    """--offline, SHNK_OFFLINE=1, or "offline": true in config/config.json"""
+    if flag or os.environ.get(OFFLINE_ENV_VAR, "").lower() in ("1", "true", "yes"):
+        return True
+    from utils.config import load_config
+    return bool(load_config().get("offline"))
+
+
+@contextmanager
+def offline_registry(enabled: bool = True, logger=None) -> Iterator[Optional[str]]:
+    """Serve the mirror and route installs through it for the duration of the block"""
+    global _active_url
+    if not enabled:
+        yield None
+        return
+
+    mirror = Mirror()
+    if logger is not None:
+        count = len(mirror.packages())
+        if count:
+            logger.log(f"📦 Offline mode: serving {count} mirrored packages")
+        else:
+            logger.warning("⚠️ Offline mode, but the mirror is empty; run 'shnk mirror sync' first.")
+    previous = _active_url
+    with MirrorRegistry(mirror) as url:
+        _active_url = url
+        try:
+            yield url
+        finally:
+            _active_url = previous
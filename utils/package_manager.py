@@ -0,0 +1,229 @@
+# utils/package_manager.py
+"""
+Package-manager backends (npm, pnpm, yarn, bun).
+
+Every installer and scaffolder command line is built here, so switching
+tools is a config or flag change. ``auto`` picks the fastest tool that is
+installed on this machine.
+"""
+
+import json
+import os
+import shlex
+import shutil
+import subprocess
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+# Fastest first: bun and pnpm link from a global content-addressable store
+SPEED_ORDER = ("bun", "pnpm", "yarn", "npm")
+DEFAULT_PACKAGE_MANAGER = "npm"
+ENV_VAR = "SHNK_PACKAGE_MANAGER"
+
+
+def _join(args: Iterable[str]) -> str:
+    return " ".join(shlex.quote(str(arg)) for arg in args)
+
+
+class PackageManager:
+    """Builds shell command lines for one package manager"""
+
+    name = "npm"
+    lockfile = "package-lock.json"
+    # npm needs "--" before arguments meant for a package.json script
+    script_separator = "-- "
+
+    def create(self, initializer: str, args: Iterable[str] = (), version: Optional[str] = None) -> str:
+        """Run a ``create-<initializer>`` starter kit (``version`` pins it)"""
+        args = list(args)
+        target, flags = args[:1], args[1:]
+        command = f"{self.name} create {initializer}@{version or 'latest'} {_join(target)}"
+        return f"{command} -- {_join(flags)}" if flags else command
+
+    def install(self, packages: Iterable[str] = ()) -> str:
+        """Install package.json, adding ``packages`` if any are given"""
+        packages = list(packages)
+        return f"{self.name} install {_join(packages)}".rstrip()
+
+    def ci(self, project_path=None) -> str:
+        """Install exactly what the lockfile records, failing if it is out of date"""
+        return "npm ci"
+
+    def run(self, script: str, args: Iterable[str] = ()) -> str:
+        """Run a package.json script; ``args`` are passed through to it"""
+        args = list(args)
+        command = f"{self.name} run {script}"
+        return f"{command} {self.script_separator}{_join(args)}" if args else command
+
+    def init(self) -> str:
+        return f"{self.name} init -y"
+
+    def exec(self, package: str, args: Iterable[str] = ()) -> str:
+        """Run a package binary (npx style)"""
+        return f"npx {package} {_join(args)}".rstrip()
+
+    def env(self) -> Dict[str, str]:
+        """Extra environment for streamed installs"""
+        # http level logging makes npm print one line per fetched package
+        return {"npm_config_loglevel": "http"}
+
+    @property
+    def next_flag(self) -> str:
+        """create-next-app flag selecting this package manager"""
+        return f"--use-{self.name}"
+
+    def is_installed(self) -> bool:
+        return shutil.which(self.name) is not None
+
+    def __repr__(self):
+        return f"<PackageManager {self.name}>"
+
+
+def _major(version: Optional[str]) -> int:
+    """Major version of "4.5.0" or "3.8.7+sha224.abc"; 0 if it can't be read"""
+    head = (version or "").strip().lstrip("v").split(".", 1)[0]
+    return int(head) if head.isdigit() else 0
+
+
+@lru_cache(maxsize=None)
+def _tool_version(name: str, cwd: str) -> Optional[str]:
+    """``<name> --version`` run in ``cwd`` (Corepack picks the version per project)"""
+    try:
+        result = subprocess.run(f"{name} --version", shell=True, cwd=cwd,
+                                capture_output=True, text=True, timeout=30)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return result.stdout.strip() if result.returncode == 0 else None
+
+
+def _pinned(initializer: str, version: Optional[str]) -> str:
+    return f"{initializer}@{version}" if version else initializer
+
+
+class Pnpm(PackageManager):
+    name = "pnpm"
+    lockfile = "pnpm-lock.yaml"
+    script_separator = ""
+
+    def create(self, initializer: str, args: Iterable[str] = (), version: Optional[str] = None) -> str:
+        return f"pnpm create {_pinned(initializer, version)} {_join(args)}".rstrip()
+
+    def install(self, packages: Iterable[str] = ()) -> str:
+        packages = list(packages)
+        return f"pnpm add {_join(packages)}" if packages else "pnpm install"
+
+    def ci(self, project_path=None) -> str:
+        return "pnpm install --frozen-lockfile"
+
+    def init(self) -> str:
+        return "pnpm init"
+
+    def exec(self, package: str, args: Iterable[str] = ()) -> str:
+        return f"pnpm dlx {package} {_join(args)}".rstrip()
+
+    def env(self) -> Dict[str, str]:
+        return {}
+
+
+class Yarn(PackageManager):
+    name = "yarn"
+    lockfile = "yarn.lock"
+    script_separator = ""
+
+    def create(self, initializer: str, args: Iterable[str] = (), version: Optional[str] = None) -> str:
+        return f"yarn create {_pinned(initializer, version)} {_join(args)}".rstrip()
+
+    def install(self, packages: Iterable[str] = ()) -> str:
+        packages = list(packages)
+        return f"yarn add {_join(packages)}" if packages else "yarn install"
+
+    def ci(self, project_path=None) -> str:
+        # Yarn 2+ (Berry) dropped --frozen-lockfile for --immutable
+        if self.is_berry(project_path):
+            return "yarn install --immutable"
+        return "yarn install --frozen-lockfile"
+
+    def is_berry(self, project_path=None) -> bool:
+        """Whether the project uses Yarn 2+: a .yarnrc.yml or ``packageManager: yarn@2+``,
+        otherwise the version of the yarn on PATH"""
+        if project_path is not None:
+            project_path = Path(project_path)
+            if (project_path / ".yarnrc.yml").is_file():
+                return True
+            try:
+                spec = json.loads((project_path / "package.json").read_text(encoding="utf-8")).get("packageManager")
+            except (OSError, ValueError, AttributeError):
+                spec = None
+            if isinstance(spec, str) and spec.startswith("yarn@"):
+                return _major(spec[len("yarn@"):]) >= 2
+        return _major(_tool_version(self.name, str(project_path or "."))) >= 2
+
+    def exec(self, package: str, args: Iterable[str] = ()) -> str:
+        return f"yarn dlx {package} {_join(args)}".rstrip()
+
+    def env(self) -> Dict[str, str]:
+        return {}
+
+
+class Bun(PackageManager):
+    name = "bun"
+    lockfile = "bun.lock"
+    script_separator = ""
+
+    def create(self, initializer: str, args: Iterable[str] = (), version: Optional[str] = None) -> str:
+        return f"bun create {_pinned(initializer, version)} {_join(args)}".rstrip()
+
+    def install(self, packages: Iterable[str] = ()) -> str:
+        packages = list(packages)
+        return f"bun add {_join(packages)}" if packages else "bun install"
+
+    def ci(self, project_path=None) -> str:
+        return "bun install --frozen-lockfile"
+
+    def exec(self, package: str, args: Iterable[str] = ()) -> str:
+        return f"bunx {package} {_join(args)}".rstrip()
+
+    def env(self) -> Dict[str, str]:
+        return {}
+
+
+PACKAGE_MANAGERS = {cls.name: cls for cls in (PackageManager, Pnpm, Yarn, Bun)}
+CHOICES = tuple(PACKAGE_MANAGERS) + ("auto",)
+
+
+def detect_fastest() -> PackageManager:
+    """The fastest package manager on PATH, falling back to npm"""
+    for name in SPEED_ORDER:
+        manager = PACKAGE_MANAGERS[name]()
+        if manager.is_installed():
+            return manager
+    return PackageManager()
+
+
+def get_package_manager(choice: Optional[str] = None) -> PackageManager:
+    """Resolve a package manager from an explicit choice, SHNK_PACKAGE_MANAGER,
+    the ``package_manager`` key of config/config.json, or npm"""
+    if not choice:
+        choice = os.environ.get(ENV_VAR)
+    if not choice:
+        from utils.config import load_config
+        choice = load_config().get("package_manager")
+    choice = (choice or DEFAULT_PACKAGE_MANAGER).lower()
+
+    if choice == "auto":
+        return detect_fastest()
+    if choice not in PACKAGE_MANAGERS:
+        raise ValueError(f"Unknown package manager: {choice} (choose from {', '.join(CHOICES)})")
+    return PACKAGE_MANAGERS[choice]()
+
+
+def resolve(manager) -> PackageManager:
+    """Accept a PackageManager, a name, or None"""
+    if isinstance(manager, PackageManager):
+        return manager
+    return get_package_manager(manager)
+
+
+def installed_package_managers() -> List[str]:
+    return [name for name in SPEED_ORDER if PACKAGE_MANAGERS[name]().is_installed()]
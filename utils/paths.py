@@ -0,0 +1,16 @@
+# utils/paths.py
+import os
+import sys
+from pathlib import Path
+
+
+def shnk_home() -> Path:
+    """Directory for SHNK's own state (timings, caches). Override with SHNK_HOME."""
+    home = Path(os.environ.get("SHNK_HOME") or Path.home() / ".shnk")
+    home.mkdir(parents=True, exist_ok=True)
+    return home
+
+
+def resource_root() -> Path:
+    """Directory holding bundled data (templates, assets); the unpack dir in a PyInstaller build"""
+    return Path(getattr(sys, "_MEIPASS", Path(__file__).resolve().parent.parent))
@@ -0,0 +1,207 @@
+# utils/progress.py
+"""
+Progress reporting driven by real subprocess output.
+
+Bars advance from what npm actually prints (fetched and added packages)
+and from how long the same step took on previous runs, instead of
+sleeping through a fixed animation.
+"""
+
+import json
+import os
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from utils.paths import shnk_home
+
+# How many past durations are kept per step for ETA estimates
+HISTORY_SIZE = 5
+
+# Live bars need the terminal to themselves; concurrent runs turn them off
+# and get plain, logger-prefixed output lines instead.
+_live_enabled = True
+_history_lock = threading.Lock()
+
+
+def set_live_progress(enabled: bool) -> None:
+    global _live_enabled
+    _live_enabled = enabled
+
+
+class NpmOutputParser:
+    """Extracts package counts from npm / pnpm / bun output lines"""
+
+    FETCH_RE = re.compile(r"^npm http fetch \w+ \d{3} ")
+    ADDED_RE = re.compile(r"\badded (\d+) packages?|\b(\d+) packages? installed")
+    AUDITED_RE = re.compile(r"\baudited (\d+) packages?")
+    # pnpm: "Progress: resolved 244, reused 236, downloaded 8, added 120"
+    PNPM_RE = re.compile(r"^Progress: resolved (\d+).*?added (\d+)")
+
+    def __init__(self):
+        self.fetched = 0
+        self.added: Optional[int] = None
+        self.audited: Optional[int] = None
+
+    def feed(self, line: str) -> bool:
+        """Consume one output line; return True if it was npm's own chatter"""
+        if self.FETCH_RE.match(line):
+            self.fetched += 1
+            return True
+        match = self.PNPM_RE.match(line)
+        if match:
+            self.fetched = int(match.group(1))
+            return True
+        match = self.ADDED_RE.search(line)
+        if match:
+            self.added = int(match.group(1) or match.group(2))
+        match = self.AUDITED_RE.search(line)
+        if match:
+            self.audited = int(match.group(1))
+        return False
+
+    def status(self) -> str:
+        """Short human readable status for the progress line"""
+        if self.added is not None:
+            return f"{self.added} packages installed"
+        if self.audited is not None:
+            return f"{self.audited} packages audited"
+        if self.fetched:
+            return f"{self.fetched} packages resolved"
+        return ""
+
+
+class TimingHistory:
+    """Past step durations, persisted between runs to estimate ETAs"""
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = path or shnk_home() / "timings.json"
+        self._data: Optional[Dict[str, List[float]]] = None
+
+    def _load(self) -> Dict[str, List[float]]:
+        if self._data is None:
+            try:
+                self._data = json.loads(self.path.read_text())
+            except (OSError, ValueError):
+                self._data = {}
+        return self._data
+
+    def estimate(self, key: str) -> Optional[float]:
+        """Average duration of the last few runs of a step, if any"""
+        samples = self._load().get(key)
+        if not samples:
+            return None
+        return sum(samples) / len(samples)
+
+    def record(self, key: str, seconds: float) -> None:
+        with _history_lock:
+            # Re-read so concurrent steps don't drop each other's samples
+            self._data = None
+            data = self._load()
+            samples = data.setdefault(key, [])
+            samples.append(round(seconds, 3))
+            del samples[:-HISTORY_SIZE]
+            tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+            try:
+                tmp.write_text(json.dumps(data, indent=2))
+                os.replace(tmp, self.path)
+            except OSError:
+                pass
+
+
+def _make_columns():
+    from rich.progress import BarColumn, ProgressColumn, SpinnerColumn, TextColumn, TimeElapsedColumn
+    from rich.progress_bar import ProgressBar
+    from rich.text import Text
+
+    class EstimatedBarColumn(BarColumn):
+        """Fills against the historical duration; pulses on a first run"""
+
+        def render(self, task):
+            estimate = task.fields.get("estimate")
+            if not estimate:
+                return ProgressBar(total=None, width=self.bar_width, pulse=True,
+                                   style=self.style, pulse_style=self.pulse_style)
+            completed = min(task.elapsed or 0.0, estimate * 0.95)
+            return ProgressBar(total=estimate, completed=completed, width=self.bar_width,
+                               style=self.style, complete_style=self.complete_style)
+
+    class EtaColumn(ProgressColumn):
+        def render(self, task):
+            estimate = task.fields.get("estimate")
+            if not estimate:
+                return Text("first run", style="dim")
+            remaining = max(estimate - (task.elapsed or 0.0), 0.0)
+            return Text(f"~{remaining:.0f}s left", style="dim")
+
+    return (
+        SpinnerColumn(style="blue"),
+        TextColumn("[blue]{task.description}"),
+        EstimatedBarColumn(bar_width=30, style="blue", complete_style="bright_blue"),
+        TimeElapsedColumn(),
+        EtaColumn(),
+        TextColumn("[dim]{task.fields[status]}"),
+    )
+
+
+class StepProgress:
+    """Live progress line for one subprocess-backed step.
+
+    Use as a context manager and ``feed()`` it every output line. On a clean
+    exit the step's duration is logged and stored for future ETAs. Without
+    a live bar (see ``set_live_progress``) lines go through the logger.
+    """
+
+    def __init__(self, description: str, key: Optional[str] = None,
+                 history: Optional[TimingHistory] = None, logger=None):
+        self.description = description
+        self.key = key or description
+        self.history = history or TimingHistory()
+        self.parser = NpmOutputParser()
+        self.logger = logger
+        self.elapsed = 0.0
+        self.failed = False
+        self._progress = None
+        self._task = None
+        self._start = 0.0
+
+    def __enter__(self):
+        if _live_enabled or self.logger is None:
+            from rich.progress import Progress
+            from utils.logger import get_console
+
+            self._progress = Progress(*_make_columns(), console=get_console(), transient=True)
+            self._task = self._progress.add_task(
+                self.description, total=None,
+                estimate=self.history.estimate(self.key), status="",
+            )
+            self._progress.start()
+        self._start = time.perf_counter()
+        return self
+
+    def feed(self, line: str) -> None:
+        line = line.rstrip("\r\n")
+        if self.parser.feed(line) or not line.strip():
+            if self._progress is not None:
+                self._progress.update(self._task, status=self.parser.status())
+            return
+        if self._progress is not None:
+            self._progress.console.print(line, markup=False, highlight=False, style="dim")
+            self._progress.update(self._task, status=self.parser.status())
+        else:
+            from rich.markup import escape
+            self.logger.debug(escape(line))
+
+    def __exit__(self, exc_type, exc, tb):
+        self.elapsed = time.perf_counter() - self._start
+        if self._progress is not None:
+            self._progress.stop()
+        if exc_type is None and not self.failed:
+            self.history.record(self.key, self.elapsed)
+        if self.logger is not None:
+            status = self.parser.status()
+            detail = f"{self.elapsed:.1f}s" + (f", {status}" if status else "")
+            self.logger.log(f"⏱  {self.description} ({detail})")
+        return False
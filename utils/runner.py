@@ -0,0 +1,286 @@
+# utils/runner.py
+"""
+Asyncio subprocess runner.
+
+Every child process SHNK starts runs on one background event loop. Output
+is streamed line by line from stdout and stderr as it arrives, commands
+can be given a timeout, and a semaphore caps how many children run at
+once. Each command runs in its own process group, so a timeout or a
+cancellation (e.g. Ctrl+C while a dev server runs) stops the whole tree.
+
+    result = default_runner().run("npm install", cwd=project, timeout=600,
+                                  on_line=lambda stream, line: print(line))
+    result.ok, result.returncode, result.elapsed, result.tail
+
+Synchronous callers (the step graph's worker threads) use ``run``;
+coroutines can await ``run_async`` directly on the runner's loop.
+"""
+
+import asyncio
+import os
+import signal
+import subprocess
+import threading
+import time
+from collections import deque
+from concurrent.futures import CancelledError, Future
+from typing import Callable, Dict, List, Optional
+
+# Lines of combined output kept for error reports
+TAIL_LINES = 20
+# Seconds between SIGTERM and SIGKILL when stopping a command
+KILL_GRACE = 3.0
+# Seconds to keep reading pipes after the child exited (grandchildren may hold them open)
+DRAIN_TIMEOUT = 2.0
+STREAM_LIMIT = 1024 * 1024
+
+LineCallback = Callable[[str, str], None]
+
+
+def default_max_processes() -> int:
+    """SHNK_MAX_PROCESSES, else twice the CPU count (children mostly wait on I/O)"""
+    try:
+        return max(1, int(os.environ["SHNK_MAX_PROCESSES"]))
+    except (KeyError, ValueError):
+        return max(4, 2 * (os.cpu_count() or 1))
+
+
+class CommandResult:
+    """Outcome of one command; truthy when it exited with status 0"""
+
+    def __init__(self, command: str, returncode: Optional[int], elapsed: float, tail: List[str],
+                 timed_out: bool = False, cancelled: bool = False):
+        self.command = command
+        self.returncode = returncode
+        self.elapsed = elapsed
+        self.tail = tail
+        self.timed_out = timed_out
+        self.cancelled = cancelled
+
+    @property
+    def ok(self) -> bool:
+        return self.returncode == 0 and not self.timed_out and not self.cancelled
+
+    def __bool__(self) -> bool:
+        return self.ok
+
+    @property
+    def output(self) -> str:
+        return "\n".join(self.tail)
+
+    def describe(self) -> str:
+        """Short reason for a failure"""
+        if self.timed_out:
+            return f"timed out after {self.elapsed:.1f}s"
+        if self.cancelled:
+            return "cancelled"
+        if self.returncode is None:
+            return "could not be started" + (f" ({self.tail[-1]})" if self.tail else "")
+        return f"returned non-zero exit status {self.returncode}"
+
+    def as_dict(self) -> Dict:
+        return {"command": self.command, "returncode": self.returncode, "elapsed": round(self.elapsed, 3),
+                "timed_out": self.timed_out, "cancelled": self.cancelled, "tail": self.tail}
+
+    def __repr__(self):
+        return f"CommandResult({self.command!r}, returncode={self.returncode}, elapsed={self.elapsed:.3f})"
+
+
+def process_group_kwargs() -> Dict:
+    if os.name == "nt":
+        return {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP}
+    return {"start_new_session": True}
+
+
+async def _signal_tree(process, force: bool) -> None:
+    if process.returncode is not None:
+        return
+    if os.name == "nt":
+        args = ["taskkill", "/T", "/PID", str(process.pid)] + (["/F"] if force else [])
+        killer = await asyncio.create_subprocess_exec(*args, stdout=subprocess.DEVNULL,
+                                                      stderr=subprocess.DEVNULL)
+        await killer.wait()
+        return
+    try:
+        os.killpg(process.pid, signal.SIGKILL if force else signal.SIGTERM)
+    except (ProcessLookupError, PermissionError):
+        pass
+
+
+async def _terminate(process) -> None:
+    """SIGTERM the command's process group, then SIGKILL it if it lingers"""
+    await _signal_tree(process, force=False)
+    try:
+        await asyncio.wait_for(process.wait(), KILL_GRACE)
+    except asyncio.TimeoutError:
+        await _signal_tree(process, force=True)
+        await process.wait()
+
+
+def stop_process_tree(process: subprocess.Popen, grace: float = KILL_GRACE) -> Optional[int]:
+    """Stop a Popen child started with ``process_group_kwargs()`` and everything it spawned.
+
+    Synchronous counterpart of the runner's own termination: SIGTERM the
+    group, SIGKILL it after ``grace`` seconds. Returns the exit status.
+    """
+    if process.poll() is not None:
+        return process.returncode
+    for force in (False, True):
+        if os.name == "nt":
+            subprocess.run(["taskkill", "/T", "/PID", str(process.pid)] + (["/F"] if force else []),
+                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        else:
+            try:
+                os.killpg(process.pid, signal.SIGKILL if force else signal.SIGTERM)
+            except (ProcessLookupError, PermissionError):
+                pass
+        try:
+            return process.wait(timeout=grace)
+        except subprocess.TimeoutExpired:
+            continue
+    return process.poll()
+
+
+class CommandRunner:
+    """Runs shell commands on a private event loop, at most ``max_processes`` at a time"""
+
+    def __init__(self, max_processes: Optional[int] = None):
+        self.max_processes = max_processes or default_max_processes()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._active: Dict[asyncio.Task, threading.Event] = {}
+        self._lock = threading.Lock()
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                self._semaphore = asyncio.Semaphore(self.max_processes)
+                threading.Thread(target=loop.run_forever, name="shnk-runner", daemon=True).start()
+                self._loop = loop
+            return self._loop
+
+    async def run_async(self, command: str, cwd=None, env: Optional[Dict[str, str]] = None,
+                        timeout: Optional[float] = None, on_line: Optional[LineCallback] = None,
+                        tail_lines: int = TAIL_LINES) -> CommandResult:
+        """Run ``command`` through the shell and stream its output to ``on_line(stream, line)``.
+
+        Must be awaited on the runner's loop. A timeout stops the command and
+        returns a ``timed_out`` result; cancelling the task stops the command
+        and re-raises CancelledError.
+        """
+        tail = deque(maxlen=tail_lines)
+
+        async def pump(stream, name):
+            while True:
+                try:
+                    raw = await stream.readline()
+                except ValueError:
+                    # A single line longer than STREAM_LIMIT; take it in pieces
+                    raw = await stream.read(STREAM_LIMIT)
+                if not raw:
+                    return
+                line = raw.decode("utf-8", errors="replace").rstrip("\r\n")
+                tail.append(line)
+                if on_line is not None:
+                    on_line(name, line)
+
+        async with self._semaphore:
+            start = time.perf_counter()
+            process = await asyncio.create_subprocess_shell(
+                command, cwd=None if cwd is None else str(cwd), env=env,
+                stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                limit=STREAM_LIMIT, **process_group_kwargs(),
+            )
+            readers = [asyncio.ensure_future(pump(process.stdout, "stdout")),
+                       asyncio.ensure_future(pump(process.stderr, "stderr"))]
+            timed_out = False
+            try:
+                await asyncio.wait_for(process.wait(), timeout)
+            except asyncio.TimeoutError:
+                timed_out = True
+                await _terminate(process)
+            except asyncio.CancelledError:
+                await _terminate(process)
+                for reader in readers:
+                    reader.cancel()
+                raise
+            finally:
+                if process.returncode is None:
+                    await _terminate(process)
+
+            _, pending = await asyncio.wait(readers, timeout=DRAIN_TIMEOUT)
+            for reader in pending:
+                reader.cancel()
+            return CommandResult(command, process.returncode, time.perf_counter() - start,
+                                 list(tail), timed_out=timed_out)
+
+    def submit(self, command: str, **kwargs) -> Future:
+        """Start ``command`` without waiting; returns a concurrent Future of its CommandResult.
+
+        The future's ``stopped`` event is set once the child is gone, even
+        after the future was cancelled.
+        """
+        loop = self._ensure_loop()
+        stopped = threading.Event()
+
+        async def tracked():
+            task = asyncio.current_task()
+            with self._lock:
+                self._active[task] = stopped
+            try:
+                return await self.run_async(command, **kwargs)
+            finally:
+                with self._lock:
+                    del self._active[task]
+                stopped.set()
+
+        future = asyncio.run_coroutine_threadsafe(tracked(), loop)
+        future.stopped = stopped
+        return future
+
+    def run(self, command: str, cwd=None, env: Optional[Dict[str, str]] = None,
+            timeout: Optional[float] = None, on_line: Optional[LineCallback] = None) -> CommandResult:
+        """Run ``command`` and block until it finishes.
+
+        Ctrl+C (or ``cancel_all`` from another thread) stops the command's
+        whole process tree; the result then has ``cancelled`` set.
+        """
+        start = time.perf_counter()
+        future = self.submit(command, cwd=cwd, env=env, timeout=timeout, on_line=on_line)
+        try:
+            future.stopped.wait()
+        except KeyboardInterrupt:
+            future.cancel()
+            future.stopped.wait(KILL_GRACE + 1)
+            raise
+        try:
+            return future.result()
+        except CancelledError:
+            return CommandResult(command, None, time.perf_counter() - start, [], cancelled=True)
+
+    def cancel_all(self) -> int:
+        """Stop every running command and wait for them to exit; returns how many there were"""
+        if self._loop is None:
+            return 0
+        # The loop thread adds and removes entries while we read them
+        with self._lock:
+            active = list(self._active.items())
+        for task, _ in active:
+            self._loop.call_soon_threadsafe(task.cancel)
+        for _, stopped in active:
+            stopped.wait(KILL_GRACE + 1)
+        return len(active)
+
+
+_runner: Optional[CommandRunner] = None
+_runner_lock = threading.Lock()
+
+
+def default_runner() -> CommandRunner:
+    """The process-wide runner every SHNK command goes through"""
+    global _runner
+    with _runner_lock:
+        if _runner is None:
+            _runner = CommandRunner()
+        return _runner
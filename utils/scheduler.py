@@ -0,0 +1,95 @@
+# utils/scheduler.py
+"""
+Resource-aware limits for concurrent installs.
+
+Every streamed install step takes a slot from a process-wide gate sized
+from the CPU count and available memory, so batch runs never start more
+npm installs than the machine can carry.
+"""
+
+import os
+import threading
+from contextlib import contextmanager
+from typing import Optional
+
+# Rough peak resident size of one npm install
+INSTALL_MEMORY_MB = 512
+# Keep this much memory free before starting another install
+MIN_FREE_MEMORY_MB = 256
+
+
+def available_memory_mb() -> Optional[int]:
+    """Available memory in MB, or None where it can't be read cheaply"""
+    try:
+        with open("/proc/meminfo") as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) // 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        pages = os.sysconf("SC_AVPHYS_PAGES")
+        page_size = os.sysconf("SC_PAGE_SIZE")
+        return pages * page_size // (1024 * 1024)
+    except (AttributeError, ValueError, OSError):
+        return None
+
+
+def max_install_workers() -> int:
+    """How many installs may run at once: bounded by CPUs and free memory"""
+    limit = os.cpu_count() or 1
+    memory = available_memory_mb()
+    if memory is not None:
+        limit = min(limit, memory // INSTALL_MEMORY_MB)
+    return max(1, limit)
+
+
+class InstallGate:
+    """Counting gate for install slots that also waits for free memory"""
+
+    def __init__(self, slots: Optional[int] = None):
+        self.slots = slots or max_install_workers()
+        self._cond = threading.Condition()
+        self._running = 0
+
+    def _memory_ok(self) -> bool:
+        # The first install always runs, or a low-memory box would deadlock
+        if self._running == 0:
+            return True
+        memory = available_memory_mb()
+        return memory is None or memory >= MIN_FREE_MEMORY_MB
+
+    @contextmanager
+    def slot(self):
+        from utils import tracing
+
+        with tracing.span("install-gate", cat="wait", slots=self.slots), self._cond:
+            while self._running >= self.slots or not self._memory_ok():
+                self._cond.wait(timeout=0.5)
+            self._running += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._running -= 1
+                self._cond.notify_all()
+
+
+_gate: Optional[InstallGate] = None
+_gate_lock = threading.Lock()
+
+
+def install_gate() -> InstallGate:
+    global _gate
+    with _gate_lock:
+        if _gate is None:
+            _gate = InstallGate()
+        return _gate
+
+
+def configure_install_gate(slots: Optional[int]) -> InstallGate:
+    """Replace the process-wide gate (e.g. from a --jobs flag)"""
+    global _gate
+    with _gate_lock:
+        _gate = InstallGate(slots)
+        return _gate
@@ -0,0 +1,214 @@
+# utils/snapshots.py
+"""
+Prebuilt scaffold snapshots.
+
+A snapshot is a fully installed project (node_modules included) stored
+under ``~/.shnk/snapshots/<key>``. New projects are materialized from it
+with reflinks or hardlinks for node_modules and plain copies for the
+files a user edits, then only the project name is patched.
+"""
+
+import errno
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+from utils import tracing
+from utils.paths import shnk_home
+
+# Bump when the on-disk layout of a snapshot changes
+SNAPSHOT_FORMAT = 1
+# Snapshots built from floating @latest generators are rebuilt after this long
+DEFAULT_MAX_AGE_DAYS = 7
+META_FILE = "snapshot.json"
+# Never captured into a snapshot
+EXCLUDED_NAMES = {".git", ".shnk", "dist", ".next"}
+# Tool caches inside node_modules that are rewritten in place (Vite's pre-bundled
+# deps); they are copied into each project instead of linked to the snapshot
+PRIVATE_CACHES = {".vite", ".cache"}
+# Files whose "name" field carries the project name
+NAME_FILES = ("package.json", "package-lock.json")
+
+# Linux FICLONE ioctl, used for copy-on-write reflinks (btrfs, xfs, ...)
+_FICLONE = 0x40049409
+_reflink_supported = True
+
+
+def snapshot_root() -> Path:
+    root = shnk_home() / "snapshots"
+    root.mkdir(parents=True, exist_ok=True)
+    return root
+
+
+def file_digest(*paths: Path) -> str:
+    """Hash file contents, used to tie a snapshot to the template that built it"""
+    digest = hashlib.sha256()
+    for path in paths:
+        digest.update(Path(path).read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def snapshot_key(template: str, inputs: Dict) -> str:
+    """Stable key for a template plus everything that shapes its installed tree"""
+    payload = json.dumps({"format": SNAPSHOT_FORMAT, "template": template, "inputs": inputs},
+                         sort_keys=True)
+    return f"{template}-{hashlib.sha256(payload.encode()).hexdigest()[:16]}"
+
+
+@tracing.traced("find-snapshot", cat="cache")
+def find_snapshot(key: str, max_age_days: float = DEFAULT_MAX_AGE_DAYS) -> Optional[Path]:
+    """Return the snapshot directory for ``key`` if a complete, fresh one exists"""
+    path = snapshot_root() / key
+    try:
+        meta = json.loads((path / META_FILE).read_text())
+    except (OSError, ValueError):
+        return None
+    if meta.get("format") != SNAPSHOT_FORMAT:
+        return None
+    if max_age_days and time.time() - meta.get("created", 0) > max_age_days * 86400:
+        return None
+    return path
+
+
+def _installed_versions(project_path: Path, packages: Iterable[str]) -> Dict[str, str]:
+    versions = {}
+    for package in packages:
+        try:
+            manifest = json.loads((project_path / "node_modules" / package / "package.json").read_text())
+            versions[package] = manifest.get("version", "")
+        except (OSError, ValueError):
+            continue
+    return versions
+
+
+def save_snapshot(key: str, project_path: Path, project_name: str,
+                  packages: Iterable[str] = ()) -> Optional[Path]:
+    """Copy a freshly scaffolded project into the cache under ``key``"""
+    root = snapshot_root()
+    final = root / key
+    staging = root / f".{key}.tmp-{os.getpid()}-{threading.get_ident()}"
+    shutil.rmtree(staging, ignore_errors=True)
+    try:
+        shutil.copytree(project_path, staging, symlinks=True,
+                        ignore=lambda _dir, names: [n for n in names if n in EXCLUDED_NAMES])
+        meta = {
+            "format": SNAPSHOT_FORMAT,
+            "key": key,
+            "project_name": project_name,
+            "created": time.time(),
+            "versions": _installed_versions(project_path, packages),
+        }
+        (staging / META_FILE).write_text(json.dumps(meta, indent=2))
+        shutil.rmtree(final, ignore_errors=True)
+        os.replace(staging, final)
+        return final
+    except OSError:
+        shutil.rmtree(staging, ignore_errors=True)
+        return None
+
+
+def _clone_file(src: str, dst: str) -> None:
+    """Reflink, else hardlink, else copy a single file"""
+    global _reflink_supported
+    if _reflink_supported:
+        try:
+            import fcntl
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+            shutil.copystat(src, dst)
+            return
+        except (ImportError, OSError):
+            # Not supported here (other OS, filesystem or device); don't retry
+            _reflink_supported = False
+            try:
+                os.unlink(dst)
+            except OSError:
+                pass
+    try:
+        os.link(src, dst)
+    except OSError as e:
+        if e.errno not in (errno.EXDEV, errno.EPERM, errno.EMLINK, errno.ENOTSUP):
+            raise
+        shutil.copy2(src, dst)
+
+
+def materialize_snapshot(snapshot: Path, project_path: Path, project_name: str) -> None:
+    """Create ``project_path`` from a snapshot and patch in the project name.
+
+    node_modules is shared with the cache through reflinks or hardlinks;
+    everything else (tool caches under node_modules included) is copied so
+    project changes never reach the snapshot.
+    """
+    meta = json.loads((snapshot / META_FILE).read_text())
+    # May already exist (empty) when a resumed scaffold retries this step
+    project_path.mkdir(parents=True, exist_ok=True)
+
+    for dirpath, dirnames, filenames in os.walk(snapshot):
+        rel = os.path.relpath(dirpath, snapshot)
+        target_dir = project_path if rel == "." else project_path / rel
+        parts = rel.split(os.sep)
+        shared = parts[0] == "node_modules" and not (len(parts) > 1 and parts[1] in PRIVATE_CACHES)
+
+        for name in list(dirnames):
+            src = os.path.join(dirpath, name)
+            if os.path.islink(src):
+                # Symlinked dirs (e.g. workspace links) are recreated, not walked
+                os.symlink(os.readlink(src), target_dir / name)
+                dirnames.remove(name)
+            else:
+                (target_dir / name).mkdir()
+
+        for name in filenames:
+            if rel == "." and name == META_FILE:
+                continue
+            src = os.path.join(dirpath, name)
+            dst = target_dir / name
+            if os.path.islink(src):
+                os.symlink(os.readlink(src), dst)
+            elif shared:
+                _clone_file(src, str(dst))
+            else:
+                shutil.copy2(src, dst)
+
+    patch_project_name(project_path, meta.get("project_name"), project_name)
+
+
+def patch_project_name(project_path: Path, old_name: Optional[str], new_name: str) -> None:
+    """Rename the root package in package.json / package-lock.json"""
+    if not old_name or old_name == new_name:
+        return
+    for filename in NAME_FILES:
+        path = project_path / filename
+        if not path.is_file():
+            continue
+        data = json.loads(path.read_text(encoding="utf-8"))
+        if data.get("name") == old_name:
+            data["name"] = new_name
+        # package-lock.json repeats the name for the root package
+        root_pkg = data.get("packages", {}).get("")
+        if isinstance(root_pkg, dict) and root_pkg.get("name") == old_name:
+            root_pkg["name"] = new_name
+        path.write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
+
+
+def list_snapshots():
+    """Yield (key, meta) for every complete snapshot in the cache"""
+    for path in sorted(snapshot_root().iterdir()):
+        try:
+            yield path.name, json.loads((path / META_FILE).read_text())
+        except (OSError, ValueError):
+            continue
+
+
+def clear_snapshots() -> int:
+    """Delete every cached snapshot; returns how many were removed"""
+    removed = 0
+    for path in snapshot_root().iterdir():
+        shutil.rmtree(path, ignore_errors=True)
+        removed += 1
+    return removed
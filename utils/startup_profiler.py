@@ -0,0 +1,145 @@
+# utils/startup_profiler.py
+"""
+Import-time profiler for SHNK startup.
+
+Works like ``python -X importtime`` but runs in-process (so it also works
+in the frozen PyInstaller build) and aggregates self time per SHNK
+subsystem. Run it with ``python main.py --profile-startup``.
+"""
+
+import sys
+import time
+
+# Top-level modules that belong to SHNK itself, reported by name
+SHNK_SUBSYSTEMS = ("main", "cli", "banner", "commands", "terminal", "utils", "templates")
+
+# Default budget for time to first prompt, in milliseconds
+DEFAULT_MAX_STARTUP_MS = 250.0
+
+
+class _TimedLoader:
+    """Loader proxy that times ``exec_module`` for a single module"""
+
+    def __init__(self, loader, profiler, name):
+        self._loader = loader
+        self._profiler = profiler
+        self._name = name
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        self._profiler._enter(self._name)
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._profiler._exit(self._name)
+
+    def __getattr__(self, attr):
+        return getattr(self._loader, attr)
+
+
+class ImportProfiler:
+    """Meta path finder that records cumulative and self import time per module"""
+
+    def __init__(self):
+        self.records = {}  # module name -> [self_seconds, cumulative_seconds]
+        self._stack = []   # [name, start, child_seconds]
+
+    def find_spec(self, fullname, path=None, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is None:
+                continue
+            if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                spec.loader = _TimedLoader(spec.loader, self, fullname)
+            return spec
+        return None
+
+    def _enter(self, name):
+        self._stack.append([name, time.perf_counter(), 0.0])
+
+    def _exit(self, name):
+        _, start, children = self._stack.pop()
+        cumulative = time.perf_counter() - start
+        self.records[name] = [cumulative - children, cumulative]
+        if self._stack:
+            self._stack[-1][2] += cumulative
+
+    def install(self):
+        sys.meta_path.insert(0, self)
+
+    def uninstall(self):
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+
+    def by_subsystem(self):
+        """Sum self time per subsystem, returned as {subsystem: seconds}"""
+        totals = {}
+        for name, (self_time, _) in self.records.items():
+            group = subsystem_of(name)
+            totals[group] = totals.get(group, 0.0) + self_time
+        return totals
+
+
+def subsystem_of(module_name: str) -> str:
+    """Map a module name onto the subsystem it is reported under"""
+    top = module_name.split(".", 1)[0]
+    if top in SHNK_SUBSYSTEMS:
+        return top
+    if top == "rich":
+        return "rich"
+    stdlib = getattr(sys, "stdlib_module_names", ())
+    if top in stdlib or top.startswith("_"):
+        return "stdlib"
+    return "third-party"
+
+
+def _parse_max_ms(argv):
+    """Read ``--max-startup-ms N`` from argv, falling back to the default"""
+    for i, arg in enumerate(argv):
+        if arg.startswith("--max-startup-ms="):
+            return float(arg.split("=", 1)[1])
+        if arg == "--max-startup-ms" and i + 1 < len(argv):
+            return float(argv[i + 1])
+    return DEFAULT_MAX_STARTUP_MS
+
+
+def profile_startup(argv=None, top: int = 15) -> int:
+    """Measure time to the first menu prompt and print an import breakdown.
+
+    Returns a non-zero exit code when startup exceeds ``--max-startup-ms``,
+    so the check can gate CI.
+    """
+    argv = list(argv or [])
+    max_ms = _parse_max_ms(argv)
+
+    profiler = ImportProfiler()
+    profiler.install()
+    start = time.perf_counter()
+    try:
+        from main import SHNKTerminal, load_menu_modules
+        SHNKTerminal()
+        load_menu_modules()
+    finally:
+        total_ms = (time.perf_counter() - start) * 1000
+        profiler.uninstall()
+
+    out = sys.stdout
+    out.write(f"SHNK startup profile (time to first prompt: {total_ms:.1f} ms)\n\n")
+    out.write(f"{'subsystem':<14}{'self ms':>10}\n")
+    for group, seconds in sorted(profiler.by_subsystem().items(), key=lambda kv: -kv[1]):
+        out.write(f"{group:<14}{seconds * 1000:>10.2f}\n")
+
+    out.write(f"\n{'module':<40}{'self ms':>10}{'cumul ms':>10}\n")
+    slowest = sorted(profiler.records.items(), key=lambda kv: -kv[1][0])[:top]
+    for name, (self_time, cumulative) in slowest:
+        out.write(f"{name:<40}{self_time * 1000:>10.2f}{cumulative * 1000:>10.2f}\n")
+
+    if total_ms > max_ms:
+        out.write(f"\nFAIL: startup took {total_ms:.1f} ms (budget {max_ms:.0f} ms)\n")
+        return 1
+    out.write(f"\nOK: within {max_ms:.0f} ms budget\n")
+    return 0
@@ -0,0 +1,180 @@
+# utils/tracing.py
+"""
+Lightweight tracing spans with Chrome trace-event export.
+
+    with span("install", cat="step", packages=3) as s:
+        ...
+        s.set(returncode=0)
+
+Spans nest through a context variable; ``propagate(fn)`` carries the
+current span into thread-pool workers. Nothing is recorded until
+``enable()`` is called (``--trace out.json``): until then ``span()`` returns
+a shared no-op object, so instrumented code pays one global lookup.
+
+``write(path)`` saves the spans in Chrome's trace-event JSON format, which
+Perfetto (ui.perfetto.dev) and chrome://tracing load directly.
+"""
+
+import contextvars
+import functools
+import json
+import os
+import threading
+import time
+from itertools import count
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+_current: contextvars.ContextVar = contextvars.ContextVar("shnk_span", default=None)
+_tracer: Optional["Tracer"] = None
+
+
+class _NoopSpan:
+    """Returned by ``span()`` while tracing is off"""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def set(self, **attrs) -> None:
+        pass
+
+
+_NOOP = _NoopSpan()
+
+
+class Span:
+    """One timed operation; records itself with the tracer when it ends"""
+
+    __slots__ = ("tracer", "name", "cat", "attrs", "id", "parent", "start", "end", "tid", "_token")
+
+    def __init__(self, tracer: "Tracer", name: str, cat: str, attrs: Dict[str, Any]):
+        self.tracer = tracer
+        self.name = name
+        self.cat = cat
+        self.attrs = attrs
+        self.id = next(tracer.ids)
+        self.parent: Optional[int] = None
+        self.start = self.end = 0
+        self.tid = 0
+        self._token = None
+
+    def set(self, **attrs) -> None:
+        self.attrs.update(attrs)
+
+    def __enter__(self):
+        parent = _current.get()
+        self.parent = parent.id if parent is not None else None
+        self.tid = threading.get_native_id()
+        self._token = _current.set(self)
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.end = time.perf_counter_ns()
+        _current.reset(self._token)
+        if exc_type is not None:
+            self.attrs["error"] = f"{exc_type.__name__}: {exc}"
+        self.tracer.record(self)
+        return False
+
+
+class Tracer:
+    """Collects finished spans for one run"""
+
+    def __init__(self):
+        self.epoch = time.perf_counter_ns()
+        self.ids = count(1)
+        self.spans: List[Span] = []
+        self.threads: Dict[int, str] = {}
+        self._lock = threading.Lock()
+
+    def record(self, span: Span) -> None:
+        with self._lock:
+            self.spans.append(span)
+            self.threads.setdefault(span.tid, threading.current_thread().name)
+
+    def events(self) -> List[Dict[str, Any]]:
+        """Chrome trace events: one complete ("X") event per span plus thread names"""
+        pid = os.getpid()
+        events = [{"name": "process_name", "ph": "M", "pid": pid, "tid": 0, "args": {"name": "shnk"}}]
+        with self._lock:
+            spans = sorted(self.spans, key=lambda s: s.start)
+            threads = dict(self.threads)
+        for tid, name in threads.items():
+            events.append({"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": name}})
+        for s in spans:
+            args = {key: value if isinstance(value, (str, int, float, bool, type(None))) else str(value)
+                    for key, value in s.attrs.items()}
+            args["span_id"] = s.id
+            if s.parent is not None:
+                args["parent_id"] = s.parent
+            events.append({
+                "name": s.name, "cat": s.cat, "ph": "X", "pid": pid, "tid": s.tid,
+                "ts": (s.start - self.epoch) / 1000, "dur": (s.end - s.start) / 1000, "args": args,
+            })
+        return events
+
+    def write(self, path: Path) -> Path:
+        path = Path(path)
+        if path.parent != Path(""):
+            path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({"traceEvents": self.events(), "displayTimeUnit": "ms"}),
+                        encoding="utf-8")
+        return path
+
+
+def enable() -> Tracer:
+    """Start recording spans (idempotent); returns the active tracer"""
+    global _tracer
+    if _tracer is None:
+        _tracer = Tracer()
+    return _tracer
+
+
+def disable() -> Optional[Tracer]:
+    """Stop recording and return the tracer that was active, if any"""
+    global _tracer
+    tracer, _tracer = _tracer, None
+    return tracer
+
+
+def enabled() -> bool:
+    return _tracer is not None
+
+
+def span(name: str, cat: str = "shnk", **attrs):
+    """A span context manager, or a shared no-op while tracing is disabled"""
+    tracer = _tracer
+    if tracer is None:
+        return _NOOP
+    return Span(tracer, name, cat, attrs)
+
+
+def traced(name: str, cat: str = "shnk"):
+    """Decorator wrapping every call of a function in a span"""
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if _tracer is None:
+                return fn(*args, **kwargs)
+            with span(name, cat):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def propagate(fn: Callable) -> Callable:
+    """Bind ``fn`` to the current span so work submitted to a thread pool nests under it"""
+    if _tracer is None:
+        return fn
+    return functools.partial(contextvars.copy_context().run, fn)
+
+
+def write(path: Path) -> Optional[Path]:
+    """Write the active tracer's spans to ``path`` in Chrome trace format"""
+    return _tracer.write(path) if _tracer is not None else None